@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Protocol
+
+# Number of lines buffered in memory before they're compressed and written out
+WRITE_CHUNK = 1_000
+
+
+class ArchiveSink(Protocol):
+    async def write(self, rows: AsyncIterator[Any]) -> int:
+        """Consume rows of serialized jobs, returning how many were archived.
+
+        The prune transaction only commits after this returns, and raising rolls it back.
+        """
+        ...
+
+
+class JsonlArchive:
+    """Archives pruned jobs into gzip compressed JSON Lines files in a local directory.
+
+    Every batch is written to a new file, named by the time it was written. Rows are streamed from
+    the database and written in chunks, so memory stays bounded regardless of batch size. Files
+    are written under a temporary name, synced to disk, then renamed before the delete commits.
+    If the commit fails after that the jobs remain in the table and are archived again, so a job
+    may appear in more than one file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    async def write(self, rows: AsyncIterator[Any]) -> int:
+        os.makedirs(self._path, exist_ok=True)
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        final_path = os.path.join(self._path, f"oban_jobs-{stamp}.jsonl.gz")
+        temp_path = f"{final_path}.tmp"
+
+        count = 0
+        chunk = []
+        file = await asyncio.to_thread(open, temp_path, "wb")
+
+        try:
+            with gzip.GzipFile(fileobj=file, mode="wb") as gz_file:
+                async for (line,) in rows:
+                    chunk.append(f"{line}\n".encode("utf-8"))
+                    count += 1
+
+                    if len(chunk) >= WRITE_CHUNK:
+                        await asyncio.to_thread(gz_file.writelines, chunk)
+                        chunk = []
+
+                await asyncio.to_thread(gz_file.writelines, chunk)
+
+            await asyncio.to_thread(_sync_and_close, file)
+        except BaseException:
+            file.close()
+            os.unlink(temp_path)
+            raise
+
+        if count == 0:
+            os.unlink(temp_path)
+        else:
+            os.replace(temp_path, final_path)
+
+        return count
+
+
+def _sync_and_close(file: Any) -> None:
+    file.flush()
+    os.fsync(file.fileno())
+    file.close()
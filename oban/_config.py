@@ -24,7 +24,8 @@ class Config:
     name: str | None = None
     node: str | None = None
     prefix: str | None = None
-    leadership: bool | None = None
+    leadership: dict[str, Any] | bool | None = None
+    notifier: str | None = None
 
     # Core loop configurations
     lifeline: dict[str, Any] | None = None
@@ -67,6 +68,7 @@ class Config:
         - OBAN_QUEUES: Comma-separated queue:limit pairs (e.g., "default:10,mailers:5")
         - OBAN_PREFIX: Schema prefix
         - OBAN_NODE: Node identifier
+        - OBAN_NOTIFIER: Notifier type, "postgres", "polling", "memory", or "hybrid"
         - OBAN_POOL_MIN_SIZE: Minimum connection pool size
         - OBAN_POOL_MAX_SIZE: Maximum connection pool size
         - OBAN_POOL_TIMEOUT: Seconds to wait for a connection from the pool
@@ -82,6 +84,8 @@ class Config:
             params["queues"] = cls._parse_queues(value)
         if (value := os.getenv("OBAN_NODE")) is not None:
             params["node"] = value
+        if (value := os.getenv("OBAN_NOTIFIER")) is not None:
+            params["notifier"] = value
         if (value := os.getenv("OBAN_PREFIX")) is not None:
             params["prefix"] = value
         if (value := os.getenv("OBAN_POOL_MIN_SIZE")) is not None:
@@ -200,6 +204,7 @@ class Config:
                 "lifeline",
                 "metrics",
                 "node",
+                "notifier",
                 "pruner",
                 "refresher",
                 "scheduler",
@@ -4,6 +4,8 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
+from psycopg import AsyncConnection
+
 from . import telemetry
 from ._looper import Looper
 
@@ -13,16 +15,31 @@ if TYPE_CHECKING:
     from ._notifier import Notifier
     from ._query import Query
 
+MODES = ("table", "advisory")
+
 
 class Leader(Looper):
     """Manages leadership election and coordination across Oban nodes.
 
+    Leadership is decided in one of two modes:
+
+    - table: Nodes elect and re-elect a leader through the `oban_leaders` table, with an entry
+      that expires unless the leader refreshes it every half interval. This is the default.
+    - advisory: Each node holds a dedicated connection and the leader keeps a session-level
+      advisory lock on it. There are no table writes in steady state. Waiting nodes block on the
+      lock, so they take over as soon as the leader's session ends, and a leader that loses its
+      connection stops leading the moment it notices.
+
     This class is managed internally by Oban and shouldn't be constructed directly.
     Instead, check leadership status via the Oban.is_leader property:
 
         >>> async with Oban(pool=pool, queues={"default": 10}) as oban:
         ...     if oban.is_leader:
         ...         # Perform leader-only operations
+
+    Advisory leadership is configured with a dict:
+
+        >>> Oban(pool=pool, queues={"default": 10}, leadership={"mode": "advisory"})
     """
 
     def __init__(
@@ -30,6 +47,7 @@ class Leader(Looper):
         *,
         enabled: bool = True,
         interval: float = 30.0,
+        mode: str = "table",
         name: str = "Oban",
         node: str,
         notifier: Notifier,
@@ -37,25 +55,30 @@ class Leader(Looper):
     ) -> None:
         self._enabled = enabled
         self._interval = interval
+        self._mode = mode
         self._name = name
         self._node = node
         self._notifier = notifier
         self._query = query
 
         self._is_leader = False
+        self._lock_conn = None
         self._listen_token = None
         self._loop_task = None
         self._started = asyncio.Event()
 
-        self._validate(interval=interval)
+        self._validate(interval=interval, mode=mode)
 
     @staticmethod
-    def _validate(*, interval: float) -> None:
+    def _validate(*, interval: float, mode: str = "table") -> None:
         if not isinstance(interval, (int, float)):
             raise TypeError(f"interval must be a number, got {interval}")
         if interval <= 0:
             raise ValueError(f"interval must be positive, got {interval}")
 
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode}")
+
     @property
     def is_leader(self) -> bool:
         return self._is_leader
@@ -65,9 +88,12 @@ class Leader(Looper):
             self._started.set()
             return
 
-        self._listen_token = await self._notifier.listen(
-            "leader", self._on_notification, wait=True, timeout=5.0
-        )
+        # Waiting on the advisory lock already wakes nodes when the leader's session ends
+        if self._mode == "table":
+            self._listen_token = await self._notifier.listen(
+                "leader", self._on_notification, wait=True, timeout=5.0
+            )
+
         self._loop_task = asyncio.create_task(self._loop(), name="oban-leader")
 
         await self._started.wait()
@@ -84,11 +110,18 @@ class Leader(Looper):
             except asyncio.CancelledError:
                 pass
 
+        if self._mode == "advisory":
+            # Closing the session releases the lock and wakes the waiting nodes
+            await self._close_lock_conn()
+
+            self._is_leader = False
+
         if self._is_leader:
             payload = {"action": "resign", "node": self._node, "name": self._name}
 
-            await self._notifier.notify("leader", payload)
+            # Resign before notifying so peers don't race to an election against the old record
             await self._query.resign_leader(self._name, self._node)
+            await self._notifier.notify("leader", payload)
 
     async def _loop(self) -> None:
         while True:
@@ -98,10 +131,28 @@ class Leader(Looper):
                 break
             except Exception:
                 logger.exception("Error in leader")
+
+                if self._mode == "advisory":
+                    self._is_leader = False
+
+                    await self._close_lock_conn()
             finally:
                 if not self._started.is_set():
                     self._started.set()
 
+            if self._mode == "advisory" and not self._is_leader:
+                try:
+                    await self._await_lock()
+                except asyncio.CancelledError:
+                    break
+                except Exception:
+                    logger.exception("Error in leader")
+
+                    await self._close_lock_conn()
+                    await asyncio.sleep(self._interval)
+
+                continue
+
             # Sleep for half interval if leader (to boost their refresh interval and allow them to
             # retain leadership), full interval otherwise
             sleep_duration = self._interval / 2 if self._is_leader else self._interval
@@ -109,14 +160,64 @@ class Leader(Looper):
             await asyncio.sleep(sleep_duration)
 
     async def _election(self) -> None:
-        meta = {"leader": self._is_leader}
+        meta = {"leader": self._is_leader, "mode": self._mode}
 
         with telemetry.span("oban.leader.election", meta) as context:
-            self._is_leader = await self._query.attempt_leadership(
-                self._name, self._node, int(self._interval), self._is_leader
-            )
+            if self._mode == "advisory":
+                self._is_leader = await self._advisory_election()
+            else:
+                self._is_leader = await self._query.attempt_leadership(
+                    self._name, self._node, int(self._interval), self._is_leader
+                )
 
             context.add({"leader": self._is_leader})
 
+    async def _advisory_election(self) -> bool:
+        # The lock lives as long as the session, so a leader only has to confirm it's still
+        # connected. Errors propagate and drop leadership along with the connection.
+        if self._is_leader:
+            if self._lock_conn is None or self._lock_conn.closed:
+                return False
+
+            await self._lock_conn.execute("SELECT 1")
+
+            return True
+
+        conn = await self._open_lock_conn()
+
+        return await self._query.acquire_advisory_leadership(conn, self._name)
+
+    async def _await_lock(self) -> None:
+        conn = await self._open_lock_conn()
+
+        # Time out periodically so a silently dropped connection is replaced
+        try:
+            await asyncio.wait_for(
+                self._query.acquire_advisory_leadership(conn, self._name, wait=True),
+                timeout=self._interval,
+            )
+
+            self._is_leader = True
+        except asyncio.TimeoutError:
+            pass
+
+    async def _open_lock_conn(self) -> AsyncConnection:
+        if self._lock_conn is None or self._lock_conn.closed:
+            self._lock_conn = await AsyncConnection.connect(
+                self._query.dsn, autocommit=True
+            )
+
+        return self._lock_conn
+
+    async def _close_lock_conn(self) -> None:
+        if self._lock_conn is not None:
+            try:
+                await self._lock_conn.close()
+            except Exception:  # noqa: S110
+                # The session is gone either way, and with it the lock.
+                pass
+
+            self._lock_conn = None
+
     async def _on_notification(self, _channel: str, _payload: dict) -> None:
         await self._election()
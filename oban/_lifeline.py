@@ -10,19 +10,67 @@ from ._looper import Looper
 
 logger = logging.getLogger(__name__)
 
+# Number of heartbeats a job may miss before it's rescued
+MISSED_HEARTBEATS = 3
+
 if TYPE_CHECKING:
     from ._leader import Leader
     from ._query import Query
 
 
-async def _rescue(query: Query, rescue_after: float) -> None:
-    with telemetry.span("oban.lifeline.rescue", {}) as context:
-        rescued = await query.rescue_jobs(rescue_after)
+async def _rescue_batch(
+    query: Query,
+    rescue_after: float,
+    *,
+    limit: int,
+    batch: int,
+    heartbeat_after: float | None = None,
+    producer_max_age: float = 60.0,
+) -> int:
+    with telemetry.span("oban.lifeline.rescue", {"batch": batch}) as context:
+        rescued = await query.rescue_jobs(
+            rescue_after, limit, heartbeat_after, producer_max_age
+        )
 
         context.add({"rescued_count": rescued})
 
+    return rescued
+
 
 class Lifeline(Looper):
+    """Rescues orphaned jobs stuck in the executing state.
+
+    A job is orphaned once the producer that fetched it, recorded in `attempted_by`, is no longer
+    in the producers table. The refresher removes producers that stop refreshing, and wakes the
+    lifeline when it does, so orphans from a crashed node are rescued within seconds of their
+    producer expiring. Jobs that are still held by a live producer are never rescued, however
+    long they run.
+
+    Producers that never register, such as Oban nodes in other languages sharing the table, look
+    the same as expired ones. So a missing producer only orphans a job that has heartbeats or
+    has been executing for longer than `producer_max_age`, the refresher's `max_age`. Any other
+    job without a live producer is rescued once it's been executing for `rescue_after` seconds.
+
+    With a `heartbeat_interval`, producers record a heartbeat for all of their running jobs in a
+    single statement on that interval. Jobs that miss several heartbeats in a row are rescued
+    even when their producer still appears alive, e.g. when the job was lost by the producer.
+
+    Jobs are rescued in batches of up to `limit`, one after another until none are left, so a
+    large node loss doesn't lock and rewrite every orphan in a single statement. Each batch
+    emits its own `oban.lifeline.rescue` span. Extensions may replace the whole pass with
+    `lifeline.rescue`, or a single batch with `lifeline.rescue_batch`.
+
+    This class is managed internally by Oban and shouldn't be constructed directly.
+    Instead, configure the lifeline via the Oban constructor:
+
+        >>> async with Oban(
+        ...     conn=conn,
+        ...     queues={"default": 10},
+        ...     lifeline={"interval": 60.0, "rescue_after": 300.0}
+        ... ) as oban:
+        ...     # Lifeline runs automatically in the background
+    """
+
     def __init__(
         self,
         *,
@@ -30,18 +78,36 @@ class Lifeline(Looper):
         leader: Leader,
         interval: float = 60.0,
         rescue_after: float = 300.0,
+        limit: int = 5_000,
+        heartbeat_interval: float | None = None,
+        producer_max_age: float = 60.0,
     ) -> None:
         self._leader = leader
+        self._heartbeat_interval = heartbeat_interval
         self._interval = interval
         self._rescue_after = rescue_after
+        self._limit = limit
+        self._producer_max_age = producer_max_age
         self._query = query
 
         self._loop_task = None
+        self._wakeup = asyncio.Event()
 
-        self._validate(interval=interval, rescue_after=rescue_after)
+        self._validate(
+            interval=interval,
+            rescue_after=rescue_after,
+            limit=limit,
+            heartbeat_interval=heartbeat_interval,
+        )
 
     @staticmethod
-    def _validate(*, interval: float, rescue_after: float) -> None:
+    def _validate(
+        *,
+        interval: float,
+        rescue_after: float,
+        limit: int = 5_000,
+        heartbeat_interval: float | None = None,
+    ) -> None:
         if not isinstance(interval, (int, float)):
             raise TypeError(f"interval must be a number, got {interval}")
         if interval <= 0:
@@ -51,6 +117,21 @@ class Lifeline(Looper):
         if rescue_after <= 0:
             raise ValueError(f"rescue_after must be positive, got {rescue_after}")
 
+        if not isinstance(limit, int):
+            raise TypeError(f"limit must be an integer, got {limit}")
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+        if heartbeat_interval is not None:
+            if not isinstance(heartbeat_interval, (int, float)):
+                raise TypeError(
+                    f"heartbeat_interval must be a number, got {heartbeat_interval}"
+                )
+            if heartbeat_interval <= 0:
+                raise ValueError(
+                    f"heartbeat_interval must be positive, got {heartbeat_interval}"
+                )
+
     async def start(self) -> None:
         self._loop_task = asyncio.create_task(self._loop(), name="oban-lifeline")
 
@@ -66,7 +147,7 @@ class Lifeline(Looper):
     async def _loop(self) -> None:
         while True:
             try:
-                await asyncio.sleep(self._interval)
+                await self._wait()
 
                 await self._rescue()
             except asyncio.CancelledError:
@@ -74,8 +155,48 @@ class Lifeline(Looper):
             except Exception:
                 logger.exception("Error in lifeline")
 
+    def notify(self) -> None:
+        """Wake the lifeline to rescue orphans without waiting for the next interval."""
+        self._wakeup.set()
+
+    async def _wait(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+        except asyncio.TimeoutError:
+            pass
+
+        self._wakeup.clear()
+
     async def _rescue(self) -> None:
         if not self._leader.is_leader:
             return
 
-        await use_ext("lifeline.rescue", _rescue, self._query, self._rescue_after)
+        await use_ext(
+            "lifeline.rescue", self._rescue_all, self._query, self._rescue_after
+        )
+
+    async def _rescue_all(self, query: Query, rescue_after: float) -> None:
+        batch = 0
+
+        if self._heartbeat_interval is None:
+            heartbeat_after = None
+        else:
+            heartbeat_after = self._heartbeat_interval * MISSED_HEARTBEATS
+
+        while self._leader.is_leader:
+            rescued = await use_ext(
+                "lifeline.rescue_batch",
+                _rescue_batch,
+                query,
+                rescue_after,
+                limit=self._limit,
+                batch=batch,
+                heartbeat_after=heartbeat_after,
+                producer_max_age=self._producer_max_age,
+            )
+
+            # Extensions that don't report a count are treated as having rescued everything
+            if rescued is None or rescued < self._limit:
+                break
+
+            batch += 1
@@ -3,10 +3,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+import threading
 import time
-from collections import defaultdict
-from threading import Lock
-from typing import TYPE_CHECKING, Any
+from array import array
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any, Iterable
 
 from . import telemetry
 from ._looper import Looper
@@ -43,19 +44,116 @@ def _compute_bin(value: int) -> int:
 
 
 def _build_sketch(values: list[int]) -> dict[str, Any]:
-    bins = defaultdict(int)
+    sketch = Sketch()
+    sketch.add_many(values)
 
-    for value in values:
-        clamped = max(1, abs(value))
-        bins[_compute_bin(clamped)] += 1
+    return sketch.to_dict()
 
-    return {"data": dict(bins.items()), "size": len(values)}
+
+class Sketch:
+    """A DDSketch that bins values as they're added.
+
+    Values are clamped to at least 1, so bins are never negative and are stored in an array
+    indexed by bin. Memory grows with the number of distinct bins, a few hundred at most for
+    realistic durations, rather than with the number of values. Sketches with the same error
+    rate are merged by adding their bins together, regardless of where they were built.
+    """
+
+    __slots__ = ("_bins", "_size")
+
+    def __init__(self) -> None:
+        self._bins = array("q")
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, value: int) -> None:
+        index = _compute_bin(max(1, abs(value)))
+
+        if index >= len(self._bins):
+            self._grow(index)
+
+        self._bins[index] += 1
+        self._size += 1
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """Bin many values at once, computing bins in bulk and bumping each bin once."""
+        clamped = [max(1, abs(value)) for value in values]
+        counts = Counter(
+            math.ceil(log * INV_LOG_GAMMA) for log in map(math.log, clamped)
+        )
+
+        self._add_counts(counts.items(), len(clamped))
+
+    def merge(self, other: Sketch) -> None:
+        self._add_counts(enumerate(other._bins), other._size)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {index: count for index, count in enumerate(self._bins) if count}
+
+        return {"data": data, "size": self._size}
+
+    def _add_counts(self, counts: Iterable[tuple[int, int]], size: int) -> None:
+        for index, count in counts:
+            if count:
+                if index >= len(self._bins):
+                    self._grow(index)
+
+                self._bins[index] += count
+
+        self._size += size
+
+    def _grow(self, index: int) -> None:
+        self._bins.frombytes(bytes(8 * (index + 1 - len(self._bins))))
+
+
+class _JobStats:
+    __slots__ = ("exec_time", "wait_time", "count")
+
+    def __init__(self) -> None:
+        self.exec_time = Sketch()
+        self.wait_time = Sketch()
+        self.count = 0
+
+    def merge(self, other: _JobStats) -> None:
+        self.exec_time.merge(other.exec_time)
+        self.wait_time.merge(other.wait_time)
+        self.count += other.count
+
+
+class _Shard:
+    """Job stats buffered by a single thread.
+
+    Only the owning thread records into a shard, so its lock is uncontended apart from the
+    moment a broadcast swaps out the buffer.
+    """
+
+    __slots__ = ("buffer", "lock", "thread")
+
+    def __init__(self) -> None:
+        self.buffer = defaultdict(_JobStats)
+        self.lock = threading.Lock()
+        self.thread = threading.current_thread()
+
+    def swap(self) -> dict[tuple[str, str, str], _JobStats]:
+        with self.lock:
+            buffer = self.buffer
+            self.buffer = defaultdict(_JobStats)
+
+        return buffer
 
 
 ALL_STATES = list(JobState)
 
 
 class Metrics(Looper):
+    """Broadcasts queue checks, job metrics, and job counts for Oban Web.
+
+    Job metrics are buffered in a shard per thread that finishes jobs, so recording an event
+    never waits on other threads. Broadcasts swap out each shard's buffer and merge them.
+    """
+
     def __init__(
         self,
         *,
@@ -81,8 +179,9 @@ class Metrics(Looper):
         self._estimate_limit = estimate_limit
         self._interval = interval
 
-        self._buffer = defaultdict(list)
-        self._buffer_lock = Lock()
+        self._local = threading.local()
+        self._shards = []
+        self._shards_lock = threading.Lock()
         self._counts = []
         self._cronitor_counter = 0
         self._previous_counts = {}
@@ -133,19 +232,41 @@ class Metrics(Looper):
             await self._broadcast_crontab()
             self._cronitor_counter = 0
 
+    def _shard(self) -> _Shard:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = _Shard()
+
+            with self._shards_lock:
+                self._shards.append(shard)
+
+            return shard
+
     def _handle_job_event(self, _name: str, meta: dict[str, Any]) -> None:
         job = meta["job"]
-        state = meta["state"]
-        queue = job.queue
-        worker = job.worker
+        shard = self._shard()
 
-        exec_time = meta["duration"]
-        wait_time = meta["queue_time"]
+        with shard.lock:
+            stats = shard.buffer[(meta["state"], job.queue, job.worker)]
+            stats.exec_time.add(meta["duration"])
+            stats.wait_time.add(meta["queue_time"])
+            stats.count += 1
 
-        with self._buffer_lock:
-            self._buffer[("exec_time", state, queue, worker)].append(exec_time)
-            self._buffer[("wait_time", state, queue, worker)].append(wait_time)
-            self._buffer[("exec_count", state, queue, worker)].append(1)
+    def _drain_shards(self) -> dict[tuple[str, str, str], _JobStats]:
+        # Shards of threads that have exited can't receive more events, so they're drained a
+        # final time and dropped
+        with self._shards_lock:
+            shards = self._shards
+            self._shards = [shard for shard in shards if shard.thread.is_alive()]
+
+        merged = defaultdict(_JobStats)
+
+        for shard in shards:
+            for key, stats in shard.swap().items():
+                merged[key].merge(stats)
+
+        return merged
 
     async def _gather_counts(self) -> None:
         if not self._counts_enabled or not self._leader.is_leader:
@@ -186,32 +307,37 @@ class Metrics(Looper):
             await self._notifier.notify("gossip", {"checks": checks})
 
     async def _broadcast_metrics(self) -> None:
-        with self._buffer_lock:
-            buffer = self._buffer
-            counts = self._counts
+        buffer = self._drain_shards()
+        counts = self._counts
 
-            self._buffer = defaultdict(list)
-            self._counts = []
+        self._counts = []
 
         if not buffer and not counts:
             return
 
         metrics = []
 
-        for (series, state, queue, worker), values in buffer.items():
-            if series == "exec_count":
-                value = _build_gauge(values)
-            else:
-                value = _build_sketch(values)
-
-            metrics.append(
-                {
-                    "series": series,
-                    "state": state,
-                    "queue": queue,
-                    "worker": worker,
-                    "value": value,
-                }
+        for (state, queue, worker), stats in buffer.items():
+            labels = {"state": state, "queue": queue, "worker": worker}
+
+            metrics.extend(
+                [
+                    {
+                        "series": "exec_time",
+                        **labels,
+                        "value": stats.exec_time.to_dict(),
+                    },
+                    {
+                        "series": "wait_time",
+                        **labels,
+                        "value": stats.wait_time.to_dict(),
+                    },
+                    {
+                        "series": "exec_count",
+                        **labels,
+                        "value": _build_gauge([stats.count]),
+                    },
+                ]
             )
 
         for state, queue, count in counts:
@@ -6,12 +6,20 @@ import gzip
 import inspect
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Callable, Protocol, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Protocol,
+    runtime_checkable,
+)
 from uuid import uuid4
 
 import orjson
 from psycopg import AsyncConnection, InterfaceError, OperationalError
 
+from . import telemetry
 from ._backoff import jittery_exponential
 
 logger = logging.getLogger(__name__)
@@ -20,21 +28,80 @@ if TYPE_CHECKING:
     from ._query import Query
 
 
+# Payloads below this many bytes of JSON are sent as-is. Compressing them costs more CPU than it
+# saves, and the gzip header and base64 expansion make small payloads larger rather than smaller.
+COMPRESS_THRESHOLD = 1024
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more. Only encoded payloads that would be
+# rejected are chunked, into pieces of `CHUNK_SIZE` that leave room for the chunk envelope.
+NOTIFY_LIMIT = 8_000
+CHUNK_SIZE = 7_000
+CHUNK_KEY = "oban_chunk"
+CHUNK_PREFIX = f'{{"{CHUNK_KEY}":'
+
+# Notifications published by a `HybridNotifier` carry its nonce under this key, so it can skip
+# its own echoes without mistaking identical notifications from other nodes for them.
+SENDER_KEY = "oban_sender"
+
+
 def encode_payload(payload: dict) -> str:
     """Encode a dict payload to an efficient format for publishing.
 
+    Small payloads are left as plain JSON, while larger ones are compressed with the fastest gzip
+    level, which keeps them compatible with other Oban notifiers.
+
     Args:
         payload: Dict to encode
 
     Returns:
-        Base64-encoded gzipped JSON string
+        JSON string, or base64-encoded gzipped JSON string for larger payloads
     """
     dumped = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
-    zipped = gzip.compress(dumped)
+
+    if len(dumped) < COMPRESS_THRESHOLD:
+        return dumped.decode("utf-8")
+
+    zipped = gzip.compress(dumped, compresslevel=1, mtime=0)
 
     return base64.b64encode(zipped).decode("ascii")
 
 
+def chunk_payload(payload: str) -> list[str]:
+    """Split an encoded payload into chunks that fit within the NOTIFY payload limit.
+
+    Payloads that already fit are returned unchanged. Larger payloads are always compressed, so
+    their base64 text is sliced into pieces and wrapped with a message id, sequence number, and
+    total count for reassembly by the receiving notifier.
+
+    Chunked messages can only be reassembled by Python nodes. Elixir Oban and Oban Web don't
+    understand the envelope, but those payloads would otherwise be rejected by Postgres outright.
+
+    Args:
+        payload: Encoded payload string
+
+    Returns:
+        List of payload strings, each shorter than `NOTIFY_LIMIT`
+    """
+    if len(payload) < NOTIFY_LIMIT:
+        return [payload]
+
+    message_id = uuid4().hex
+    pieces = [
+        payload[index : index + CHUNK_SIZE]
+        for index in range(0, len(payload), CHUNK_SIZE)
+    ]
+
+    return [
+        orjson.dumps(
+            {
+                CHUNK_KEY: {"id": message_id, "seq": seq, "total": len(pieces)},
+                "data": piece,
+            }
+        ).decode("utf-8")
+        for (seq, piece) in enumerate(pieces)
+    ]
+
+
 def decode_payload(payload: str) -> dict:
     """Decode a payload string to a dict.
 
@@ -46,7 +113,7 @@ def decode_payload(payload: str) -> dict:
     Returns:
         Decoded dict
     """
-    # Payloads created by SQL queries won't be encoded or compressed.
+    # Small payloads and those created by SQL queries won't be encoded or compressed.
     if payload.startswith("{"):
         return orjson.loads(payload)
     else:
@@ -56,12 +123,236 @@ def decode_payload(payload: str) -> dict:
         return orjson.loads(unzipped.decode("utf-8"))
 
 
+class _Reassembler:
+    """Reassembly of chunked payloads into the original encoded payload.
+
+    Chunks are collected by message id until every sequence number has arrived. Incomplete
+    messages are discarded once `timeout` seconds have passed since their first chunk, e.g. when a
+    chunk was dropped or the sender disconnected part way through.
+    """
+
+    def __init__(self, *, timeout: float = 5.0) -> None:
+        self._timeout = timeout
+        self._partials = {}
+
+    def add(self, payload: str) -> str | None:
+        now = asyncio.get_running_loop().time()
+
+        self._expire(now)
+
+        chunk = orjson.loads(payload)
+        meta = chunk[CHUNK_KEY]
+
+        (_expires_at, parts) = self._partials.setdefault(
+            meta["id"], (now + self._timeout, {})
+        )
+
+        parts[meta["seq"]] = chunk["data"]
+
+        if len(parts) < meta["total"]:
+            return None
+
+        del self._partials[meta["id"]]
+
+        return "".join(parts[seq] for seq in range(meta["total"]))
+
+    def _expire(self, now: float) -> None:
+        expired = [
+            message_id
+            for (message_id, (expires_at, _parts)) in self._partials.items()
+            if expires_at <= now
+        ]
+
+        for message_id in expired:
+            del self._partials[message_id]
+
+            logger.warning("Discarded incomplete chunked notification %s", message_id)
+
+
+class _Dispatcher:
+    """Bounded, coalescing dispatch of notifications to channel subscribers.
+
+    Raw payloads are queued per channel and delivered by a single task for that channel after a
+    short window. Identical payloads already waiting in the queue are coalesced, and new payloads
+    are dropped once the queue holds `max_pending` entries. Each delivery emits an
+    `oban.notifier.dispatch` telemetry event with the queue depth and counts of coalesced and
+    dropped payloads since the previous delivery.
+
+    Chunked payloads are reassembled before they're queued, and incomplete ones are discarded
+    after `chunk_timeout` seconds. Payloads tagged with `sender` are skipped, and the sender tag
+    is removed from everything else before delivery.
+    """
+
+    def __init__(
+        self,
+        subscriptions: dict[str, dict[str, Callable[[str, dict], Any]]],
+        *,
+        max_pending: int = 1000,
+        window: float = 0.005,
+        chunk_timeout: float = 5.0,
+        sender: str | None = None,
+    ) -> None:
+        self._subscriptions = subscriptions
+        self._max_pending = max_pending
+        self._window = window
+        self._sender = sender
+        self._reassembler = _Reassembler(timeout=chunk_timeout)
+
+        self._pending = {}
+        self._coalesced = defaultdict(int)
+        self._dropped = defaultdict(int)
+        self._tasks = {}
+
+    def put(self, channel: str, payload: str) -> None:
+        if channel not in self._subscriptions:
+            return
+
+        if payload.startswith(CHUNK_PREFIX):
+            payload = self._reassembler.add(payload)
+
+            if payload is None:
+                return
+
+        pending = self._pending.setdefault(channel, {})
+
+        if payload in pending:
+            self._coalesced[channel] += 1
+        elif len(pending) >= self._max_pending:
+            self._dropped[channel] += 1
+        else:
+            pending[payload] = None
+
+        if channel not in self._tasks:
+            self._tasks[channel] = asyncio.create_task(
+                self._drain(channel), name=f"oban-notifier-{channel}"
+            )
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _drain(self, channel: str) -> None:
+        try:
+            while self._pending.get(channel):
+                await asyncio.sleep(self._window)
+
+                pending = self._pending.pop(channel)
+
+                telemetry.execute(
+                    "oban.notifier.dispatch",
+                    {
+                        "channel": channel,
+                        "depth": len(pending),
+                        "coalesced": self._coalesced.pop(channel, 0),
+                        "dropped": self._dropped.pop(channel, 0),
+                    },
+                )
+
+                for payload in pending:
+                    decoded = decode_payload(payload)
+                    sender = decoded.pop(SENDER_KEY, None)
+
+                    if sender is None or sender != self._sender:
+                        await self._deliver(channel, decoded)
+        finally:
+            del self._tasks[channel]
+
+    async def _deliver(self, channel: str, payload: dict) -> None:
+        for callback in list(self._subscriptions.get(channel, {}).values()):
+            try:
+                if inspect.iscoroutinefunction(callback):
+                    await callback(channel, payload)
+                else:
+                    callback(channel, payload)
+            except Exception:
+                logger.exception(
+                    "Error in notifier callback for channel %s with payload %s",
+                    channel,
+                    payload,
+                )
+
+
+class _Outbox:
+    """Buffered, batched sending of outgoing notifications.
+
+    Notifications put within `window` seconds of each other are sent together through a single
+    call to `send`, which receives parallel lists of channels and payloads. Calling `flush` sends
+    anything buffered immediately and waits for it to be sent.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[list[str], list[str]], Awaitable[None]],
+        *,
+        window: float = 0.005,
+    ) -> None:
+        self._send = send
+        self._window = window
+
+        self._lock = asyncio.Lock()
+        self._pending = []
+        self._task = None
+
+    def put(self, channel: str, payloads: list[str]) -> None:
+        self._pending.extend((channel, payload) for payload in payloads)
+
+        self._schedule()
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._pending:
+                return
+
+            (pending, self._pending) = (self._pending, [])
+
+            channels = [channel for (channel, _payload) in pending]
+            payloads = [payload for (_channel, payload) in pending]
+
+            await self._send(channels, payloads)
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+        await self.flush()
+
+    def _schedule(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._delayed_flush(), name="oban-notifier-flush"
+            )
+
+    async def _delayed_flush(self) -> None:
+        try:
+            await asyncio.sleep(self._window)
+            await self.flush()
+        except asyncio.CancelledError:
+            self._task = None
+            raise
+        except Exception as error:
+            logger.warning("Notifier failed to send notifications: %s", error)
+
+        self._task = None
+
+        # Anything put while sending missed the flush that was underway, so it needs another
+        if self._pending:
+            self._schedule()
+
+
 @runtime_checkable
 class Notifier(Protocol):
     """Protocol for pub/sub notification systems.
 
     Notifiers enable real-time communication between Oban components using
     channels. The default implementation uses PostgreSQL LISTEN/NOTIFY.
+
+    Notifiers may set `delivers_sql_notifications` to True when notifications sent from SQL with
+    `pg_notify`, such as those for inserted jobs, reach their subscribers. Without it, queues
+    are checked for available jobs on every staging pass instead.
     """
 
     async def start(self) -> None:
@@ -85,7 +376,8 @@ class Notifier(Protocol):
             channel: Channel name to listen on
             callback: Sync or async function called when notification received.
                       Receives (channel, payload) as arguments where payload is a dict.
-                      Async callbacks are executed in the background without blocking.
+                      Async callbacks are executed in the background without blocking the
+                      notifier, one notification at a time per channel.
             wait: If True, blocks until the subscription is fully established and ready to
                   receive notifications. If False, returns immediately after registering.
                   Defaults to True for test reliability.
@@ -117,6 +409,8 @@ class Notifier(Protocol):
     async def notify(self, channel: str, payloads: dict | list[dict]) -> None:
         """Send one or more notifications to a channel.
 
+        Implementations may buffer notifications briefly to send them in batches.
+
         Args:
             channel: Channel name to send notification on
             payloads: Payload dict or list of payload dicts to send
@@ -128,117 +422,140 @@ class Notifier(Protocol):
         ...
 
 
-class PostgresNotifier:
-    """PostgreSQL-based notifier using LISTEN/NOTIFY.
+# Shared LISTEN hubs, keyed by event loop and DSN
+_HUBS: dict[tuple[asyncio.AbstractEventLoop, str], _ListenHub] = {}
+
+
+class _ListenHub:
+    """A single LISTEN connection multiplexed across notifiers for the same database.
 
-    Maintains a dedicated connection for receiving notifications and dispatches
-    them to registered callbacks. Automatically reconnects on connection loss.
+    Notifiers attach to a hub and register the full, prefixed channels they subscribe to. The hub
+    issues one LISTEN per channel no matter how many notifiers want it and routes each
+    notification to every notifier registered for its channel. The connection, its beat, and
+    reconnection are shared, and the hub closes when the last notifier detaches.
     """
 
     def __init__(
         self,
+        dsn: str,
         *,
-        query: Query,
-        prefix: str = "public",
         beat_interval: float = 30.0,
         connect_timeout: float = 5.0,
         notify_timeout: float = 0.1,
     ) -> None:
-        self._query = query
-        self._prefix = prefix
+        self._dsn = dsn
         self._beat_interval = beat_interval
         self._connect_timeout = connect_timeout
         self._notify_timeout = notify_timeout
 
+        self._notifiers = set()
+        self._routes = defaultdict(set)
         self._pending_listen = set()
         self._pending_unlisten = set()
         self._listen_events = {}
-        self._subscriptions = defaultdict(dict)
-        self._tokens = {}
 
         self._conn = None
+        self._connecting = None
+        self._closed = False
         self._loop_task = None
         self._beat_task = None
         self._reconnect_attempts = 0
 
-    def _to_full_channel(self, channel: str) -> str:
-        return f"{self._prefix}.oban_{channel}"
+    @classmethod
+    def acquire(cls, dsn: str, *, shared: bool = True, **opts: Any) -> _ListenHub:
+        """Get the process-wide hub for a DSN, or a private one when `shared` is False.
 
-    def _from_full_channel(self, full_channel: str) -> str:
-        (_prefix, channel) = full_channel.split(".", 1)
+        Options only apply when a new hub is created; later notifiers reuse the first one's.
+        """
+        if not shared:
+            return cls(dsn, **opts)
 
-        return channel[5:]
+        key = (asyncio.get_running_loop(), dsn)
 
-    async def start(self) -> None:
-        await self._connect()
+        if key not in _HUBS:
+            _HUBS[key] = cls(dsn, **opts)
 
-    async def stop(self) -> None:
-        if not self._loop_task or not self._beat_task or not self._conn:
-            return
+        return _HUBS[key]
 
-        self._loop_task.cancel()
-        self._beat_task.cancel()
+    async def attach(self, notifier: PostgresNotifier) -> None:
+        self._notifiers.add(notifier)
 
-        await asyncio.gather(self._loop_task, self._beat_task, return_exceptions=True)
+        if self._connecting is None:
+            self._connecting = asyncio.ensure_future(self._connect())
 
         try:
-            await self._conn.close()
-        except Exception:  # noqa: S110
-            # Best-effort close during teardown; nothing actionable on failure.
-            pass
+            await asyncio.shield(self._connecting)
+        except BaseException:
+            if self._connecting.done():
+                self._connecting = None
 
-    async def listen(
-        self,
-        channel: str,
-        callback: Callable[[str, dict], Any],
-        wait: bool = True,
-        timeout: float | None = None,
-    ) -> str:
-        token = str(uuid4())
+            await self.detach(notifier)
 
-        if channel not in self._subscriptions:
-            self._pending_listen.add(channel)
-            self._listen_events[channel] = asyncio.Event()
+            raise
 
-        self._tokens[token] = channel
-        self._subscriptions[channel][token] = callback
+    async def detach(self, notifier: PostgresNotifier) -> None:
+        self._notifiers.discard(notifier)
 
-        if wait and channel in self._listen_events:
-            await asyncio.wait_for(self._listen_events[channel].wait(), timeout=timeout)
+        for channel, notifiers in list(self._routes.items()):
+            if notifier in notifiers:
+                self.unlisten(channel, notifier)
 
-        return token
+        if not self._notifiers:
+            await self._close()
 
-    async def unlisten(self, token: str) -> None:
-        if token not in self._tokens:
+    def listen(
+        self, full_channel: str, notifier: PostgresNotifier
+    ) -> asyncio.Event | None:
+        """Route a channel to a notifier, returning an event that's set once it's listened to."""
+        if full_channel not in self._routes:
+            self._pending_unlisten.discard(full_channel)
+            self._pending_listen.add(full_channel)
+            self._listen_events.setdefault(full_channel, asyncio.Event())
+
+        self._routes[full_channel].add(notifier)
+
+        return self._listen_events.get(full_channel)
+
+    def unlisten(self, full_channel: str, notifier: PostgresNotifier) -> None:
+        notifiers = self._routes.get(full_channel)
+
+        if notifiers is None:
             return
 
-        channel = self._tokens.pop(token)
+        notifiers.discard(notifier)
 
-        if channel in self._subscriptions:
-            self._subscriptions[channel].pop(token, None)
+        if not notifiers:
+            del self._routes[full_channel]
+            self._pending_unlisten.add(full_channel)
 
-            if len(self._subscriptions[channel]) == 0:
-                del self._subscriptions[channel]
-                self._pending_unlisten.add(channel)
+    async def _close(self) -> None:
+        self._closed = True
 
-    async def notify(self, channel: str, payloads: dict | list[dict]) -> None:
-        if isinstance(payloads, dict):
-            payloads = [payloads]
+        for key, hub in list(_HUBS.items()):
+            if hub is self:
+                del _HUBS[key]
 
-        channel = self._to_full_channel(channel)
-        encoded = [encode_payload(payload) for payload in payloads]
+        tasks = [task for task in (self._loop_task, self._beat_task) if task]
 
-        await self._query.notify(channel, encoded)
+        for task in tasks:
+            task.cancel()
 
-    async def _connect(self) -> None:
-        dsn = self._query.dsn
+        await asyncio.gather(*tasks, return_exceptions=True)
 
+        if self._conn:
+            try:
+                await self._conn.close()
+            except Exception:  # noqa: S110
+                # Best-effort close during teardown; nothing actionable on failure.
+                pass
+
+    async def _connect(self) -> None:
         self._conn = await asyncio.wait_for(
-            AsyncConnection.connect(dsn, autocommit=True),
+            AsyncConnection.connect(self._dsn, autocommit=True),
             timeout=self._connect_timeout,
         )
 
-        for channel in list(self._subscriptions.keys()):
+        for channel in list(self._routes.keys()):
             self._pending_listen.add(channel)
 
         self._loop_task = asyncio.create_task(self._loop(), name="oban-notifier-loop")
@@ -246,6 +563,9 @@ class PostgresNotifier:
 
         self._reconnect_attempts = 0
 
+        for notifier in list(self._notifiers):
+            notifier._on_connect()
+
     async def _reconnect(self) -> None:
         self._reconnect_attempts += 1
 
@@ -253,6 +573,9 @@ class PostgresNotifier:
 
         await asyncio.sleep(delay)
 
+        if self._closed:
+            return
+
         try:
             await self._connect()
         except (OSError, OperationalError, InterfaceError, asyncio.TimeoutError):
@@ -281,18 +604,15 @@ class PostgresNotifier:
             return
 
         for channel in list(self._pending_listen):
-            full_channel = self._to_full_channel(channel)
-            await self._conn.execute(f'LISTEN "{full_channel}"')
+            await self._conn.execute(f'LISTEN "{channel}"')
 
             self._pending_listen.discard(channel)
 
             if channel in self._listen_events:
-                self._listen_events[channel].set()
-                del self._listen_events[channel]
+                self._listen_events.pop(channel).set()
 
         for channel in list(self._pending_unlisten):
-            full_channel = self._to_full_channel(channel)
-            await self._conn.execute(f'UNLISTEN "{full_channel}"')
+            await self._conn.execute(f'UNLISTEN "{channel}"')
 
             self._pending_unlisten.discard(channel)
 
@@ -303,25 +623,8 @@ class PostgresNotifier:
         gen = self._conn.notifies(timeout=self._notify_timeout)
 
         async for notify in gen:
-            await self._dispatch(notify)
-
-    async def _dispatch(self, notify) -> None:
-        channel = self._from_full_channel(notify.channel)
-        payload = decode_payload(notify.payload)
-
-        if channel in self._subscriptions:
-            for callback in self._subscriptions[channel].values():
-                try:
-                    if inspect.iscoroutinefunction(callback):
-                        asyncio.create_task(callback(channel, payload))
-                    else:
-                        callback(channel, payload)
-                except Exception:
-                    logger.exception(
-                        "Error in notifier callback for channel %s with payload %s",
-                        channel,
-                        payload,
-                    )
+            for notifier in list(self._routes.get(notify.channel, ())):
+                await notifier._dispatch(notify)
 
     async def _beat(self) -> None:
         while True:
@@ -338,3 +641,469 @@ class PostgresNotifier:
                     self._conn = None
                     asyncio.create_task(self._reconnect())
                 break
+
+
+class PostgresNotifier:
+    """PostgreSQL-based notifier using LISTEN/NOTIFY.
+
+    Notifications are received over a dedicated connection and dispatched to registered
+    callbacks. By default that connection is shared by every notifier in the process with the
+    same DSN, so several Oban instances, e.g. one per prefix, hold a single LISTEN connection
+    between them. The connection reconnects automatically when it's lost. Set `shared=False` to
+    give a notifier a connection of its own.
+
+    Dispatch is bounded and coalescing: at most `max_pending` distinct payloads wait per channel,
+    and identical payloads arriving within `dispatch_window` are delivered once.
+
+    Outgoing notifications are buffered for `batch_interval` and sent together with a single
+    query. Use `flush()` to send buffered notifications immediately.
+
+    Payloads too large for a single NOTIFY are split into chunks and reassembled on receipt.
+    Chunks that don't all arrive within `chunk_timeout` seconds are discarded.
+    """
+
+    delivers_sql_notifications = True
+
+    def __init__(
+        self,
+        *,
+        query: Query,
+        prefix: str = "public",
+        beat_interval: float = 30.0,
+        connect_timeout: float = 5.0,
+        notify_timeout: float = 0.1,
+        max_pending: int = 1000,
+        dispatch_window: float = 0.005,
+        batch_interval: float = 0.005,
+        chunk_timeout: float = 5.0,
+        shared: bool = True,
+    ) -> None:
+        self._query = query
+        self._prefix = prefix
+        self._beat_interval = beat_interval
+        self._connect_timeout = connect_timeout
+        self._notify_timeout = notify_timeout
+        self._shared = shared
+
+        self._subscriptions = defaultdict(dict)
+        self._tokens = {}
+        self._dispatcher = _Dispatcher(
+            self._subscriptions,
+            max_pending=max_pending,
+            window=dispatch_window,
+            chunk_timeout=chunk_timeout,
+        )
+        self._outbox = _Outbox(self._send, window=batch_interval)
+
+        self._hub = None
+
+    async def _send(self, channels: list[str], payloads: list[str]) -> None:
+        await self._query.notify(channels, payloads)
+
+    def _to_full_channel(self, channel: str) -> str:
+        return f"{self._prefix}.oban_{channel}"
+
+    def _from_full_channel(self, full_channel: str) -> str:
+        (_prefix, channel) = full_channel.split(".", 1)
+
+        return channel[5:]
+
+    async def start(self) -> None:
+        hub = _ListenHub.acquire(
+            self._query.dsn,
+            shared=self._shared,
+            beat_interval=self._beat_interval,
+            connect_timeout=self._connect_timeout,
+            notify_timeout=self._notify_timeout,
+        )
+
+        self._hub = hub
+
+        # Register channels before connecting so they're listened to as soon as the connection is
+        # established, rather than after the first wait for notifications.
+        for channel in self._subscriptions:
+            hub.listen(self._to_full_channel(channel), self)
+
+        try:
+            await hub.attach(self)
+        except BaseException:
+            self._hub = None
+            raise
+
+    async def stop(self) -> None:
+        await self._outbox.stop()
+
+        if not self._hub:
+            return
+
+        (hub, self._hub) = (self._hub, None)
+
+        await hub.detach(self)
+        await self._dispatcher.stop()
+
+    async def listen(
+        self,
+        channel: str,
+        callback: Callable[[str, dict], Any],
+        wait: bool = True,
+        timeout: float | None = None,
+    ) -> str:
+        token = str(uuid4())
+        event = None
+
+        if channel not in self._subscriptions and self._hub:
+            event = self._hub.listen(self._to_full_channel(channel), self)
+
+        self._tokens[token] = channel
+        self._subscriptions[channel][token] = callback
+
+        if wait and event:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+
+        return token
+
+    async def unlisten(self, token: str) -> None:
+        if token not in self._tokens:
+            return
+
+        channel = self._tokens.pop(token)
+
+        if channel in self._subscriptions:
+            self._subscriptions[channel].pop(token, None)
+
+            if len(self._subscriptions[channel]) == 0:
+                del self._subscriptions[channel]
+
+                if self._hub:
+                    self._hub.unlisten(self._to_full_channel(channel), self)
+
+    async def notify(self, channel: str, payloads: dict | list[dict]) -> None:
+        if isinstance(payloads, dict):
+            payloads = [payloads]
+
+        channel = self._to_full_channel(channel)
+        chunks = [
+            chunk
+            for payload in payloads
+            for chunk in chunk_payload(encode_payload(payload))
+        ]
+
+        self._outbox.put(channel, chunks)
+
+    async def flush(self) -> None:
+        """Send any buffered notifications immediately."""
+        await self._outbox.flush()
+
+    def _on_connect(self) -> None:
+        pass
+
+    async def _dispatch(self, notify) -> None:
+        channel = self._from_full_channel(notify.channel)
+
+        self._dispatcher.put(channel, notify.payload)
+
+
+class HybridNotifier(PostgresNotifier):
+    """PostgreSQL notifier that delivers to local subscribers without a round trip.
+
+    Notifications are dispatched to subscribers in this process as soon as they're sent, and
+    published through PostgreSQL for other nodes as usual. Published notifications are tagged with
+    a nonce unique to this notifier, and when they arrive back over LISTEN they're skipped, so
+    local subscribers see each one only once.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+
+        self._sender = uuid4().hex
+        self._dispatcher._sender = self._sender
+
+    async def notify(self, channel: str, payloads: dict | list[dict]) -> None:
+        if isinstance(payloads, dict):
+            payloads = [payloads]
+
+        full_channel = self._to_full_channel(channel)
+
+        chunks = [
+            chunk
+            for payload in payloads
+            for chunk in chunk_payload(
+                encode_payload({**payload, SENDER_KEY: self._sender})
+            )
+        ]
+
+        if channel in self._subscriptions:
+            for payload in payloads:
+                self._dispatcher.put(channel, encode_payload(payload))
+
+        self._outbox.put(full_channel, chunks)
+
+
+class MemoryNotifier:
+    """In-process notifier for single-node deployments.
+
+    Notifications never leave the process, so there's no connection to maintain and delivery
+    happens on the next turn of the event loop. Only Oban instances in the same process can
+    communicate, which makes this unsuitable for clusters; use `HybridNotifier` there instead.
+
+    Notifications sent directly from SQL with `pg_notify`, such as those for inserted jobs, aren't
+    delivered. Components that rely on them fall back to polling at their own interval.
+    """
+
+    delivers_sql_notifications = False
+
+    def __init__(
+        self, *, max_pending: int = 1000, dispatch_window: float = 0.0
+    ) -> None:
+        self._subscriptions = defaultdict(dict)
+        self._tokens = {}
+        self._dispatcher = _Dispatcher(
+            self._subscriptions, max_pending=max_pending, window=dispatch_window
+        )
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        await self._dispatcher.stop()
+
+    async def listen(
+        self,
+        channel: str,
+        callback: Callable[[str, dict], Any],
+        wait: bool = True,
+        timeout: float | None = None,
+    ) -> str:
+        token = str(uuid4())
+
+        self._tokens[token] = channel
+        self._subscriptions[channel][token] = callback
+
+        return token
+
+    async def unlisten(self, token: str) -> None:
+        if token not in self._tokens:
+            return
+
+        channel = self._tokens.pop(token)
+
+        if channel in self._subscriptions:
+            self._subscriptions[channel].pop(token, None)
+
+            if len(self._subscriptions[channel]) == 0:
+                del self._subscriptions[channel]
+
+    async def notify(self, channel: str, payloads: dict | list[dict]) -> None:
+        if isinstance(payloads, dict):
+            payloads = [payloads]
+
+        for payload in payloads:
+            self._dispatcher.put(channel, encode_payload(payload))
+
+    async def flush(self) -> None:
+        """Notifications are delivered without buffering, so there's nothing to flush."""
+
+
+class PollingNotifier:
+    """Table-backed notifier that polls for notifications instead of using LISTEN.
+
+    LISTEN requires a dedicated session, which isn't available through a pooler running in
+    transaction mode, e.g. PgBouncer. This notifier writes notifications to the unlogged
+    `oban_notifications` table and reads them back through the regular connection pool.
+
+    Outgoing notifications are buffered for `batch_interval` and written with a single insert, or
+    immediately with `flush()`.
+    Polling runs every `min_interval` while notifications are arriving and backs off by doubling
+    up to `max_interval` while idle, so delivery latency is at most `max_interval` and throughput
+    is bounded by `limit` notifications per poll. Rows are deleted by id once they've been in the
+    table for at least `retention` seconds.
+
+    Notifications sent directly from SQL with `pg_notify`, such as those for inserted jobs, aren't
+    delivered. Components that rely on them fall back to polling at their own interval.
+    """
+
+    delivers_sql_notifications = False
+
+    def __init__(
+        self,
+        *,
+        query: Query,
+        batch_interval: float = 0.005,
+        min_interval: float = 0.05,
+        max_interval: float = 1.0,
+        limit: int = 1000,
+        retention: float = 60.0,
+    ) -> None:
+        self._query = query
+        self._batch_interval = batch_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._limit = limit
+        self._retention = retention
+
+        self._validate(
+            batch_interval=batch_interval,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            limit=limit,
+            retention=retention,
+        )
+
+        self._subscriptions = defaultdict(dict)
+        self._tokens = {}
+        self._dispatcher = _Dispatcher(self._subscriptions)
+        self._outbox = _Outbox(query.insert_notifications, window=batch_interval)
+
+        self._last_id = 0
+        self._xmin = 0
+        self._seen = {}
+        self._watermark = None
+        self._prune_at = 0.0
+        self._loop_task = None
+
+    @staticmethod
+    def _validate(
+        *,
+        batch_interval: float,
+        min_interval: float,
+        max_interval: float,
+        limit: int,
+        retention: float,
+    ) -> None:
+        for name, value in [
+            ("batch_interval", batch_interval),
+            ("min_interval", min_interval),
+            ("max_interval", max_interval),
+            ("retention", retention),
+        ]:
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"{name} must be a number, got {value}")
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+
+        if max_interval < min_interval:
+            raise ValueError(
+                f"max_interval must be at least min_interval, got {max_interval}"
+            )
+
+        if not isinstance(limit, int):
+            raise TypeError(f"limit must be an integer, got {limit}")
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+    async def start(self) -> None:
+        self._last_id = await self._query.notifications_watermark()
+        self._prune_at = asyncio.get_running_loop().time() + self._retention
+
+        self._loop_task = asyncio.create_task(self._loop(), name="oban-notifier-loop")
+
+    async def stop(self) -> None:
+        await self._outbox.stop()
+
+        if not self._loop_task:
+            return
+
+        self._loop_task.cancel()
+
+        await asyncio.gather(self._loop_task, return_exceptions=True)
+        await self._dispatcher.stop()
+
+    async def listen(
+        self,
+        channel: str,
+        callback: Callable[[str, dict], Any],
+        wait: bool = True,
+        timeout: float | None = None,
+    ) -> str:
+        token = str(uuid4())
+
+        self._tokens[token] = channel
+        self._subscriptions[channel][token] = callback
+
+        return token
+
+    async def unlisten(self, token: str) -> None:
+        if token not in self._tokens:
+            return
+
+        channel = self._tokens.pop(token)
+
+        if channel in self._subscriptions:
+            self._subscriptions[channel].pop(token, None)
+
+            if len(self._subscriptions[channel]) == 0:
+                del self._subscriptions[channel]
+
+    async def notify(self, channel: str, payloads: dict | list[dict]) -> None:
+        if isinstance(payloads, dict):
+            payloads = [payloads]
+
+        self._outbox.put(channel, [encode_payload(payload) for payload in payloads])
+
+    async def flush(self) -> None:
+        """Write any buffered notifications immediately."""
+        await self._outbox.flush()
+
+    async def _loop(self) -> None:
+        interval = self._min_interval
+
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                polled = await self._poll()
+
+                if polled > 0:
+                    interval = self._min_interval
+                else:
+                    interval = min(interval * 2, self._max_interval)
+
+                await self._prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                interval = self._max_interval
+
+                logger.warning("Notifier failed to poll: %s", error)
+
+    async def _poll(self) -> int:
+        # Rows become visible in commit order rather than id order, so polling resumes from the
+        # oldest transaction that was still running at the previous poll instead of the last id
+        # seen. Rows already delivered from those transactions are skipped by id. Polling runs
+        # without subscriptions too, so a later subscription doesn't replay older rows.
+        xmin, rows = await self._query.poll_notifications(
+            self._xmin,
+            self._last_id,
+            list(self._subscriptions.keys()),
+            list(self._seen.keys()),
+            self._limit,
+        )
+
+        for id, channel, payload, xact_id in rows:
+            self._seen[id] = xact_id
+
+            self._dispatcher.put(channel, payload)
+
+        # Rows beyond the limit may be from transactions below the new xmin, so hold the cursor
+        # until everything visible has been read
+        if len(rows) < self._limit:
+            self._xmin = xmin
+            self._seen = {
+                id: xact_id for id, xact_id in self._seen.items() if xact_id >= xmin
+            }
+
+        return len(rows)
+
+    async def _prune(self) -> None:
+        now = asyncio.get_running_loop().time()
+
+        if now < self._prune_at:
+            return
+
+        # Delete up to the latest id as of one retention period ago, so every row has been
+        # available to pollers for at least that long.
+        if self._watermark is not None:
+            await self._query.prune_notifications(self._watermark)
+
+        self._watermark = await self._query.notifications_watermark()
+        self._prune_at = now + self._retention
@@ -19,6 +19,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Longest time a producer goes without fetching, so jobs whose insert notification was missed,
+# e.g. while the notifier was reconnecting, are never stranded
+SAFETY_FETCH_INTERVAL = 30.0
+
 
 def _init(producer: Producer) -> dict:
     return {"local_limit": producer._limit, "paused": producer._paused}
@@ -107,6 +111,7 @@ class Producer(Looper):
         *,
         debounce_interval: float = 0.005,
         dispatcher: Any = None,
+        heartbeat_interval: float | None = None,
         limit: int = 10,
         paused: bool = False,
         queue: str = "default",
@@ -119,6 +124,7 @@ class Producer(Looper):
         self._debounce_interval = debounce_interval
         self._dispatcher = dispatcher or LocalDispatcher()
         self._extra = extra
+        self._heartbeat_interval = heartbeat_interval
         self._limit = limit
         self._name = name
         self._node = node
@@ -129,6 +135,8 @@ class Producer(Looper):
 
         self._validate()
 
+        self._backlogged = False
+        self._heartbeat_task = None
         self._init_lock = asyncio.Lock()
         self._last_fetch_time = 0.0
         self._listen_token = None
@@ -149,13 +157,7 @@ class Producer(Looper):
         async with self._init_lock:
             self._started_at = datetime.now(timezone.utc)
 
-            await self._query.insert_producer(
-                uuid=self._uuid,
-                name=self._name,
-                node=self._node,
-                queue=self._queue,
-                meta=use_ext("producer.init", _init, self),
-            )
+            await self.register()
 
             self._listen_token = await self._notifier.listen(
                 "signal", self._on_signal, wait=False
@@ -165,6 +167,29 @@ class Producer(Looper):
                 self._loop(), name=f"oban-producer-{self._queue}"
             )
 
+            # Jobs that became available while no producer was running never sent a
+            # notification that this producer could receive, so fetch right away
+            self.notify()
+
+            if self._heartbeat_interval is not None:
+                self._heartbeat_task = asyncio.create_task(
+                    self._heartbeat_loop(), name=f"oban-heartbeat-{self._queue}"
+                )
+
+    async def register(self) -> None:
+        """Record this producer in the producers table.
+
+        Called on start, and again by the refresher if the record was removed while the producer
+        was still running, e.g. after missing refreshes, so its jobs aren't treated as orphans.
+        """
+        await self._query.insert_producer(
+            uuid=self._uuid,
+            name=self._name,
+            node=self._node,
+            queue=self._queue,
+            meta=use_ext("producer.init", _init, self),
+        )
+
     async def stop(self) -> None:
         async with self._init_lock:
             if not self._listen_token or not self._loop_task:
@@ -199,6 +224,12 @@ class Producer(Looper):
             except Exception:
                 logger.debug("Failed to flush ACKs for %s during shutdown", self._uuid)
 
+            # Running jobs keep their heartbeats until they've finished and been acked
+            if self._heartbeat_task:
+                self._heartbeat_task.cancel()
+
+                await asyncio.gather(self._heartbeat_task, return_exceptions=True)
+
             try:
                 await self._query.delete_producer(self._uuid)
             except Exception:
@@ -248,7 +279,10 @@ class Producer(Looper):
             try:
                 await asyncio.wait_for(self._notified.wait(), timeout=1.0)
             except asyncio.TimeoutError:
-                continue
+                # A full batch means more jobs may be waiting, so keep fetching without a
+                # notification until the queue drains.
+                if not self._backlogged and not self._safety_fetch_due():
+                    continue
             except asyncio.CancelledError:
                 break
 
@@ -262,6 +296,36 @@ class Producer(Looper):
             except Exception:
                 logger.exception("Error in producer for queue %s", self._queue)
 
+    def _safety_fetch_due(self) -> bool:
+        elapsed = asyncio.get_event_loop().time() - self._last_fetch_time
+
+        return elapsed >= SAFETY_FETCH_INTERVAL
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self._heartbeat_interval)
+
+                await self._heartbeat()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Error in heartbeat for queue %s", self._queue)
+
+    async def _heartbeat(self) -> None:
+        # Finished jobs stay executing until they're acked, so they need heartbeats too
+        ids = [*self._running_jobs.keys(), *(ack.id for ack in self._pending_acks)]
+
+        if not ids:
+            return
+
+        with telemetry.span(
+            "oban.producer.heartbeat", {"queue": self._queue}
+        ) as context:
+            count = await self._query.heartbeat_jobs(ids)
+
+            context.add({"count": count})
+
     async def _debounce(self) -> None:
         now = asyncio.get_event_loop().time()
         elapsed = now - self._last_fetch_time
@@ -274,11 +338,15 @@ class Producer(Looper):
     async def _produce(self) -> None:
         await self._ack_jobs()
 
-        if self._paused or (self._limit - len(self._running_jobs)) <= 0:
+        demand = self._limit - len(self._running_jobs)
+
+        if self._paused or demand <= 0:
             return
 
         jobs = await self._get_jobs()
 
+        self._backlogged = len(jobs) >= demand
+
         for job in jobs:
             task = self._dispatcher.dispatch(self, job)
             task.add_done_callback(
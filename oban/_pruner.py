@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from . import telemetry
+from ._archive import JsonlArchive
 from ._extensions import use_ext
 from ._looper import Looper
+from ._query import PRUNABLE_STATES
 
 logger = logging.getLogger(__name__)
 
@@ -14,24 +17,69 @@ if TYPE_CHECKING:
     from ._leader import Leader
     from ._query import Query
 
+# Days of partitions for finished jobs to create ahead of time, so that jobs rarely land in the
+# default partition
+PREMAKE_DAYS = 2
 
-async def _prune(query: Query, max_age: int, limit: int) -> None:
-    with telemetry.span("oban.pruner.prune", {}) as context:
-        pruned = await query.prune_jobs(max_age, limit)
+ARCHIVE_MODES = ("table", "jsonl")
 
-        context.add({"pruned_count": pruned})
+DEFAULT_MAX_AGE = 86_400
+
+RULE_KEYS = ("queue", "worker", "state", "max_age")
+
+
+async def _prune_batch(
+    query: Query,
+    max_age: int | dict[str, int],
+    limit: int,
+    *,
+    archive: str | JsonlArchive | None = None,
+    rules: list[dict] | None = None,
+) -> int:
+    return await query.prune_jobs(max_age, limit, archive, rules)
 
 
 class Pruner(Looper):
     """Manages periodic deletion of completed, cancelled, and discarded jobs.
 
+    Each pass deletes in batches of up to `limit` until no expired jobs remain or the pass has
+    run for `budget` seconds. Before each batch the pruner checks for sessions waiting on locks
+    and for replication lag. When either exceeds its threshold the pass stops early and the batch
+    size is halved, then grows back to `limit` as batches complete without pressure.
+    Extensions may replace the whole pass with `pruner.prune`, or a single batch with
+    `pruner.prune_batch`.
+
+    With a partitioned jobs table, finished jobs are pruned by dropping whole daily partitions
+    once they've expired, rather than deleting rows in batches. Upcoming partitions are created
+    on each pass.
+
+    The `max_age` is either a single age in seconds or a dict with an age for each of the
+    "completed", "cancelled", and "discarded" states. Jobs may be archived before they're
+    deleted, in the same transaction as the delete:
+
+    - table: Jobs move to the `oban_jobs_archive` table, where they're kept for
+      `archive_max_age` seconds, or indefinitely when that isn't set.
+    - jsonl: Jobs are streamed to gzip compressed JSON Lines files in `archive_path`.
+
+    Retention `rules` override `max_age` for jobs by queue, worker, and state. Each rule is a
+    dict with a `max_age` and any of "queue", "worker", and "state" to match on. A job is kept
+    for the age of the first rule it matches, and all rules are applied by a single delete:
+
+        >>> pruner={
+        ...     "max_age": 600,
+        ...     "rules": [
+        ...         {"state": "discarded", "max_age": 2_592_000},
+        ...         {"queue": "mailers", "max_age": 604_800},
+        ...     ],
+        ... }
+
     This class is managed internally by Oban and shouldn't be constructed directly.
     Instead, configure pruning via the Oban constructor:
 
         >>> async with Oban(
         ...     conn=conn,
         ...     queues={"default": 10},
-        ...     pruner={"max_age": 86_400, "interval": 60.0, "limit": 20_000}
+        ...     pruner={"max_age": 86_400, "interval": 60.0, "limit": 20_000, "budget": 10.0}
         ... ) as oban:
         ...     # Pruner runs automatically in the background
     """
@@ -41,26 +89,76 @@ class Pruner(Looper):
         *,
         query: Query,
         leader: Leader,
-        max_age: int = 86_400,
+        max_age: int | dict[str, int] = DEFAULT_MAX_AGE,
         interval: float = 60.0,
         limit: int = 20_000,
+        budget: float = 10.0,
+        max_lock_waits: int = 5,
+        max_lag: float = 10.0,
+        archive: str | None = None,
+        archive_path: str | None = None,
+        archive_max_age: int | None = None,
+        rules: list[dict] | None = None,
     ) -> None:
         self._leader = leader
         self._max_age = max_age
         self._interval = interval
         self._limit = limit
+        self._budget = budget
+        self._max_lock_waits = max_lock_waits
+        self._max_lag = max_lag
+        self._archive = archive
+        self._archive_max_age = archive_max_age
+        self._rules = rules or []
         self._query = query
 
+        self._batch_size = limit
         self._loop_task = None
 
-        self._validate(max_age=max_age, interval=interval, limit=limit)
+        self._validate(
+            max_age=max_age,
+            interval=interval,
+            limit=limit,
+            budget=budget,
+            max_lock_waits=max_lock_waits,
+            max_lag=max_lag,
+            archive=archive,
+            archive_path=archive_path,
+            archive_max_age=archive_max_age,
+            rules=rules,
+        )
+
+        if isinstance(max_age, dict):
+            self._max_age = {
+                state: max_age.get(state, DEFAULT_MAX_AGE) for state in PRUNABLE_STATES
+            }
+
+        self._sink = JsonlArchive(archive_path) if archive == "jsonl" else archive
 
     @staticmethod
-    def _validate(*, max_age: int, interval: float, limit: int) -> None:
-        if not isinstance(max_age, int):
-            raise TypeError(f"max_age must be an integer, got {max_age}")
-        if max_age <= 0:
-            raise ValueError(f"max_age must be positive, got {max_age}")
+    def _validate(
+        *,
+        max_age: int | dict[str, int],
+        interval: float,
+        limit: int,
+        budget: float = 10.0,
+        max_lock_waits: int = 5,
+        max_lag: float = 10.0,
+        archive: str | None = None,
+        archive_path: str | None = None,
+        archive_max_age: int | None = None,
+        rules: list[dict] | None = None,
+    ) -> None:
+        if isinstance(max_age, dict):
+            for state, age in max_age.items():
+                if state not in PRUNABLE_STATES:
+                    raise ValueError(
+                        f"max_age states must be in {tuple(PRUNABLE_STATES)}, got {state}"
+                    )
+
+                Pruner._validate_age("max_age", age)
+        else:
+            Pruner._validate_age("max_age", max_age)
 
         if not isinstance(interval, (int, float)):
             raise TypeError(f"interval must be a number, got {interval}")
@@ -72,6 +170,69 @@ class Pruner(Looper):
         if limit <= 0:
             raise ValueError(f"limit must be positive, got {limit}")
 
+        if not isinstance(budget, (int, float)):
+            raise TypeError(f"budget must be a number, got {budget}")
+        if budget <= 0:
+            raise ValueError(f"budget must be positive, got {budget}")
+
+        if not isinstance(max_lock_waits, int):
+            raise TypeError(f"max_lock_waits must be an integer, got {max_lock_waits}")
+        if max_lock_waits < 0:
+            raise ValueError(
+                f"max_lock_waits must be non-negative, got {max_lock_waits}"
+            )
+
+        if not isinstance(max_lag, (int, float)):
+            raise TypeError(f"max_lag must be a number, got {max_lag}")
+        if max_lag < 0:
+            raise ValueError(f"max_lag must be non-negative, got {max_lag}")
+
+        if archive is not None and archive not in ARCHIVE_MODES:
+            raise ValueError(f"archive must be one of {ARCHIVE_MODES}, got {archive}")
+
+        if archive == "jsonl" and not isinstance(archive_path, str):
+            raise TypeError(f"archive_path must be a string, got {archive_path}")
+
+        if archive_max_age is not None:
+            Pruner._validate_age("archive_max_age", archive_max_age)
+
+        if rules is not None:
+            if not isinstance(rules, list):
+                raise TypeError(f"rules must be a list, got {rules}")
+
+            for rule in rules:
+                Pruner._validate_rule(rule)
+
+    @staticmethod
+    def _validate_rule(rule: dict) -> None:
+        if not isinstance(rule, dict):
+            raise TypeError(f"rules must be dicts, got {rule}")
+
+        for key in rule:
+            if key not in RULE_KEYS:
+                raise ValueError(f"rule keys must be in {RULE_KEYS}, got {key}")
+
+        if "max_age" not in rule:
+            raise ValueError(f"rules must have a max_age, got {rule}")
+
+        Pruner._validate_age("max_age", rule["max_age"])
+
+        for key in ("queue", "worker"):
+            if key in rule and not isinstance(rule[key], str):
+                raise TypeError(f"rule {key} must be a string, got {rule[key]}")
+
+        if "state" in rule and rule["state"] not in PRUNABLE_STATES:
+            raise ValueError(
+                f"rule state must be in {tuple(PRUNABLE_STATES)}, got {rule['state']}"
+            )
+
+    @staticmethod
+    def _validate_age(name: str, age: int) -> None:
+        if not isinstance(age, int):
+            raise TypeError(f"{name} must be an integer, got {age}")
+        if age <= 0:
+            raise ValueError(f"{name} must be positive, got {age}")
+
     async def start(self) -> None:
         self._loop_task = asyncio.create_task(self._loop(), name="oban-pruner")
 
@@ -99,4 +260,78 @@ class Pruner(Looper):
                 logger.exception("Error in pruner")
 
     async def _prune(self) -> None:
-        await use_ext("pruner.prune", _prune, self._query, self._max_age, self._limit)
+        await use_ext(
+            "pruner.prune", self._prune_all, self._query, self._max_age, self._limit
+        )
+
+    async def _prune_all(
+        self, query: Query, max_age: int | dict[str, int], limit: int
+    ) -> None:
+        with telemetry.span("oban.pruner.prune", {}) as context:
+            started_at = time.monotonic()
+            deadline = started_at + self._budget
+
+            if await query.jobs_partitioned():
+                dropped = await query.prune_partitions(
+                    max_age, PREMAKE_DAYS, self._sink, self._rules
+                )
+
+                context.add({"dropped_partitions": dropped})
+
+            pruned = 0
+            batches = 0
+            backed_off = False
+            cleared = False
+
+            while time.monotonic() < deadline:
+                if await self._under_pressure():
+                    self._batch_size = max(1, self._batch_size // 2)
+                    backed_off = True
+                    break
+
+                size = self._batch_size
+                count = await use_ext(
+                    "pruner.prune_batch",
+                    _prune_batch,
+                    query,
+                    max_age,
+                    size,
+                    archive=self._sink,
+                    rules=self._rules,
+                )
+
+                # Extensions that don't report a count are treated as having pruned everything
+                if count is None:
+                    cleared = True
+                    break
+
+                pruned += count
+                batches += 1
+                self._batch_size = min(limit, size * 2)
+
+                if count < size:
+                    cleared = True
+                    break
+
+            if self._archive == "table" and self._archive_max_age is not None:
+                archive_pruned = await query.prune_archive(self._archive_max_age, limit)
+
+                context.add({"archive_pruned_count": archive_pruned})
+
+            elapsed = time.monotonic() - started_at
+            backlog = 0 if cleared else await query.prune_backlog(max_age, self._rules)
+
+            context.add(
+                {
+                    "pruned_count": pruned,
+                    "batch_count": batches,
+                    "backed_off": backed_off,
+                    "backlog": backlog,
+                    "rows_per_second": pruned / elapsed if elapsed > 0 else 0.0,
+                }
+            )
+
+    async def _under_pressure(self) -> bool:
+        (lock_waits, lag) = await self._query.prune_pressure()
+
+        return lock_waits > self._max_lock_waits or lag > self._max_lag
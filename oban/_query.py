@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from functools import cache
 from importlib.resources import files
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Union
 
-from psycopg import AsyncConnection, AsyncCursor
+from psycopg import AsyncConnection, AsyncCursor, sql
+from psycopg.errors import CheckViolation, SerializationFailure
 from psycopg.rows import class_row
 from psycopg.types.json import Jsonb
 from psycopg_pool import AsyncConnectionPool
@@ -16,6 +18,16 @@ from ._executor import AckAction
 from ._extensions import use_ext
 from .job import Job, TIMESTAMP_FIELDS
 
+if TYPE_CHECKING:
+    from ._archive import ArchiveSink
+
+# Finished states mapped to the timestamp recording when they finished
+PRUNABLE_STATES = {
+    "completed": "completed_at",
+    "cancelled": "cancelled_at",
+    "discarded": "discarded_at",
+}
+
 # Type alias for connection-like objects that can be passed to enqueue
 ConnectionLike = Union[AsyncConnection, AsyncCursor, Any]
 
@@ -42,6 +54,9 @@ INSERTABLE_FIELDS = [
     "worker",
 ]
 
+# Daily partitions for finished jobs are named by their day, e.g. oban_jobs_terminal_20251019
+TERMINAL_PARTITION = re.compile(r"^oban_jobs_terminal_(\d{8})$")
+
 # The `Job` class has errors, but we only insert a single `error` at one time.
 JSON_FIELDS = ["args", "error", "errors", "meta"]
 
@@ -89,25 +104,83 @@ UPDATABLE_FIELDS = [
 ]
 
 
+# Attempts for statements that lock jobs another transaction may move between partitions
+MOVED_ATTEMPTS = 3
+
+
+async def _retry_moved(func: Callable[[], Awaitable[Any]]) -> Any:
+    # With a partitioned jobs table a state change moves the row to another partition, and a
+    # concurrent update waiting on that row fails with a serialization error instead of
+    # following it. Running the whole transaction again sees the job's new state.
+    for attempt in range(1, MOVED_ATTEMPTS + 1):
+        try:
+            return await func()
+        except SerializationFailure:
+            if attempt == MOVED_ATTEMPTS:
+                raise
+
+
 async def _ack_jobs(query: Query, acks: list[AckAction]) -> list[int]:
-    async with query._pool.connection() as conn:
-        async with conn.transaction():
-            stmt = Query._load_file("ack_job.sql", query._prefix)
-            acked_ids = []
+    async def ack() -> list[int]:
+        async with query._pool.connection() as conn:
+            async with conn.transaction():
+                stmt = Query._load_file("ack_job.sql", query._prefix)
+                acked_ids = []
 
-            for ack in acks:
-                args = {
-                    field: Query._cast_type(field, getattr(ack, field))
-                    for field in ACKABLE_FIELDS
-                }
+                for ack in acks:
+                    args = {
+                        field: Query._cast_type(field, getattr(ack, field))
+                        for field in ACKABLE_FIELDS
+                    }
 
-                result = await conn.execute(stmt, args)
-                row = await result.fetchone()
+                    result = await conn.execute(stmt, args)
+                    row = await result.fetchone()
+
+                    if row:
+                        acked_ids.append(row[0])
+
+                return acked_ids
+
+    return await _retry_moved(ack)
+
+
+def _retention_args(
+    max_age: int | dict[str, int], rules: list[dict] | None = None
+) -> dict[str, Any]:
+    rules = rules or []
 
-                if row:
-                    acked_ids.append(row[0])
+    if isinstance(max_age, int):
+        max_age = {state: max_age for state in PRUNABLE_STATES}
 
-            return acked_ids
+    args = {
+        "rule_queues": [rule.get("queue") for rule in rules],
+        "rule_workers": [rule.get("worker") for rule in rules],
+        "rule_states": [rule.get("state") for rule in rules],
+        "rule_ages": [rule["max_age"] for rule in rules],
+    }
+
+    # The shortest age that could apply to each state bounds the candidate rows by index,
+    # before rules are matched against each of them. Rules after one that matches every job in
+    # the state can never apply, and neither can the state's own max_age, so a rule such as
+    # keeping all discarded jobs for 30 days excludes them by index rather than row by row.
+    for state in PRUNABLE_STATES:
+        ages = []
+
+        for rule in rules:
+            if rule.get("state") not in (None, state):
+                continue
+
+            ages.append(rule["max_age"])
+
+            if rule.get("queue") is None and rule.get("worker") is None:
+                break
+        else:
+            ages.append(max_age[state])
+
+        args[f"{state}_age"] = max_age[state]
+        args[f"{state}_floor"] = min(ages)
+
+    return args
 
 
 async def _reset(query: Query) -> None:
@@ -129,10 +202,16 @@ async def _insert_jobs(
                 key: Query._cast_type(key, getattr(job, key))
                 for key in INSERTABLE_FIELDS
             }
+            args["shards"] = query._insert_shards
+            args["horizon"] = query._schedule_horizon
 
             result = await conn.execute(stmt, args)
             row = await result.fetchone()
 
+            # Conflicts with a unique index, e.g. a cron run another node already inserted
+            if row is None:
+                continue
+
             job.id = row[0]
             job.inserted_at = row[1]
             job.queue = row[2]
@@ -163,7 +242,7 @@ class Query:
 
         if apply_prefix:
             return re.sub(
-                r"\b(oban_insert|oban_job_state|oban_jobs|oban_leaders|oban_producers|oban_state_to_bit)\b",
+                r"\b(oban_crons|oban_insert|oban_job_state|oban_jobs|oban_jobs_active|oban_jobs_archive|oban_jobs_terminal|oban_jobs_terminal_default|oban_leaders|oban_notifications|oban_producers|oban_state_to_bit)\b",
                 rf"{prefix}.\1",
                 sql,
             )
@@ -183,12 +262,22 @@ class Query:
 
         return value
 
-    def __init__(self, pool: AsyncConnectionPool, prefix: str = "public") -> None:
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        prefix: str = "public",
+        insert_shards: int | None = None,
+        schedule_horizon: float = 1.0,
+    ) -> None:
         if not isinstance(pool, AsyncConnectionPool):
             raise TypeError(f"Expected AsyncConnectionPool, got {type(pool).__name__}")
 
         self._pool = pool
         self._prefix = prefix
+        self._insert_shards = insert_shards
+        self._schedule_horizon = schedule_horizon
+        self._partitioned = None
+        self._archived = None
 
     @property
     def dsn(self) -> str:
@@ -225,17 +314,20 @@ class Query:
             return await result.fetchall()
 
     async def cancel_many_jobs(self, ids: list[int]) -> tuple[int, list[int]]:
-        async with self._pool.connection() as conn:
-            async with conn.transaction():
-                stmt = self._load_file("cancel_many_jobs.sql", self._prefix)
-                args = {"ids": ids}
+        async def cancel() -> tuple[int, list[int]]:
+            async with self._pool.connection() as conn:
+                async with conn.transaction():
+                    stmt = self._load_file("cancel_many_jobs.sql", self._prefix)
+                    args = {"ids": ids}
 
-                result = await conn.execute(stmt, args)
-                rows = await result.fetchall()
+                    result = await conn.execute(stmt, args)
+                    rows = await result.fetchall()
 
-                executing_ids = [row[0] for row in rows if row[1] == "executing"]
+                    executing_ids = [row[0] for row in rows if row[1] == "executing"]
 
-                return len(rows), executing_ids
+                    return len(rows), executing_ids
+
+        return await _retry_moved(cancel)
 
     async def delete_many_jobs(self, ids: list[int]) -> int:
         async with self._pool.connection() as conn:
@@ -247,6 +339,25 @@ class Query:
 
                 return result.rowcount
 
+    async def get_archived_job(self, job_id: int) -> Job | None:
+        if self._archived is None:
+            async with self._pool.connection() as conn:
+                stmt = self._load_file("archive_installed.sql", self._prefix)
+                rows = await conn.execute(stmt)
+
+                (self._archived,) = await rows.fetchone()
+
+        if not self._archived:
+            return None
+
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("get_archived_job.sql", self._prefix)
+
+            async with conn.cursor(row_factory=class_row(Job)) as cur:
+                await cur.execute(stmt, (job_id,))
+
+                return await cur.fetchone()
+
     async def get_job(self, job_id: int) -> Job:
         async with self._pool.connection() as conn:
             stmt = self._load_file("get_job.sql", self._prefix)
@@ -274,21 +385,225 @@ class Query:
     ) -> list[Job]:
         return await use_ext("query.insert_jobs", _insert_jobs, self, jobs, conn)
 
-    async def prune_jobs(self, max_age: int, limit: int) -> int:
+    async def prune_jobs(
+        self,
+        max_age: int | dict[str, int],
+        limit: int,
+        archive: str | ArchiveSink | None = None,
+        rules: list[dict] | None = None,
+    ) -> int:
+        """Delete up to `limit` expired jobs.
+
+        The `max_age` is either one age in seconds or an age for each finished state. Each job
+        is kept for the `max_age` of the first of the `rules` matching its queue, worker, and
+        state, falling back to the `max_age` for its state. With an `archive` of "table" the
+        jobs are moved to the archive table, and with a sink they're streamed to it as JSON
+        before the delete commits.
+        """
+        # Partitions are dropped whole, so only the default partition is pruned row by row
+        if await self.jobs_partitioned():
+            path = "prune_terminal_default.sql"
+        else:
+            path = "prune_jobs.sql"
+
+        stmt = self._load_file(path, self._prefix)
+        args = {**_retention_args(max_age, rules), "limit": limit}
+
+        async with self._pool.connection() as conn:
+            async with conn.transaction():
+                if archive is None:
+                    result = await conn.execute(stmt, args)
+
+                    return result.rowcount
+
+                if archive == "table":
+                    insert = self._load_file("archive_deleted.sql", self._prefix)
+                    stmt = f"WITH deleted AS ({stmt} RETURNING jobs.*) {insert}"
+
+                    result = await conn.execute(stmt, args)
+
+                    return result.rowcount
+
+                stmt = f"{stmt} RETURNING row_to_json(jobs)::text"
+
+                return await archive.write(conn.cursor().stream(stmt, args))
+
+    async def prune_archive(self, max_age: int, limit: int) -> int:
         async with self._pool.connection() as conn:
             async with conn.transaction():
-                stmt = self._load_file("prune_jobs.sql", self._prefix)
+                stmt = self._load_file("prune_archive.sql", self._prefix)
                 args = {"max_age": max_age, "limit": limit}
 
                 result = await conn.execute(stmt, args)
 
                 return result.rowcount
 
-    async def rescue_jobs(self, rescue_after: float) -> int:
+    async def prune_backlog(
+        self, max_age: int | dict[str, int], rules: list[dict] | None = None
+    ) -> int:
+        """Estimate how many expired jobs are left to prune, from the query planner."""
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("prune_backlog.sql", self._prefix)
+            rows = await conn.execute(stmt, _retention_args(max_age, rules))
+
+            ((plan,),) = await rows.fetchall()
+
+            return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def prune_pressure(self) -> tuple[int, float]:
+        """Get the number of sessions waiting on locks and the replication lag in seconds."""
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("prune_pressure.sql", self._prefix)
+            rows = await conn.execute(stmt)
+
+            (lock_waits, lag) = await rows.fetchone()
+
+            return (lock_waits, lag)
+
+    async def prune_partitions(
+        self,
+        max_age: int | dict[str, int],
+        premake: int,
+        archive: str | ArchiveSink | None = None,
+        rules: list[dict] | None = None,
+    ) -> list[str]:
+        """Maintain the daily partitions of finished jobs in a partitioned table.
+
+        Creates partitions for today and `premake` days ahead, and drops the partitions whose
+        day ended more than `max_age` ago and hold no jobs finished since. With per-state ages
+        or retention rules the longest one applies. Jobs are archived before the drop when `archive` is set.
+        Returns the names of the dropped partitions.
+        """
+        today = datetime.now(timezone.utc).date()
+        args = _retention_args(max_age, rules)
+        longest = max(
+            *args["rule_ages"], *(args[f"{state}_age"] for state in PRUNABLE_STATES)
+        )
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+            seconds=longest
+        )
+
+        async with self._pool.connection() as conn:
+            for offset in range(premake + 1):
+                await self._create_terminal_partition(
+                    conn, today + timedelta(days=offset)
+                )
+
+            async with conn.transaction():
+                stmt = self._load_file("terminal_partitions.sql", self._prefix)
+                rows = await (await conn.execute(stmt)).fetchall()
+
+            dropped = []
+
+            for (name,) in rows:
+                if (match := TERMINAL_PARTITION.match(name)) is None:
+                    continue
+
+                day = datetime.strptime(match[1], "%Y%m%d")
+
+                if day + timedelta(days=1) <= cutoff:
+                    if await self._drop_terminal_partition(conn, name, cutoff, archive):
+                        dropped.append(name)
+
+            return dropped
+
+    async def _create_terminal_partition(
+        self, conn: AsyncConnection, day: date
+    ) -> None:
+        stmt = sql.SQL(
+            "CREATE TABLE IF NOT EXISTS {} PARTITION OF {} FOR VALUES FROM ({}) TO ({})"
+        ).format(
+            sql.Identifier(self._prefix, f"oban_jobs_terminal_{day:%Y%m%d}"),
+            sql.Identifier(self._prefix, "oban_jobs_terminal"),
+            sql.Literal(day),
+            sql.Literal(day + timedelta(days=1)),
+        )
+
+        # The default partition may already hold jobs from that day, e.g. right after install,
+        # and those are left for regular deletes.
+        try:
+            async with conn.transaction():
+                await conn.execute(stmt)
+        except CheckViolation:
+            pass
+
+    async def _drop_terminal_partition(
+        self,
+        conn: AsyncConnection,
+        name: str,
+        cutoff: datetime,
+        archive: str | ArchiveSink | None,
+    ) -> bool:
+        table = sql.Identifier(self._prefix, name)
+
+        # Partitions are by insertion time, so jobs that ran long after they were inserted keep
+        # their partition around until they've expired too
+        check = sql.SQL(
+            """
+            SELECT EXISTS (
+              SELECT 1 FROM {} WHERE
+                (state = 'completed' AND completed_at > %(cutoff)s) OR
+                (state = 'cancelled' AND cancelled_at > %(cutoff)s) OR
+                (state = 'discarded' AND discarded_at > %(cutoff)s)
+            )
+            """
+        ).format(table)
+
+        async with conn.transaction():
+            (recent,) = await (await conn.execute(check, {"cutoff": cutoff})).fetchone()
+
+            if recent:
+                return False
+
+            if archive == "table":
+                insert = self._load_file("archive_deleted.sql", self._prefix)
+                stmt = sql.SQL("WITH deleted AS (SELECT * FROM {}) ").format(table)
+
+                await conn.execute(stmt + sql.SQL(insert))
+            elif archive is not None:
+                stmt = sql.SQL("SELECT row_to_json(jobs)::text FROM {} AS jobs")
+
+                await archive.write(conn.cursor().stream(stmt.format(table)))
+
+            await conn.execute(sql.SQL("DROP TABLE {}").format(table))
+
+        return True
+
+    async def heartbeat_jobs(self, ids: list[int]) -> int:
+        """Record a heartbeat for executing jobs, skipping any that are locked, e.g. by an ack."""
+        async with self._pool.connection() as conn:
+            async with conn.transaction():
+                stmt = self._load_file("heartbeat_jobs.sql", self._prefix)
+
+                result = await conn.execute(stmt, {"ids": ids})
+
+                return result.rowcount
+
+    async def rescue_jobs(
+        self,
+        rescue_after: float,
+        limit: int,
+        heartbeat_after: float | None = None,
+        producer_max_age: float = 60.0,
+    ) -> int:
+        """Rescue up to `limit` executing jobs that were orphaned by their producer.
+
+        Jobs are orphaned once the producer recorded in `attempted_by` is gone and they've
+        either recorded a heartbeat or been executing for over `producer_max_age` seconds, or
+        when they have heartbeats and the last one is more than `heartbeat_after` seconds old.
+        Any other job without a live producer is rescued after executing for `rescue_after`
+        seconds instead.
+        """
         async with self._pool.connection() as conn:
             async with conn.transaction():
                 stmt = self._load_file("rescue_jobs.sql", self._prefix)
-                args = {"rescue_after": rescue_after}
+                args = {
+                    "rescue_after": rescue_after,
+                    "heartbeat_after": heartbeat_after,
+                    "producer_max_age": producer_max_age,
+                    "limit": limit,
+                    "shards": self._insert_shards,
+                }
 
                 result = await conn.execute(stmt, args)
 
@@ -298,25 +613,24 @@ class Query:
         async with self._pool.connection() as conn:
             async with conn.transaction():
                 stmt = self._load_file("retry_many_jobs.sql", self._prefix)
-                args = {"ids": ids}
+                args = {"ids": ids, "shards": self._insert_shards}
 
                 result = await conn.execute(stmt, args)
 
                 return result.rowcount
 
     async def stage_jobs(
-        self, limit: int, queues: list[str], before: datetime | None = None
-    ) -> tuple[int, list[str]]:
+        self, limit: int, queues: list[str] | None, before: datetime | None = None
+    ) -> tuple[int, list[str], float | None]:
         async with self._pool.connection() as conn:
             async with conn.transaction():
                 stmt = self._load_file("stage_jobs.sql", self._prefix)
                 args = {"limit": limit, "queues": queues, "before": before}
 
                 result = await conn.execute(stmt, args)
-                rows = await result.fetchall()
-                queues = [queue for (queue,) in rows]
+                (staged, active, next_in) = await result.fetchone()
 
-                return (len(rows), queues)
+                return (staged, active, next_in)
 
     async def update_many_jobs(self, jobs: list[Job]) -> list[Job]:
         async with self._pool.connection() as conn:
@@ -344,6 +658,32 @@ class Query:
 
                 return jobs
 
+    # Cron
+
+    async def cron_last_runs(self, names: list[str]) -> dict[str, datetime]:
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("cron_last_runs.sql", self._prefix)
+
+            result = await conn.execute(stmt, {"names": names})
+            rows = await result.fetchall()
+
+            return {
+                name: last_at.replace(tzinfo=timezone.utc) for name, last_at in rows
+            }
+
+    async def record_cron_runs(self, runs: dict[str, datetime]) -> None:
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("record_cron_runs.sql", self._prefix)
+            args = {
+                "names": list(runs.keys()),
+                "times": [
+                    time.astimezone(timezone.utc).replace(tzinfo=None)
+                    for time in runs.values()
+                ],
+            }
+
+            await conn.execute(stmt, args)
+
     # Leadership
 
     async def attempt_leadership(
@@ -375,13 +715,58 @@ class Query:
 
             await conn.execute(stmt, args)
 
+    def advisory_leadership_key(self, name: str) -> int:
+        # Scoped by prefix so separate installs in one database elect leaders independently
+        digest = hashlib.md5(
+            f"{self._prefix}.oban_leaders.{name}".encode("utf-8"), usedforsecurity=False
+        ).hexdigest()
+
+        return int(digest[:15], 16)
+
+    async def acquire_advisory_leadership(
+        self, conn: AsyncConnection, name: str, wait: bool = False
+    ) -> bool:
+        """Take the session-level leadership lock on a dedicated connection.
+
+        Without `wait` this returns immediately, otherwise it blocks until the current holder's
+        session ends. The lock is held until the connection closes.
+        """
+        if wait:
+            stmt = self._load_file("await_advisory_leadership.sql", self._prefix)
+        else:
+            stmt = self._load_file("try_advisory_leadership.sql", self._prefix)
+
+        result = await conn.execute(stmt, {"key": self.advisory_leadership_key(name)})
+        (acquired,) = await result.fetchone()
+
+        # pg_advisory_lock returns void once the lock is granted
+        return acquired is not False
+
     # Schema
 
-    async def install(self) -> None:
+    @classmethod
+    def install_sql(cls, prefix: str = "public", partitioned: bool = False) -> str:
+        jobs_file = (
+            "install_jobs_partitioned.sql" if partitioned else "install_jobs.sql"
+        )
+
+        return "\n".join(
+            cls._load_file(path, prefix) for path in ["install.sql", jobs_file]
+        )
+
+    async def install(self, partitioned: bool = False) -> None:
         async with self._pool.connection() as conn:
-            stmt = self._load_file("install.sql", self._prefix)
+            await conn.execute(self.install_sql(self._prefix, partitioned))
 
-            await conn.execute(stmt)
+    async def jobs_partitioned(self) -> bool:
+        if self._partitioned is None:
+            async with self._pool.connection() as conn:
+                stmt = self._load_file("jobs_partitioned.sql", self._prefix)
+                rows = await conn.execute(stmt)
+
+                (self._partitioned,) = await rows.fetchone()
+
+        return self._partitioned
 
     async def reset(self) -> None:
         return await use_ext("query.reset", _reset, self)
@@ -434,14 +819,14 @@ class Query:
 
             await conn.execute(stmt, args)
 
-    async def refresh_producers(self, uuids: list[str]) -> int:
+    async def refresh_producers(self, uuids: list[str]) -> list[str]:
         async with self._pool.connection() as conn:
             stmt = self._load_file("refresh_producers.sql", self._prefix)
             args = {"uuids": uuids}
 
-            result = await conn.execute(stmt, args)
+            rows = await conn.execute(stmt, args)
 
-            return result.rowcount
+            return [uuid for (uuid,) in await rows.fetchall()]
 
     async def update_producer(self, uuid: str, meta: dict[str, Any]) -> None:
         async with self._pool.connection() as conn:
@@ -452,9 +837,62 @@ class Query:
 
     # Notifier
 
-    async def notify(self, channel: str, payloads: list[str]) -> None:
+    async def notify(self, channels: list[str], payloads: list[str]) -> None:
         async with self._pool.connection() as conn:
             await conn.execute(
-                "SELECT pg_notify(%s, payload) FROM json_array_elements_text(%s::json) AS payload",
-                (channel, Jsonb(payloads)),
+                "SELECT pg_notify(channel, payload) FROM unnest(%s::text[], %s::text[]) AS t(channel, payload)",
+                (channels, payloads),
             )
+
+    async def insert_notifications(
+        self, channels: list[str], payloads: list[str]
+    ) -> None:
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("insert_notifications.sql", self._prefix)
+            args = {"channels": channels, "payloads": payloads}
+
+            await conn.execute(stmt, args)
+
+    async def notifications_watermark(self) -> int:
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("notifications_watermark.sql", self._prefix)
+
+            result = await conn.execute(stmt)
+            (watermark,) = await result.fetchone()
+
+            return watermark
+
+    async def poll_notifications(
+        self,
+        xmin: int,
+        after: int,
+        channels: list[str],
+        seen: list[int],
+        limit: int,
+    ) -> tuple[int, list[tuple[int, str, str, int]]]:
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("poll_notifications.sql", self._prefix)
+            args = {
+                "xmin": xmin,
+                "after": after,
+                "channels": channels,
+                "seen": seen,
+                "limit": limit,
+            }
+
+            result = await conn.execute(stmt, args)
+            rows = await result.fetchall()
+
+            # The snapshot's xmin is on every row, including the single empty row when nothing
+            # matched
+            xmin = rows[0][0]
+
+            return xmin, [tuple(row[1:]) for row in rows if row[1] is not None]
+
+    async def prune_notifications(self, watermark: int) -> int:
+        async with self._pool.connection() as conn:
+            stmt = self._load_file("prune_notifications.sql", self._prefix)
+
+            result = await conn.execute(stmt, {"watermark": watermark})
+
+            return result.rowcount
@@ -10,6 +10,7 @@ from ._looper import Looper
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from ._lifeline import Lifeline
     from ._producer import Producer
     from ._leader import Leader
     from ._query import Query
@@ -22,10 +23,12 @@ class Refresher(Looper):
         query: Query,
         leader: Leader,
         producers: dict[str, Producer],
+        lifeline: Lifeline | None = None,
         interval: float = 15.0,
         max_age: float = 60.0,
     ) -> None:
         self._leader = leader
+        self._lifeline = lifeline
         self._interval = interval
         self._max_age = max_age
         self._producers = producers
@@ -73,14 +76,26 @@ class Refresher(Looper):
 
     async def _refresh(self) -> None:
         with telemetry.span("oban.refresher.refresh", {}) as context:
-            uuids = [producer._uuid for producer in self._producers.values()]
+            producers = list(self._producers.values())
+            uuids = [producer._uuid for producer in producers]
 
             if uuids:
                 refreshed = await self._query.refresh_producers(uuids)
             else:
-                refreshed = 0
+                refreshed = []
 
-            context.add({"refreshed_count": refreshed})
+            # A running producer whose record was cleaned up would have its jobs rescued as
+            # orphans, so it's recorded again right away
+            missing = [
+                producer for producer in producers if producer._uuid not in refreshed
+            ]
+
+            for producer in missing:
+                await producer.register()
+
+            context.add(
+                {"refreshed_count": len(refreshed), "registered_count": len(missing)}
+            )
 
     async def _cleanup(self) -> None:
         if not self._leader.is_leader:
@@ -90,3 +105,6 @@ class Refresher(Looper):
             cleaned_up = await self._query.cleanup_expired_producers(self._max_age)
 
             context.add({"cleanup_count": cleaned_up})
+
+        if cleaned_up and self._lifeline:
+            self._lifeline.notify()
@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import logging
 import re
-from dataclasses import dataclass
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone, tzinfo
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 from zoneinfo import ZoneInfo
 
 import orjson
 
 from . import telemetry
 from ._looper import Looper
+from ._stager import insert_channel
 from .worker import worker_name
 
 logger = logging.getLogger(__name__)
@@ -48,12 +51,21 @@ MON_ALIASES = {
     "DEC": "12",
 }
 
+SEC_SET = frozenset(range(0, 60))
 MIN_SET = frozenset(range(0, 60))
 HRS_SET = frozenset(range(0, 24))
 DAY_SET = frozenset(range(1, 32))
 MON_SET = frozenset(range(1, 13))
 DOW_SET = frozenset(range(0, 8))  # 0-7, both 0 and 7 mean Sunday
 
+# Runs of six-field expressions are inserted this many seconds early as scheduled jobs, so they're
+# staged exactly on time rather than after the insert completes.
+SECONDS_LEAD = 1.0
+
+# Leap days on a particular weekday can be decades apart, so an expression that doesn't fire within
+# this many years never will.
+SEARCH_YEARS = 50
+
 NICKNAMES = {
     "@annually": "0 0 1 1 *",
     "@yearly": "0 0 1 1 *",
@@ -65,6 +77,25 @@ NICKNAMES = {
 }
 
 
+def _to_mask(values: set[int]) -> int:
+    mask = 0
+
+    for value in values:
+        mask |= 1 << value
+
+    return mask
+
+
+def _next_bit(mask: int, start: int) -> int | None:
+    """Find the lowest set bit at or above start, if any."""
+    shifted = mask >> start
+
+    if not shifted:
+        return None
+
+    return start + (shifted & -shifted).bit_length() - 1
+
+
 def cron_hash(expression: str, worker: str, opts: dict) -> str:
     opts_bytes = orjson.dumps(opts, option=orjson.OPT_SORT_KEYS)
     data = f"{expression}:{worker}:".encode() + opts_bytes
@@ -82,6 +113,10 @@ class ScheduledEntry:
 
 _scheduled_entries: list[ScheduledEntry] = []
 
+# Incremented whenever the registered entries change, so schedulers know to rebuild their queue of
+# upcoming runs.
+_scheduled_version = 0
+
 
 def scheduled_entries() -> list[ScheduledEntry]:
     """Return a copy of all registered scheduled entries.
@@ -101,7 +136,10 @@ def scheduled_entries() -> list[ScheduledEntry]:
 
 def clear_scheduled() -> None:
     """Clear all registered scheduled entries."""
+    global _scheduled_version
+
     _scheduled_entries.clear()
+    _scheduled_version += 1
 
 
 def register_scheduled(cron: str | dict, worker_cls: type) -> None:
@@ -128,20 +166,48 @@ def register_scheduled(cron: str | dict, worker_cls: type) -> None:
         tz_name = cron.get("timezone")
         tz = ZoneInfo(tz_name) if tz_name else None
 
+    global _scheduled_version
+
     parsed = Expression.parse(expression)
     entry = ScheduledEntry(expression=parsed, worker_cls=worker_cls, timezone=tz)
 
     _scheduled_entries.append(entry)
+    _scheduled_version += 1
 
 
 @dataclass(slots=True, frozen=True)
 class Expression:
+    """A parsed cron expression.
+
+    Each field is kept as a set of allowed values and compiled into a bitmask, where bit `n` is set
+    when value `n` is allowed. Matching and computing upcoming runs only test and scan bits.
+
+    Five-field expressions fire at the start of a minute. Six-field expressions lead with a
+    seconds field and have `has_seconds` set.
+    """
+
     input: str
     minutes: set
     hours: set
     days: set
     months: set
     weekdays: set
+    seconds: set = field(default_factory=lambda: {0})
+    has_seconds: bool = False
+    second_mask: int = field(init=False, repr=False, compare=False)
+    minute_mask: int = field(init=False, repr=False, compare=False)
+    hour_mask: int = field(init=False, repr=False, compare=False)
+    day_mask: int = field(init=False, repr=False, compare=False)
+    month_mask: int = field(init=False, repr=False, compare=False)
+    weekday_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "second_mask", _to_mask(self.seconds))
+        object.__setattr__(self, "minute_mask", _to_mask(self.minutes))
+        object.__setattr__(self, "hour_mask", _to_mask(self.hours))
+        object.__setattr__(self, "day_mask", _to_mask(self.days))
+        object.__setattr__(self, "month_mask", _to_mask(self.months))
+        object.__setattr__(self, "weekday_mask", _to_mask(self.weekdays))
 
     @staticmethod
     def _replace_aliases(expression: str, aliases: dict[str, str]) -> str:
@@ -219,7 +285,8 @@ class Expression:
         """Parse a crontab expression into an Expression object.
 
         Supports standard cron syntax with five fields: minute, hour, day, month,
-        weekday. Each field can contain:
+        weekday. An optional leading sixth field sets the second within the minute.
+        Each field can contain:
 
         - Literal values: "5"
         - Wildcards: "*"
@@ -250,10 +317,22 @@ class Expression:
             >>> Expression.parse("*/15 * * * *") # Every 15 minutes
             >>> Expression.parse("0 9-17 * * MON-FRI") # 9am-5pm on weekdays
             >>> Expression.parse("@hourly") # Every hour
+            >>> Expression.parse("*/10 * * * * *") # Every 10 seconds
         """
         normalized = NICKNAMES.get(expression, expression)
+        parts = re.split(r"\s+", normalized)
 
-        match re.split(r"\s+", normalized):
+        if len(parts) == 6:
+            (sec_part, *parts) = parts
+
+            return replace(
+                cls.parse(" ".join(parts)),
+                input=expression,
+                seconds=cls._parse_field(sec_part, SEC_SET),
+                has_seconds=True,
+            )
+
+        match parts:
             case [min_part, hrs_part, day_part, mon_part, dow_part]:
                 mon_part = cls._replace_aliases(mon_part, MON_ALIASES)
                 dow_part = cls._replace_aliases(dow_part, DOW_ALIASES)
@@ -277,25 +356,159 @@ class Expression:
         """Check whether a cron expression matches the current date and time."""
         time = time or datetime.now(timezone.utc)
 
-        return (
-            time.isoweekday() % 7 in self.weekdays
-            and time.month in self.months
-            and time.day in self.days
-            and time.hour in self.hours
-            and time.minute in self.minutes
+        if self.has_seconds and not self.second_mask >> time.second & 1:
+            return False
+
+        return bool(
+            self.weekday_mask >> (time.isoweekday() % 7) & 1
+            and self.month_mask >> time.month & 1
+            and self.day_mask >> time.day & 1
+            and self.hour_mask >> time.hour & 1
+            and self.minute_mask >> time.minute & 1
         )
 
+    def next_at(
+        self, after: None | datetime = None, tz: None | tzinfo = None
+    ) -> datetime | None:
+        """Find the next time the expression fires, strictly after the given time.
+
+        Fields are matched against wall-clock time in the given timezone. Times that don't exist
+        locally, such as those skipped when daylight saving time starts, are passed over.
+
+        Args:
+            after: The time to search from, defaults to now. Naive times are treated as being in
+                   `tz`.
+            tz: The timezone to evaluate the expression in, defaults to the timezone of `after`,
+                or UTC.
+
+        Returns:
+            The next fire time as an aware datetime in `tz`, or None if the expression can never
+            fire, e.g. "0 0 30 2 *"
+
+        Examples:
+            >>> expr = Expression.parse("0 9 * * MON-FRI")
+            >>> expr.next_at(datetime(2025, 10, 11, tzinfo=timezone.utc))
+            datetime.datetime(2025, 10, 13, 9, 0, tzinfo=datetime.timezone.utc)
+        """
+        after = after or datetime.now(timezone.utc)
+        tz = tz or after.tzinfo or timezone.utc
+
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=tz)
+
+        local = after.astimezone(tz).replace(tzinfo=None, microsecond=0)
+
+        time = local + timedelta(seconds=1)
+        limit = time.year + SEARCH_YEARS
+
+        while time.year <= limit:
+            if not self.month_mask >> time.month & 1:
+                month = _next_bit(self.month_mask, time.month + 1)
+
+                if month is None:
+                    time = datetime(time.year + 1, 1, 1)
+                else:
+                    time = datetime(time.year, month, 1)
+
+                continue
+
+            if not (
+                self.day_mask >> time.day & 1
+                and self.weekday_mask >> (time.isoweekday() % 7) & 1
+            ):
+                time = datetime(time.year, time.month, time.day) + timedelta(days=1)
+                continue
+
+            if not self.hour_mask >> time.hour & 1:
+                hour = _next_bit(self.hour_mask, time.hour + 1)
+
+                if hour is None:
+                    time = datetime(time.year, time.month, time.day) + timedelta(days=1)
+                else:
+                    time = time.replace(hour=hour, minute=0, second=0)
+
+                continue
+
+            if not self.minute_mask >> time.minute & 1:
+                minute = _next_bit(self.minute_mask, time.minute + 1)
+
+                if minute is None:
+                    time = time.replace(minute=0, second=0) + timedelta(hours=1)
+                else:
+                    time = time.replace(minute=minute, second=0)
+
+                continue
+
+            if not self.second_mask >> time.second & 1:
+                second = _next_bit(self.second_mask, time.second + 1)
+
+                if second is None:
+                    time = time.replace(second=0) + timedelta(minutes=1)
+                else:
+                    time = time.replace(second=second)
+
+                continue
+
+            candidate = time.replace(tzinfo=tz)
+
+            # Wall-clock times that don't exist in the zone change when round-tripped through UTC
+            if (
+                candidate.astimezone(timezone.utc).astimezone(tz).replace(tzinfo=None)
+                == time
+            ):
+                return candidate
+
+            time += timedelta(seconds=1)
+
+        return None
+
+    def iter_next(
+        self, n: int, after: None | datetime = None, tz: None | tzinfo = None
+    ) -> Iterator[datetime]:
+        """Iterate over the next `n` times the expression fires after the given time.
+
+        Accepts the same `after` and `tz` arguments as `next_at`, and stops early when the
+        expression can't fire again.
+
+        Example:
+            >>> [time.hour for time in Expression.parse("0 */6 * * *").iter_next(4, start)]
+            [0, 6, 12, 18]
+        """
+        time = after
+
+        for _ in range(n):
+            time = self.next_at(time, tz)
+
+            if time is None:
+                return
+
+            yield time
+
 
 class Scheduler(Looper):
     """Manages periodic job scheduling based on cron expressions.
 
+    Upcoming runs are kept in a heap ordered by next fire time, so each evaluation only touches
+    the entries that are due. The heap is rebuilt whenever entries are registered or cleared.
+
+    Evaluation happens at the start of each minute, or at the next due second when six-field
+    expressions are registered. Their jobs are inserted slightly ahead with an exact
+    `scheduled_at`, so they become available on time.
+
+    Runs are only inserted by the leader, so runs are missed when leadership changes hands or the
+    leader stalls. Setting `catch_up_window` to a number of seconds enables catching up: the last
+    run of each entry is recorded in the `oban_crons` table, and runs missed within the window are
+    inserted when a node becomes leader or resumes after a stall. At most `catch_up_limit` missed
+    runs, the most recent ones, are inserted per evaluation. Entries that have never run have
+    nothing to catch up.
+
     This class is managed internally by Oban and shouldn't be constructed directly.
     Instead, configure scheduling via the Oban constructor:
 
         >>> async with Oban(
         ...     conn=conn,
         ...     queues={"default": 10},
-        ...     scheduler={"timezone": "America/Chicago"}
+        ...     scheduler={"timezone": "America/Chicago", "catch_up_window": 3600}
         ... ) as oban:
         ...     # Scheduler runs automatically in the background
     """
@@ -307,14 +520,39 @@ class Scheduler(Looper):
         notifier: Notifier,
         query: Query,
         timezone: str = "UTC",
+        catch_up_window: float = 0.0,
+        catch_up_limit: int = 100,
+        insert_shards: int | None = None,
     ) -> None:
         self._leader = leader
         self._notifier = notifier
         self._query = query
         self._timezone = ZoneInfo(timezone)
+        self._catch_up_window = catch_up_window
+        self._catch_up_limit = catch_up_limit
+        self._insert_shards = insert_shards
+
+        self._validate(catch_up_window=catch_up_window, catch_up_limit=catch_up_limit)
 
         self._loop_task = None
-        self._last_evaluated_minute = None
+        self._last_evaluated_at = None
+        self._was_leader = False
+        self._heap = []
+        self._heap_version = None
+
+    @staticmethod
+    def _validate(*, catch_up_window: float, catch_up_limit: int) -> None:
+        if not isinstance(catch_up_window, (int, float)):
+            raise TypeError(f"catch_up_window must be a number, got {catch_up_window}")
+        if catch_up_window < 0:
+            raise ValueError(
+                f"catch_up_window must be non-negative, got {catch_up_window}"
+            )
+
+        if not isinstance(catch_up_limit, int):
+            raise TypeError(f"catch_up_limit must be an integer, got {catch_up_limit}")
+        if catch_up_limit <= 0:
+            raise ValueError(f"catch_up_limit must be positive, got {catch_up_limit}")
 
     async def start(self) -> None:
         self._loop_task = asyncio.create_task(self._loop(), name="oban-cron")
@@ -333,66 +571,205 @@ class Scheduler(Looper):
     async def _loop(self) -> None:
         while True:
             try:
-                await asyncio.sleep(self._time_to_next_minute())
+                await asyncio.sleep(self._time_to_next_run())
 
                 if self._leader.is_leader:
-                    now = datetime.now(timezone.utc)
-                    minute_key = (now.year, now.month, now.day, now.hour, now.minute)
+                    now = datetime.now(timezone.utc).replace(microsecond=0)
 
                     # Guard against backward wall-clock steps (NTP, VM resume) re-entering
-                    # a minute we've already evaluated on this leader.
-                    if minute_key == self._last_evaluated_minute:
+                    # a second we've already evaluated on this leader.
+                    if now == self._last_evaluated_at:
                         continue
 
-                    self._last_evaluated_minute = minute_key
-                    await self._evaluate()
+                    self._last_evaluated_at = now
+                    await self._evaluate(now, catch_up=not self._was_leader)
+                    self._was_leader = True
+                else:
+                    self._was_leader = False
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error in scheduler")
 
-    async def _evaluate(self) -> None:
+    async def _evaluate(
+        self, now: None | datetime = None, catch_up: bool = False
+    ) -> None:
+        now = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+
         with telemetry.span("oban.scheduler.evaluate", {}) as context:
-            jobs = [
-                self._build_job(entry)
-                for entry in _scheduled_entries
-                if self._is_now(entry)
-            ]
+            missed = []
+
+            if catch_up and self._catch_up_window > 0:
+                # Runs queued before gaining leadership are superseded by the recorded ones
+                self._heap_version = None
 
-            context.add({"enqueued_count": len(jobs)})
+                missed.extend(await self._missed_runs(now))
+
+            (due, stalled) = self._pop_due(now)
+
+            missed.extend(stalled)
+            missed.sort(key=lambda run: run[1])
+
+            runs = missed[-self._catch_up_limit :] + due
+            jobs = [self._build_job(entry, fire_at) for (entry, fire_at) in runs]
+
+            context.add({"enqueued_count": 0, "missed_count": len(missed)})
 
             if jobs:
+                # Runs are unique by cron name and time, so runs that another node already
+                # inserted, e.g. around a leadership change, are skipped by the database.
                 result = await self._query.insert_jobs(jobs)
-                queues = {job.queue for job in result}
 
-                await self._notifier.notify(
-                    "insert", [{"queue": queue} for queue in queues]
-                )
+                context.add({"enqueued_count": len(result)})
+
+                if self._catch_up_window > 0:
+                    await self._query.record_cron_runs(
+                        {
+                            job.meta["cron_name"]: fire_at
+                            for (job, (_, fire_at)) in zip(jobs, runs)
+                        }
+                    )
+
+                # Stagers only listen on the channels for their own queues when inserts are
+                # sharded, so each queue is notified on its own channel
+                channels = defaultdict(list)
+
+                for queue in {job.queue for job in result}:
+                    channels[insert_channel(queue, self._insert_shards)].append(
+                        {"queue": queue}
+                    )
+
+                for channel, payloads in channels.items():
+                    await self._notifier.notify(channel, payloads)
+
+    def _pop_due(
+        self, now: datetime
+    ) -> tuple[
+        list[tuple[ScheduledEntry, datetime]], list[tuple[ScheduledEntry, datetime]]
+    ]:
+        if self._heap_version != _scheduled_version:
+            self._rebuild(now)
+
+        due = []
+        missed = []
+        minute = now.replace(second=0)
+        floor = now - timedelta(seconds=self._catch_up_window)
 
-    def _is_now(self, entry: ScheduledEntry) -> bool:
-        now = datetime.now(entry.timezone or self._timezone)
+        while self._heap and self._heap[0][0] <= now:
+            (insert_at, index, entry, fire_at) = heapq.heappop(self._heap)
 
-        return entry.expression.is_now(now)
+            # Runs from before this minute were missed because evaluation stalled, and are only
+            # kept within the catch up window
+            if insert_at >= minute:
+                due.append((entry, fire_at))
+                self._push(entry, index, fire_at)
+            elif fire_at >= floor:
+                missed.append((entry, fire_at))
+                self._push(entry, index, fire_at)
+            else:
+                self._push(entry, index, max(fire_at, floor - timedelta(seconds=1)))
 
-    def _build_job(self, entry: ScheduledEntry) -> Job:
-        work_name = worker_name(entry.worker_cls)
+        return (due, missed)
+
+    async def _missed_runs(
+        self, now: datetime
+    ) -> list[tuple[ScheduledEntry, datetime]]:
+        entries = {self._cron_name(entry): entry for entry in _scheduled_entries}
+
+        if not entries:
+            return []
+
+        last_runs = await self._query.cron_last_runs(list(entries.keys()))
+        floor = now - timedelta(seconds=self._catch_up_window)
+        missed = []
+
+        for name, last_at in last_runs.items():
+            entry = entries[name]
+            tz = entry.timezone or self._timezone
+
+            # Walk the whole window and keep only the most recent runs, the same ones a stall
+            # within the process would insert
+            recent = deque(maxlen=self._catch_up_limit)
+            fire_at = max(last_at, floor - timedelta(seconds=1))
+
+            while (fire_at := entry.expression.next_at(fire_at, tz)) is not None:
+                fire_at = fire_at.astimezone(timezone.utc)
+
+                if fire_at >= now:
+                    break
+
+                if fire_at >= floor:
+                    recent.append((entry, fire_at))
+
+            missed.extend(recent)
+
+        return missed
+
+    def _rebuild(self, now: datetime) -> None:
+        self._heap = []
+        self._heap_version = _scheduled_version
+
+        # Start just before the current minute, or second for six-field expressions, so entries
+        # that fire now are due right away
+        for index, entry in enumerate(_scheduled_entries):
+            if entry.expression.has_seconds:
+                after = now - timedelta(seconds=1)
+            else:
+                after = now.replace(second=0) - timedelta(seconds=1)
+
+            self._push(entry, index, after)
+
+    def _push(self, entry: ScheduledEntry, index: int, after: datetime) -> None:
+        tz = entry.timezone or self._timezone
+        fire_at = entry.expression.next_at(after, tz)
+
+        if fire_at is None:
+            return
+
+        fire_at = fire_at.astimezone(timezone.utc)
+        insert_at = fire_at
+
+        if entry.expression.has_seconds:
+            insert_at -= timedelta(seconds=SECONDS_LEAD)
+
+        heapq.heappush(self._heap, (insert_at, index, entry, fire_at))
+
+    def _cron_name(self, entry: ScheduledEntry) -> str:
         opts = {}
 
         if entry.timezone:
             opts["timezone"] = str(entry.timezone)
 
-        cron_name = cron_hash(entry.expression.input, work_name, opts)
+        return cron_hash(entry.expression.input, worker_name(entry.worker_cls), opts)
 
+    def _build_job(self, entry: ScheduledEntry, fire_at: datetime) -> Job:
         job = entry.worker_cls.new()  # type: ignore[attr-defined]
 
+        if entry.expression.has_seconds:
+            job.scheduled_at = fire_at
+
         job.meta = {
             "cron": True,
+            "cron_at": fire_at.isoformat(),
             "cron_expr": entry.expression.input,
-            "cron_name": cron_name,
+            "cron_name": self._cron_name(entry),
         }
 
         return job
 
+    def _time_to_next_run(self, time: None | datetime = None) -> float:
+        time = time or datetime.now(timezone.utc)
+        delay = self._time_to_next_minute(time)
+
+        if (
+            self._leader.is_leader
+            and self._heap
+            and self._heap_version == _scheduled_version
+        ):
+            delay = min(delay, (self._heap[0][0] - time).total_seconds())
+
+        return max(delay, 0.0)
+
     def _time_to_next_minute(self, time: None | datetime = None) -> float:
         time = time or datetime.now(timezone.utc)
         next_minute = (time + timedelta(minutes=1)).replace(second=0, microsecond=0)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import math
 from typing import TYPE_CHECKING
 
 from . import telemetry
@@ -11,21 +13,58 @@ from ._looper import Looper
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from ._leader import Leader
     from ._notifier import Notifier
     from ._producer import Producer
     from ._query import Query
 
+MODES = ("global", "local")
+
+# Number of intervals without a broadcast from the leader before a node considers notifications
+# unhealthy and falls back to staging its own queues.
+MISSED_BROADCASTS = 3
+
+
+def insert_channel(queue: str, shards: int | None) -> str:
+    """Get the channel that insert notifications for a queue are published on.
+
+    Without shards every queue shares the "insert" channel. With shards, queues are spread over
+    "insert_0" through "insert_{shards - 1}" by a hash that matches the one used in SQL.
+    """
+    if shards is None:
+        return "insert"
+
+    digest = hashlib.md5(queue.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    return f"insert_{int(digest[:7], 16) % shards}"
+
 
 class Stager(Looper):
     """Manages moving jobs to the 'available' state and notifying queues.
 
+    Rather than polling on a fixed period, the stager tracks when the next scheduled or retryable
+    job is due and sleeps until then, never longer than `interval`. Inserts of scheduled jobs
+    that are due within `interval` wake it early when they're due sooner than the job it's
+    waiting on.
+
+    Staging runs in one of two modes:
+
+    - local: Every node stages jobs for its own queues. This is the default.
+    - global: Only the leader stages jobs, for every queue with a running producer, and then
+      broadcasts the active queues to all nodes. Other nodes fall back to staging their own
+      queues when they stop receiving broadcasts, e.g. because notifications are unavailable.
+
+    Insert notifications are published on a single channel by default. Setting `shards` spreads
+    them over that many channels by queue, and each node only listens on the channels for its own
+    queues. Every node and client sharing a database must use the same number of shards.
+
     This class is managed internally by Oban and shouldn't be constructed directly.
     Instead, configure staging via the Oban constructor:
 
         >>> async with Oban(
         ...     conn=conn,
         ...     queues={"default": 10},
-        ...     stager={"interval": 1.0, "limit": 20_000}
+        ...     stager={"interval": 1.0, "limit": 20_000, "mode": "global"}
         ... ) as oban:
         ...     # Stager runs automatically in the background
     """
@@ -34,24 +73,36 @@ class Stager(Looper):
         self,
         *,
         query: Query,
+        leader: Leader,
         notifier: Notifier,
         producers: dict[str, Producer],
         interval: float = 1.0,
         limit: int = 20_000,
+        mode: str = "local",
+        shards: int | None = None,
     ) -> None:
         self._query = query
+        self._leader = leader
         self._notifier = notifier
         self._producers = producers
         self._interval = interval
         self._limit = limit
+        self._mode = mode
+        self._shards = shards
 
         self._loop_task = None
-        self._listen_token = None
+        self._insert_tokens = {}
+        self._listen_tokens = []
+        self._last_broadcast = -math.inf
+        self._next_due = math.inf
+        self._wakeup = asyncio.Event()
 
-        self._validate(interval=interval, limit=limit)
+        self._validate(interval=interval, limit=limit, mode=mode, shards=shards)
 
     @staticmethod
-    def _validate(*, interval: float, limit: int) -> None:
+    def _validate(
+        *, interval: float, limit: int, mode: str = "local", shards: int | None = None
+    ) -> None:
         if not isinstance(interval, (int, float)):
             raise TypeError(f"interval must be a number, got {interval}")
         if interval <= 0:
@@ -62,15 +113,30 @@ class Stager(Looper):
         if limit <= 0:
             raise ValueError(f"limit must be positive, got {limit}")
 
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode}")
+
+        if shards is not None:
+            if not isinstance(shards, int):
+                raise TypeError(f"shards must be an integer, got {shards}")
+            if shards <= 0:
+                raise ValueError(f"shards must be positive, got {shards}")
+
     async def start(self) -> None:
-        self._listen_token = await self._notifier.listen(
-            "insert", self._on_notification, wait=False
-        )
+        await self.sync_channels()
+
+        if self._mode == "global":
+            self._listen_tokens.append(
+                await self._notifier.listen("stager", self._on_broadcast, wait=False)
+            )
+
         self._loop_task = asyncio.create_task(self._loop(), name="oban-stager")
 
     async def stop(self) -> None:
-        if self._listen_token:
-            await self._notifier.unlisten(self._listen_token)
+        for token in [*self._insert_tokens.values(), *self._listen_tokens]:
+            await self._notifier.unlisten(token)
+
+        self._insert_tokens.clear()
 
         if self._loop_task:
             self._loop_task.cancel()
@@ -79,6 +145,24 @@ class Stager(Looper):
             except asyncio.CancelledError:
                 pass
 
+    async def sync_channels(self) -> None:
+        """Listen on the insert channels for the current producers, and only those.
+
+        Called on start and whenever queues are started or stopped at runtime.
+        """
+        if self._shards is None:
+            wanted = {"insert"}
+        else:
+            wanted = {insert_channel(queue, self._shards) for queue in self._producers}
+
+        for channel in wanted - self._insert_tokens.keys():
+            self._insert_tokens[channel] = await self._notifier.listen(
+                channel, self._on_notification, wait=False
+            )
+
+        for channel in self._insert_tokens.keys() - wanted:
+            await self._notifier.unlisten(self._insert_tokens.pop(channel))
+
     async def _loop(self) -> None:
         while True:
             try:
@@ -88,26 +172,104 @@ class Stager(Looper):
             except Exception as error:
                 logger.warning("Stager failed to stage jobs: %s", error, exc_info=True)
 
-            await asyncio.sleep(self._interval)
+            await self._wait()
 
-    async def _on_notification(self, channel: str, payload: dict) -> None:
-        queue = payload["queue"]
+    async def _wait(self) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._interval
+
+        while (timeout := min(deadline, self._next_due) - loop.time()) > 0:
+            self._wakeup.clear()
 
-        if queue in self._producers:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+
+    def _wake_in(self, delay: float) -> None:
+        due = asyncio.get_running_loop().time() + max(delay, 0.0)
+
+        if due < self._next_due:
+            self._next_due = due
+            self._wakeup.set()
+
+    def _is_global(self) -> bool:
+        return self._mode == "global" and self._leader.is_leader
+
+    def _is_receiving(self) -> bool:
+        elapsed = asyncio.get_running_loop().time() - self._last_broadcast
+
+        return elapsed <= self._interval * MISSED_BROADCASTS
+
+    def notify_insert(self, queue: str, scheduled_in: float | None = None) -> None:
+        """Signal that a job was inserted into `queue`.
+
+        Available jobs wake the queue's producer right away, while scheduled ones bring the next
+        staging pass forward to `scheduled_in` seconds from now.
+        """
+        if scheduled_in is not None:
+            if self._is_global() or queue in self._producers:
+                self._wake_in(scheduled_in)
+        elif queue in self._producers:
             self._producers[queue].notify()
 
+    async def _on_notification(self, channel: str, payload: dict) -> None:
+        if "scheduled_in" in payload or "scheduled" in payload:
+            # Notifications from the database only mark a job due within the interval, so an
+            # immediate pass finds when it's due and waits until then
+            self.notify_insert(payload["queue"], payload.get("scheduled_in", 0.0))
+        else:
+            self.notify_insert(payload["queue"])
+
+    async def _on_broadcast(self, channel: str, payload: dict) -> None:
+        self._last_broadcast = asyncio.get_running_loop().time()
+
+        self._notify_producers(payload["queues"])
+
+    def _notify_producers(self, queues: list[str]) -> None:
+        # Insert notifications are sent with pg_notify, so with a notifier that can't deliver
+        # them every local queue checks for available jobs on each pass instead.
+        if not getattr(self._notifier, "delivers_sql_notifications", False):
+            queues = list(self._producers.keys())
+
+        for queue in queues:
+            if queue in self._producers:
+                self._producers[queue].notify()
+
     async def _noop(self, _query) -> None:
         pass
 
     async def _stage(self) -> None:
+        # Reset before querying so a failed stage falls back to the full interval, while any
+        # insert hints that arrive during the query are still respected afterwards.
+        self._next_due = math.inf
+
+        if (
+            self._mode == "global"
+            and not self._leader.is_leader
+            and self._is_receiving()
+        ):
+            return
+
         await use_ext("stager.before_stage", self._noop, self._query)
 
-        with telemetry.span("oban.stager.stage", {}) as context:
-            queues = list(self._producers.keys())
+        is_global = self._is_global()
+
+        with telemetry.span("oban.stager.stage", {"global": is_global}) as context:
+            queues = None if is_global else list(self._producers.keys())
 
-            (staged, active) = await self._query.stage_jobs(self._limit, queues)
+            (staged, active, next_in) = await self._query.stage_jobs(
+                self._limit, queues
+            )
 
             context.add({"staged_count": staged, "available_queues": active})
 
-            for queue in active:
-                self._producers[queue].notify()
+            if is_global:
+                await self._notifier.notify("stager", {"queues": active})
+
+            self._notify_producers(active)
+
+        if staged >= self._limit:
+            self._wake_in(0.0)
+        elif next_in is not None:
+            self._wake_in(next_in)
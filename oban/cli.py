@@ -11,6 +11,7 @@ import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, AsyncIterator
+from zoneinfo import ZoneInfo
 
 import click
 import orjson
@@ -19,11 +20,13 @@ from psycopg_pool import AsyncConnectionPool
 
 from oban import __version__
 from oban._config import Config
+from oban._scheduler import scheduled_entries
 from oban.schema import (
     install as install_schema,
     uninstall as uninstall_schema,
 )
 from oban.telemetry import logger as telemetry_logger
+from oban.worker import worker_name
 
 try:
     from uvloop import run as asyncio_run
@@ -252,7 +255,15 @@ def version() -> None:
     envvar="OBAN_PREFIX",
     help="PostgreSQL schema name (default: public)",
 )
-def install(config: str | None, dsn: str | None, prefix: str | None) -> None:
+@click.option(
+    "--partitioned",
+    is_flag=True,
+    default=False,
+    help="Partition the jobs table so finished jobs are pruned by dropping partitions",
+)
+def install(
+    config: str | None, dsn: str | None, prefix: str | None, partitioned: bool
+) -> None:
     """Install the Oban database schema."""
 
     async def run() -> None:
@@ -263,7 +274,9 @@ def install(config: str | None, dsn: str | None, prefix: str | None) -> None:
 
         try:
             async with schema_pool(conf.dsn) as pool:
-                await install_schema(pool, prefix=schema_prefix)
+                await install_schema(
+                    pool, prefix=schema_prefix, partitioned=partitioned
+                )
             logger.info("Schema installed successfully")
         except Exception:
             logger.exception("Failed to install schema")
@@ -442,6 +455,61 @@ def start(
     asyncio_run(run())
 
 
+@main.group()
+def cron() -> None:
+    """Inspect cron scheduled workers."""
+    pass
+
+
+@cron.command("list")
+@click.option(
+    "--cron-modules",
+    envvar="OBAN_CRON_MODULES",
+    help="Comma-separated list of module paths with cron workers (e.g., 'myapp.workers,myapp.jobs')",
+)
+@click.option(
+    "--cron-paths",
+    envvar="OBAN_CRON_PATHS",
+    help="Comma-separated list of directories to search for cron workers (e.g., 'myapp/workers')",
+)
+@click.option(
+    "--timezone",
+    default="UTC",
+    help="Timezone for entries without their own (default: UTC)",
+)
+@click.option(
+    "--count",
+    type=click.IntRange(min=1),
+    default=3,
+    help="Number of upcoming runs to show per entry (default: 3)",
+)
+def list_cron(
+    cron_modules: str | None, cron_paths: str | None, timezone: str, count: int
+) -> None:
+    """List cron scheduled workers and their upcoming runs.
+
+    Examples:
+
+        # Show the next 5 runs for workers in a module
+        oban cron list --cron-modules myapp.workers --count 5
+    """
+    _find_and_load_cron_modules(
+        cron_modules=_split_csv(cron_modules),
+        cron_paths=_split_csv(cron_paths),
+    )
+
+    default_tz = ZoneInfo(timezone)
+
+    for entry in scheduled_entries():
+        tz = entry.timezone or default_tz
+        runs = [time.isoformat() for time in entry.expression.iter_next(count, tz=tz)]
+
+        click.echo(
+            f"{entry.expression.input}\t{worker_name(entry.worker_cls)}\t{tz}\t"
+            + (", ".join(runs) or "never")
+        )
+
+
 def _load_conf(conf_path: str | None, params: Any) -> Config:
     if conf_path and not Path(conf_path).exists():
         raise click.UsageError(f"--config file '{conf_path}' doesn't exist")
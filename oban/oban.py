@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import socket
 from collections.abc import Iterable
+from datetime import datetime, timezone
 from typing import Any, Callable
 
 from psycopg_pool import AsyncConnectionPool
@@ -17,7 +18,13 @@ from .job import Job
 from ._leader import Leader
 from ._lifeline import Lifeline
 from ._metrics import Metrics
-from ._notifier import Notifier, PostgresNotifier
+from ._notifier import (
+    HybridNotifier,
+    MemoryNotifier,
+    Notifier,
+    PollingNotifier,
+    PostgresNotifier,
+)
 from ._producer import Producer, QueueInfo
 from ._pruner import Pruner
 from ._query import ConnectionLike, Query
@@ -36,12 +43,12 @@ class Oban:
         *,
         pool: Any,
         dispatcher: Any = None,
-        leadership: bool | None = None,
+        leadership: dict[str, Any] | bool | None = None,
         lifeline: dict[str, Any] = {},
         metrics: dict[str, Any] | bool | None = None,
         name: str | None = None,
         node: str | None = None,
-        notifier: Notifier | None = None,
+        notifier: Notifier | str | None = None,
         prefix: str | None = None,
         pruner: dict[str, Any] = {},
         queues: dict[str, QueueConfig] | None = None,
@@ -60,20 +67,43 @@ class Oban:
 
         Args:
             pool: Database connection pool (e.g., AsyncConnectionPool)
-            leadership: Enable leadership election (default: True if queues configured, False otherwise)
-            lifeline: Lifeline config options: interval (default: 60.0)
+            leadership: Enable leadership election (default: True if queues configured, False otherwise).
+                        Pass a dict to enable with options: mode of "table" for elections through
+                        the oban_leaders table or "advisory" for a session advisory lock
+                        (default: "table"), and interval (default: 30.0)
+            lifeline: Lifeline config options: interval (default: 60.0), rescue_after in
+                      seconds for jobs without a recorded producer (default: 300.0), limit of
+                      jobs rescued per batch (default: 5_000), and heartbeat_interval in
+                      seconds for producers to record heartbeats for running jobs, which are
+                      rescued after missing three (default: None, disabled)
             metrics: Metrics broadcasting for Oban Web integration. Disabled by default.
                      Pass True to enable with defaults, or a dict with interval (default: 1.0).
             name: Name for this instance in the registry (default: "oban")
             node: Node identifier for this instance (default: socket.gethostname())
-            notifier: Notifier instance for pub/sub (default: PostgresNotifier with default config)
+            notifier: Notifier instance for pub/sub, or one of "postgres" for LISTEN/NOTIFY,
+                      "polling" for a table-backed notifier that works through PgBouncer in
+                      transaction mode, "memory" for single-node deployments without any
+                      database notifications, or "hybrid" for LISTEN/NOTIFY with immediate
+                      local delivery (default: "postgres")
             prefix: PostgreSQL schema where Oban tables are located (default: "public")
-            pruner: Pruning config options: max_age in seconds (default: 86_400.0, 1 day),
-                    interval (default: 60.0), limit (default: 20_000).
+            pruner: Pruning config options: max_age in seconds, or a dict of ages for the
+                    completed, cancelled, and discarded states (default: 86_400, 1 day),
+                    interval (default: 60.0), limit per batch (default: 20_000), budget in
+                    seconds per run (default: 10.0), max_lock_waits (default: 5), max_lag
+                    in seconds of replication lag (default: 10.0), archive of "table" or
+                    "jsonl" to keep pruned jobs (default: None), archive_path directory for
+                    "jsonl" archives, archive_max_age in seconds to keep jobs in the
+                    archive table (default: None, forever), and rules, a list of dicts with
+                    a max_age for jobs matching a queue, worker, or state (default: []).
             queues: Queue names mapped to worker limits (default: {})
             refresher: Refresher config options: interval (default: 15.0), max_age (default: 60.0)
-            scheduler: Scheduler config options: timezone (default: "UTC")
-            stager: Stager config options: interval (default: 1.0), limit (default: 20_000)
+            scheduler: Scheduler config options: timezone (default: "UTC"), catch_up_window in
+                       seconds to insert runs missed during leader changes or stalls
+                       (default: 0.0, disabled), catch_up_limit (default: 100)
+            stager: Stager config options: interval, the longest time between staging checks
+                    (default: 1.0), limit (default: 20_000), mode of "local" to stage on every
+                    node or "global" to stage on the leader only (default: "local"), and
+                    shards to spread insert notifications over per-queue channels (default: None)
         """
         queues = queues or {}
 
@@ -84,15 +114,35 @@ class Oban:
         self._name = name or "Oban"
         self._node = node or socket.gethostname()
         self._prefix = prefix or "public"
-        self._query = Query(pool, self._prefix)
-
-        self._notifier = notifier or PostgresNotifier(
-            query=self._query, prefix=self._prefix
+        self._query = Query(
+            pool,
+            self._prefix,
+            insert_shards=stager.get("shards"),
+            schedule_horizon=stager.get("interval", 1.0),
         )
 
+        match notifier:
+            case None | "postgres":
+                self._notifier = PostgresNotifier(
+                    query=self._query, prefix=self._prefix
+                )
+            case "polling":
+                self._notifier = PollingNotifier(query=self._query)
+            case "memory":
+                self._notifier = MemoryNotifier()
+            case "hybrid":
+                self._notifier = HybridNotifier(query=self._query, prefix=self._prefix)
+            case str():
+                raise ValueError(f"unknown notifier: {notifier}")
+            case _:
+                self._notifier = notifier
+
+        self._heartbeat_interval = lifeline.get("heartbeat_interval")
+
         self._producers = {
             queue: Producer(
                 dispatcher=self._dispatcher,
+                heartbeat_interval=self._heartbeat_interval,
                 query=self._query,
                 name=self._name,
                 node=self._node,
@@ -103,26 +153,36 @@ class Oban:
             for queue, config in queues.items()
         }
 
+        leader_config = leadership if isinstance(leadership, dict) else {}
+
         self._leader = Leader(
             query=self._query,
             node=self._node,
             name=self._name,
-            enabled=leadership,
+            enabled=bool(leadership),
             notifier=self._notifier,
+            **leader_config,
         )
 
         self._stager = Stager(
             query=self._query,
+            leader=self._leader,
             notifier=self._notifier,
             producers=self._producers,
             **stager,
         )
 
-        self._lifeline = Lifeline(leader=self._leader, query=self._query, **lifeline)
+        self._lifeline = Lifeline(
+            leader=self._leader,
+            query=self._query,
+            producer_max_age=refresher.get("max_age", 60.0),
+            **lifeline,
+        )
         self._pruner = Pruner(leader=self._leader, query=self._query, **pruner)
 
         self._refresher = Refresher(
             leader=self._leader,
+            lifeline=self._lifeline,
             producers=self._producers,
             query=self._query,
             **refresher,
@@ -132,6 +192,7 @@ class Oban:
             leader=self._leader,
             notifier=self._notifier,
             query=self._query,
+            insert_shards=stager.get("shards"),
             **scheduler,
         )
 
@@ -352,7 +413,6 @@ class Oban:
             self._pruner.stop(),
             self._refresher.stop(),
             self._scheduler.stop(),
-            self._notifier.stop(),
         ]
 
         if self._metrics:
@@ -363,13 +423,20 @@ class Oban:
 
         await asyncio.gather(*tasks)
 
+        # Stop the notifier last so that notifications sent while stopping are still delivered
+        await self._notifier.stop()
+
         if self._dispatcher:
             await self._dispatcher.stop()
 
     async def _verify_structure(self) -> None:
         existing = await self._query.verify_structure()
+        required = ["oban_jobs", "oban_leaders", "oban_producers"]
+
+        if await self._query.jobs_partitioned():
+            required.extend(["oban_jobs_active", "oban_jobs_terminal"])
 
-        for table in ["oban_jobs", "oban_leaders", "oban_producers"]:
+        for table in required:
             if table not in existing:
                 raise RuntimeError(
                     f"The '{table}' is missing, run schema installation first."
@@ -461,7 +528,29 @@ class Oban:
 
             return jobs
 
-        return await self._query.insert_jobs(jobs, conn=conn)
+        inserted = await self._query.insert_jobs(jobs, conn=conn)
+
+        # Jobs inserted outside of a caller's transaction are already committed, so local queues
+        # can be woken directly instead of waiting on a notification round trip.
+        if conn is None and isinstance(
+            self._notifier, (HybridNotifier, MemoryNotifier)
+        ):
+            self._notify_local(inserted)
+
+        return inserted
+
+    def _notify_local(self, jobs: list[Job]) -> None:
+        now = datetime.now(timezone.utc)
+
+        for job in jobs:
+            if job.state == "scheduled":
+                scheduled_at = job.scheduled_at.replace(tzinfo=timezone.utc)
+
+                self._stager.notify_insert(
+                    job.queue, (scheduled_at - now).total_seconds()
+                )
+            else:
+                self._stager.notify_insert(job.queue)
 
     async def _execute_inline(self, jobs):
         from .testing import process_job
@@ -475,6 +564,9 @@ class Oban:
     async def get_job(self, job_id: int) -> Job | None:
         """Fetch a job by its ID.
 
+        Jobs that were pruned into the archive table are still found, after checking the
+        jobs table.
+
         Args:
             job_id: The ID of the job to fetch
 
@@ -486,7 +578,12 @@ class Oban:
             >>> if job:
             ...     print(f"Job state: {job.state}")
         """
-        return await self._query.get_job(job_id)
+        job = await self._query.get_job(job_id)
+
+        if job is None:
+            job = await self._query.get_archived_job(job_id)
+
+        return job
 
     async def retry_job(self, job: Job | int) -> None:
         """Retry a job by setting it as available for execution.
@@ -1017,6 +1114,7 @@ class Oban:
 
         producer = Producer(
             dispatcher=self._dispatcher,
+            heartbeat_interval=self._heartbeat_interval,
             query=self._query,
             name=self._name,
             node=self._node,
@@ -1027,6 +1125,7 @@ class Oban:
         self._producers[queue] = producer
 
         await producer.start()
+        await self._stager.sync_channels()
 
     async def stop_queue(self, queue: str, *, node: str | None = None) -> None:
         """Stop a supervised queue.
@@ -1060,6 +1159,7 @@ class Oban:
 
         if producer:
             await producer.stop()
+            await self._stager.sync_channels()
 
     async def scale_queue(
         self, *, queue: str, node: str | None = None, **kwargs: Any
@@ -0,0 +1,41 @@
+INSERT INTO oban_jobs_archive (
+  id,
+  state,
+  queue,
+  worker,
+  attempt,
+  max_attempts,
+  priority,
+  args,
+  meta,
+  tags,
+  errors,
+  attempted_by,
+  inserted_at,
+  scheduled_at,
+  attempted_at,
+  cancelled_at,
+  completed_at,
+  discarded_at
+)
+SELECT
+  id,
+  state,
+  queue,
+  worker,
+  attempt,
+  max_attempts,
+  priority,
+  args,
+  meta,
+  tags,
+  errors,
+  attempted_by,
+  inserted_at,
+  scheduled_at,
+  attempted_at,
+  cancelled_at,
+  completed_at,
+  discarded_at
+FROM
+  deleted
@@ -0,0 +1,2 @@
+SELECT
+  to_regclass('oban_jobs_archive') IS NOT NULL
@@ -0,0 +1 @@
+SELECT pg_advisory_lock(%(key)s)
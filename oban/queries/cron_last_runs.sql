@@ -0,0 +1,7 @@
+SELECT
+  name,
+  last_at
+FROM
+  oban_crons
+WHERE
+  name = ANY(%(names)s)
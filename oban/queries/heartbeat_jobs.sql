@@ -0,0 +1,20 @@
+WITH locked_jobs AS (
+  SELECT
+    id
+  FROM
+    oban_jobs
+  WHERE
+    id = ANY(%(ids)s)
+    AND state = 'executing'
+  ORDER BY
+    id ASC
+  FOR UPDATE SKIP LOCKED
+)
+UPDATE
+  oban_jobs
+SET
+  meta = jsonb_set(meta, '{heartbeat_at}', to_jsonb(timezone('UTC', now())))
+FROM
+  locked_jobs
+WHERE
+  oban_jobs.id = locked_jobs.id
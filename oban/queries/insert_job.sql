@@ -26,10 +26,23 @@ WITH inserted AS (
         %(tags)s,
         %(worker)s
     )
+    ON CONFLICT DO NOTHING
     RETURNING id, inserted_at, queue, scheduled_at, state
 )
 SELECT id, inserted_at, queue, scheduled_at, state,
        CASE WHEN state = 'available'
-            THEN pg_notify('oban_insert', '{"queue":"' || queue || '"}')
+            THEN pg_notify(channel, '{"queue":"' || queue || '"}')
+            -- Only jobs due before the next regular staging pass need to wake the stager early,
+            -- and identical payloads for a queue are folded into one notification per commit
+            WHEN state = 'scheduled'
+                 AND scheduled_at <= timezone('UTC', now()) + make_interval(secs => %(horizon)s)
+            THEN pg_notify(channel, '{"queue":"' || queue || '","scheduled":true}')
        END
-FROM inserted;
+FROM
+    inserted,
+    LATERAL (
+        SELECT 'oban_insert' || coalesce(
+            '_' || mod(('x' || left(md5(queue), 7))::bit(28)::int, %(shards)s::int),
+            ''
+        ) AS channel
+    ) AS notify;
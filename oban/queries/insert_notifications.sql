@@ -0,0 +1,3 @@
+INSERT INTO oban_notifications (channel, payload)
+SELECT channel, payload
+FROM unnest(%(channels)s::text[], %(payloads)s::text[]) AS t(channel, payload)
@@ -39,33 +39,6 @@ $$;
 
 -- Tables
 
-CREATE TABLE IF NOT EXISTS oban_jobs (
-    id BIGINT PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
-    state oban_job_state NOT NULL DEFAULT 'available',
-    queue text NOT NULL DEFAULT 'default',
-    worker text NOT NULL,
-    attempt smallint NOT NULL DEFAULT 0,
-    max_attempts smallint NOT NULL DEFAULT 20,
-    priority smallint NOT NULL DEFAULT 0,
-    args jsonb NOT NULL DEFAULT '{}',
-    meta jsonb NOT NULL DEFAULT '{}',
-    tags text[] NOT NULL DEFAULT ARRAY[]::TEXT[],
-    errors jsonb NOT NULL DEFAULT '[]',
-    attempted_by text[] NOT NULL DEFAULT ARRAY[]::TEXT[],
-    inserted_at timestamp WITHOUT TIME ZONE NOT NULL DEFAULT timezone('UTC', now()),
-    scheduled_at timestamp WITHOUT TIME ZONE NOT NULL DEFAULT timezone('UTC', now()),
-    attempted_at timestamp WITHOUT TIME ZONE,
-    cancelled_at timestamp WITHOUT TIME ZONE,
-    completed_at timestamp WITHOUT TIME ZONE,
-    discarded_at timestamp WITHOUT TIME ZONE,
-
-    CONSTRAINT attempt_range CHECK (attempt >= 0 AND attempt <= max_attempts),
-    CONSTRAINT queue_length CHECK (char_length(queue) > 0),
-    CONSTRAINT worker_length CHECK (char_length(worker) > 0),
-    CONSTRAINT positive_max_attempts CHECK (max_attempts > 0),
-    CONSTRAINT non_negative_priority CHECK (priority >= 0)
-);
-
 CREATE UNLOGGED TABLE IF NOT EXISTS oban_leaders (
     name text PRIMARY KEY DEFAULT 'oban',
     node text NOT NULL,
@@ -83,49 +56,43 @@ CREATE UNLOGGED TABLE IF NOT EXISTS oban_producers (
     updated_at timestamp WITHOUT TIME ZONE NOT NULL DEFAULT timezone('UTC', now())
 );
 
--- Indexes
-
-CREATE INDEX IF NOT EXISTS oban_jobs_state_queue_priority_scheduled_at_id_index
-ON oban_jobs (state, queue, priority, scheduled_at, id)
-WITH (fillfactor = 90);
-
-CREATE INDEX IF NOT EXISTS oban_jobs_staging_index
-ON oban_jobs (scheduled_at, id) INCLUDE (queue)
-WHERE state IN ('scheduled', 'retryable');
-
-CREATE INDEX IF NOT EXISTS oban_jobs_completed_at_index
-ON oban_jobs (completed_at)
-WHERE state = 'completed';
-
-CREATE INDEX IF NOT EXISTS oban_jobs_cancelled_at_index
-ON oban_jobs (cancelled_at)
-WHERE state = 'cancelled';
-
-CREATE INDEX IF NOT EXISTS oban_jobs_discarded_at_index
-ON oban_jobs (discarded_at)
-WHERE state = 'discarded';
-
--- Autovacuum
-
-ALTER TABLE oban_jobs SET (
-  -- Vacuum earlier on large tables
-  autovacuum_vacuum_scale_factor = 0.02,
-  autovacuum_vacuum_threshold = 50,
-
-  -- Keep stats fresh for the planner
-  autovacuum_analyze_scale_factor = 0.02,
-  autovacuum_analyze_threshold = 100,
+CREATE TABLE IF NOT EXISTS oban_crons (
+    name text PRIMARY KEY,
+    last_at timestamp WITHOUT TIME ZONE NOT NULL
+);
 
-  -- Make autovacuum push harder with little/no sleeping
-  autovacuum_vacuum_cost_limit = 2000,
-  autovacuum_vacuum_cost_delay = 1,
+-- Finished jobs moved aside by the pruner when archiving is enabled
+CREATE TABLE IF NOT EXISTS oban_jobs_archive (
+    id BIGINT PRIMARY KEY,
+    state oban_job_state NOT NULL,
+    queue text NOT NULL,
+    worker text NOT NULL,
+    attempt smallint NOT NULL,
+    max_attempts smallint NOT NULL,
+    priority smallint NOT NULL,
+    args jsonb NOT NULL,
+    meta jsonb NOT NULL,
+    tags text[] NOT NULL,
+    errors jsonb NOT NULL,
+    attempted_by text[] NOT NULL,
+    inserted_at timestamp WITHOUT TIME ZONE NOT NULL,
+    scheduled_at timestamp WITHOUT TIME ZONE NOT NULL,
+    attempted_at timestamp WITHOUT TIME ZONE,
+    cancelled_at timestamp WITHOUT TIME ZONE,
+    completed_at timestamp WITHOUT TIME ZONE,
+    discarded_at timestamp WITHOUT TIME ZONE,
+    archived_at timestamp WITHOUT TIME ZONE NOT NULL DEFAULT timezone('UTC', now())
+);
 
-  -- Handle insert-heavy spikes (PG13+)
-  autovacuum_vacuum_insert_scale_factor = 0.02,
-  autovacuum_vacuum_insert_threshold = 1000,
+CREATE INDEX IF NOT EXISTS oban_jobs_archive_archived_at_index
+ON oban_jobs_archive (archived_at);
 
-  -- Leave headroom on pages for locality and fewer page splits
-  fillfactor = 85
+CREATE UNLOGGED TABLE IF NOT EXISTS oban_notifications (
+    id BIGINT PRIMARY KEY GENERATED ALWAYS AS IDENTITY,
+    channel text NOT NULL,
+    payload text NOT NULL,
+    xact_id xid8 NOT NULL DEFAULT pg_current_xact_id(),
+    inserted_at timestamp WITHOUT TIME ZONE NOT NULL DEFAULT timezone('UTC', now())
 );
 
 -- Functions
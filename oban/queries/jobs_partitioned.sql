@@ -0,0 +1,5 @@
+SELECT
+  coalesce(
+    (SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass('oban_jobs')),
+    false
+  )
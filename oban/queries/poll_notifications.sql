@@ -0,0 +1,26 @@
+WITH snapshot AS (
+  SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint AS xmin
+)
+SELECT
+  snapshot.xmin,
+  notification.id,
+  notification.channel,
+  notification.payload,
+  notification.xact_id
+FROM
+  snapshot
+  LEFT JOIN LATERAL (
+    SELECT
+      id, channel, payload, xact_id::text::bigint AS xact_id
+    FROM
+      oban_notifications
+    WHERE
+      xact_id >= %(xmin)s::text::xid8
+      AND id > %(after)s
+      AND channel = ANY(%(channels)s)
+      AND id <> ALL(%(seen)s::bigint[])
+    ORDER BY
+      id ASC
+    LIMIT
+      %(limit)s
+  ) AS notification ON true
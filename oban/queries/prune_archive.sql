@@ -0,0 +1,16 @@
+WITH jobs_to_delete AS (
+  SELECT
+    id
+  FROM
+    oban_jobs_archive
+  WHERE
+    archived_at <= timezone('UTC', now()) - make_interval(secs => %(max_age)s)
+  ORDER BY
+    archived_at ASC
+  LIMIT
+    %(limit)s
+)
+DELETE FROM
+  oban_jobs_archive
+WHERE
+  id IN (SELECT id FROM jobs_to_delete)
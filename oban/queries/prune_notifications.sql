@@ -0,0 +1,2 @@
+DELETE FROM oban_notifications
+WHERE id <= %(watermark)s
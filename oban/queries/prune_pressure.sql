@@ -0,0 +1,14 @@
+SELECT
+  (
+    SELECT
+      count(*)
+    FROM
+      pg_stat_activity
+    WHERE
+      datname = current_database()
+      AND wait_event_type = 'Lock'
+  )::integer AS lock_waits,
+  coalesce(
+    (SELECT extract(epoch FROM max(replay_lag)) FROM pg_stat_replication),
+    0
+  )::float AS replication_lag
@@ -0,0 +1,57 @@
+WITH rules AS (
+  SELECT
+    *
+  FROM
+    unnest(
+      %(rule_queues)s::text[],
+      %(rule_workers)s::text[],
+      %(rule_states)s::text[],
+      %(rule_ages)s::int[]
+    ) WITH ORDINALITY AS rules (queue, worker, state, age, position)
+),
+jobs_to_delete AS (
+  SELECT
+    jobs.id
+  FROM
+    oban_jobs_terminal_default AS jobs
+    LEFT JOIN LATERAL (
+      SELECT
+        rules.age
+      FROM
+        rules
+      WHERE
+        (rules.queue IS NULL OR rules.queue = jobs.queue) AND
+        (rules.worker IS NULL OR rules.worker = jobs.worker) AND
+        (rules.state IS NULL OR rules.state = jobs.state::text)
+      ORDER BY
+        rules.position
+      LIMIT
+        1
+    ) AS rule ON true
+  WHERE
+    (
+      (state = 'completed' AND completed_at <= timezone('UTC', now()) - make_interval(secs => %(completed_floor)s)) OR
+      (state = 'cancelled' AND cancelled_at <= timezone('UTC', now()) - make_interval(secs => %(cancelled_floor)s)) OR
+      (state = 'discarded' AND discarded_at <= timezone('UTC', now()) - make_interval(secs => %(discarded_floor)s))
+    )
+    AND CASE state
+      WHEN 'completed' THEN completed_at
+      WHEN 'cancelled' THEN cancelled_at
+      WHEN 'discarded' THEN discarded_at
+    END <= timezone('UTC', now()) - make_interval(secs => coalesce(
+      rule.age,
+      CASE state
+        WHEN 'completed' THEN %(completed_age)s
+        WHEN 'cancelled' THEN %(cancelled_age)s
+        WHEN 'discarded' THEN %(discarded_age)s
+      END
+    ))
+  ORDER BY
+    jobs.id ASC
+  LIMIT
+    %(limit)s
+)
+DELETE FROM
+  oban_jobs_terminal_default AS jobs
+WHERE
+  id IN (SELECT id FROM jobs_to_delete)
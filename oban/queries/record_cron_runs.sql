@@ -0,0 +1,5 @@
+INSERT INTO oban_crons (name, last_at)
+SELECT name, last_at
+FROM unnest(%(names)s::text[], %(times)s::timestamp[]) AS t(name, last_at)
+ON CONFLICT (name) DO UPDATE
+SET last_at = greatest(oban_crons.last_at, excluded.last_at)
@@ -1,3 +1,44 @@
+WITH locked_jobs AS (
+  SELECT
+    id
+  FROM
+    oban_jobs
+  WHERE
+    state = 'executing'
+    AND (
+      -- Heartbeats from an earlier attempt are superseded by the current attempt
+      (
+        meta ? 'heartbeat_at'
+        AND greatest((meta->>'heartbeat_at')::timestamp, attempted_at) <
+          timezone('UTC', now()) - make_interval(secs => %(heartbeat_after)s)
+      )
+      -- Without a live producer, jobs are rescued after rescue_after. A missing producer only
+      -- means a dead one sooner when the job has heartbeats, or has run longer than a producer
+      -- may go without refreshing, since producers that never register, such as other Oban
+      -- implementations sharing the table, have no row at all.
+      OR (
+        NOT EXISTS (
+          SELECT 1 FROM oban_producers WHERE oban_producers.uuid::text = attempted_by[2]
+        )
+        AND (
+          attempted_at < timezone('UTC', now()) - make_interval(secs => %(rescue_after)s)
+          OR (
+            cardinality(attempted_by) >= 2
+            AND (
+              meta ? 'heartbeat_at'
+              OR attempted_at <
+                timezone('UTC', now()) - make_interval(secs => %(producer_max_age)s)
+            )
+          )
+        )
+      )
+    )
+  ORDER BY
+    attempted_at ASC, id ASC
+  LIMIT
+    %(limit)s
+  FOR UPDATE SKIP LOCKED
+)
 UPDATE
   oban_jobs
 SET
@@ -13,6 +54,17 @@ SET
     WHEN attempt >= max_attempts THEN meta
     ELSE meta || jsonb_build_object('rescued', coalesce((meta->>'rescued')::int, 0) + 1)
   END
+FROM
+  locked_jobs
 WHERE
-  state = 'executing'
-  AND attempted_at < timezone('UTC', now()) - make_interval(secs => %(rescue_after)s)
+  oban_jobs.id = locked_jobs.id
+RETURNING
+  CASE WHEN state = 'available'
+       THEN pg_notify(
+         'oban_insert' || coalesce(
+           '_' || mod(('x' || left(md5(queue), 7))::bit(28)::int, %(shards)s::int),
+           ''
+         ),
+         '{"queue":"' || queue || '"}'
+       )
+  END
@@ -1,5 +1,8 @@
 TRUNCATE TABLE
+  oban_crons,
   oban_jobs,
+  oban_jobs_archive,
   oban_leaders,
+  oban_notifications,
   oban_producers
 RESTART IDENTITY CASCADE
@@ -11,3 +11,11 @@ SET
 WHERE
   id = ANY(%(ids)s)
   AND state NOT IN ('available', 'executing')
+RETURNING
+  pg_notify(
+    'oban_insert' || coalesce(
+      '_' || mod(('x' || left(md5(queue), 7))::bit(28)::int, %(shards)s::int),
+      ''
+    ),
+    '{"queue":"' || queue || '"}'
+  )
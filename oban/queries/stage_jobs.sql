@@ -1,11 +1,18 @@
-WITH locked_jobs AS (
+WITH staging_queues AS (
+  SELECT
+    coalesce(
+      %(queues)s::text[],
+      ARRAY(SELECT DISTINCT queue FROM oban_producers)
+    ) AS queues
+),
+locked_jobs AS (
   SELECT
     id
   FROM
     oban_jobs
   WHERE
     state = ANY('{scheduled,retryable}')
-    AND queue = ANY(%(queues)s::text[])
+    AND queue = ANY((SELECT queues FROM staging_queues)::text[])
     AND scheduled_at <= coalesce(%(before)s, timezone('UTC', now()))
   ORDER BY
     scheduled_at ASC, id ASC
@@ -22,14 +29,39 @@ updated_jobs AS (
     locked_jobs
   WHERE
     oban_jobs.id = locked_jobs.id
+  RETURNING
+    oban_jobs.queue
 )
-SELECT DISTINCT
-  q.queue
-FROM
-  unnest(%(queues)s::text[]) AS q(queue)
-WHERE
-  EXISTS (
-    SELECT 1
-    FROM oban_jobs
-    WHERE state = 'available' AND queue = q.queue
-  )
+SELECT
+  (SELECT count(*) FROM updated_jobs)::integer AS staged,
+  -- Jobs can become available without a notification, e.g. through an update or a dropped
+  -- payload, so queues with any available job are reported too. Each probe stops at the first
+  -- matching entry of the state and queue index.
+  ARRAY(
+    SELECT queue FROM updated_jobs
+    UNION
+    SELECT
+      q.queue
+    FROM
+      unnest((SELECT queues FROM staging_queues)::text[]) AS q(queue)
+    WHERE
+      EXISTS (
+        SELECT 1
+        FROM oban_jobs
+        WHERE state = 'available' AND queue = q.queue
+      )
+  ) AS queues,
+  (
+    SELECT
+      extract(epoch FROM scheduled_at - coalesce(%(before)s, timezone('UTC', now())))::float
+    FROM
+      oban_jobs
+    WHERE
+      state = ANY('{scheduled,retryable}')
+      AND queue = ANY((SELECT queues FROM staging_queues)::text[])
+      AND scheduled_at > coalesce(%(before)s, timezone('UTC', now()))
+    ORDER BY
+      scheduled_at ASC
+    LIMIT
+      1
+  ) AS next_in
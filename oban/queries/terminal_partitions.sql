@@ -0,0 +1,9 @@
+SELECT
+  child.relname
+FROM
+  pg_inherits
+  JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE
+  pg_inherits.inhparent = to_regclass('oban_jobs_terminal')
+ORDER BY
+  child.relname
@@ -1,4 +1,7 @@
+DROP TABLE IF EXISTS oban_notifications CASCADE;
+DROP TABLE IF EXISTS oban_crons CASCADE;
 DROP TABLE IF EXISTS oban_producers CASCADE;
 DROP TABLE IF EXISTS oban_leaders CASCADE;
+DROP TABLE IF EXISTS oban_jobs_archive CASCADE;
 DROP TABLE IF EXISTS oban_jobs CASCADE;
 DROP TYPE IF EXISTS oban_job_state CASCADE;
@@ -4,6 +4,6 @@ FROM
   information_schema.tables
 WHERE
   table_schema = %(prefix)s
-  AND table_name = ANY('{oban_jobs,oban_leaders,oban_producers}')
+  AND table_name = ANY('{oban_jobs,oban_jobs_active,oban_jobs_terminal,oban_leaders,oban_producers}')
 ORDER BY
   table_name
@@ -5,7 +5,7 @@ from typing import Any
 from ._query import Query
 
 
-def install_sql(prefix: str = "public") -> str:
+def install_sql(prefix: str = "public", partitioned: bool = False) -> str:
     """Get the SQL for installing Oban.
 
     Returns the raw SQL statements for creating Oban types, tables, and indexes.
@@ -13,6 +13,8 @@ def install_sql(prefix: str = "public") -> str:
 
     Args:
         prefix: PostgreSQL schema where Oban tables will be located (default: "public")
+        partitioned: Partition the jobs table into active jobs and daily partitions of
+            finished jobs, which are pruned by dropping whole partitions (default: False)
 
     Returns:
         SQL string for schema installation
@@ -33,7 +35,7 @@ def install_sql(prefix: str = "public") -> str:
         ...         migrations.RunSQL(install_sql()),
         ...     ]
     """
-    return Query._load_file("install.sql", prefix)
+    return Query.install_sql(prefix, partitioned)
 
 
 def uninstall_sql(prefix: str = "public") -> str:
@@ -67,7 +69,7 @@ def uninstall_sql(prefix: str = "public") -> str:
     return Query._load_file("uninstall.sql", prefix)
 
 
-async def install(pool: Any, prefix: str = "public") -> None:
+async def install(pool: Any, prefix: str = "public", partitioned: bool = False) -> None:
     """Install Oban in the specified database.
 
     Creates all necessary types, tables, and indexes for Oban to function. The
@@ -77,6 +79,8 @@ async def install(pool: Any, prefix: str = "public") -> None:
     Args:
         pool: A database connection pool (e.g., AsyncConnectionPool)
         prefix: PostgreSQL schema where Oban tables will be located (default: "public")
+        partitioned: Partition the jobs table for pruning by dropping partitions
+            (default: False)
 
     Example:
         >>> from psycopg_pool import AsyncConnectionPool
@@ -87,7 +91,7 @@ async def install(pool: Any, prefix: str = "public") -> None:
         >>> await install(pool)
     """
     async with pool.connection() as conn:
-        await conn.execute(install_sql(prefix))
+        await conn.execute(install_sql(prefix, partitioned))
 
 
 async def uninstall(pool: Any, prefix: str = "public") -> None:
@@ -9,7 +9,6 @@ import logging
 import time
 import traceback
 
-from collections import defaultdict
 from contextlib import contextmanager
 from threading import RLock
 from typing import Any, Callable, List
@@ -19,7 +18,9 @@ Metadata = dict[str, Any]
 
 logger = logging.getLogger(__name__)
 
-_handlers = defaultdict(list)
+# Handlers are copied on write, so events are dispatched from a snapshot without locking. Only
+# attaching and detaching, which are rare, take the lock.
+_handlers: dict[str, tuple[tuple[str, Handler], ...]] = {}
 _lock = RLock()
 
 
@@ -59,9 +60,15 @@ def attach(id: str, events: List[str], handler: Handler) -> None:
 
         telemetry.attach("my-logger", ["oban.job.execute.stop"], log_events)
     """
+    global _handlers
+
     with _lock:
+        handlers = dict(_handlers)
+
         for name in events:
-            _handlers[name].append((id, handler))
+            handlers[name] = (*handlers.get(name, ()), (id, handler))
+
+        _handlers = handlers
 
 
 def detach(id: str) -> None:
@@ -73,13 +80,17 @@ def detach(id: str) -> None:
     Example:
         telemetry.detach("my-logger")
     """
+    global _handlers
+
     with _lock:
-        for name in list(_handlers.keys()):
-            _handlers[name] = [
+        _handlers = {
+            name: tuple(
                 (handler_id, handler)
-                for handler_id, handler in _handlers[name]
+                for handler_id, handler in handlers
                 if handler_id != id
-            ]
+            )
+            for name, handlers in _handlers.items()
+        }
 
 
 def execute(name: str, metadata: Metadata) -> None:
@@ -95,10 +106,7 @@ def execute(name: str, metadata: Metadata) -> None:
     Example:
         telemetry.execute("oban.job.execute.start", {"job_id": 123, "queue": "default"})
     """
-    with _lock:
-        handlers = [handler for (_id, handler) in _handlers.get(name, [])]
-
-    for handler in handlers:
+    for _id, handler in _handlers.get(name, ()):
         try:
             handler(name, metadata.copy())
         except Exception:
@@ -1,10 +1,13 @@
 import asyncio
 import hashlib
 import os
+import threading
 import pytest
 
-from oban import Oban, job, worker
+from oban import Job, Oban, job, telemetry, worker
 from oban._config import Config
+from oban._metrics import Metrics
+from oban._notifier import decode_payload, encode_payload
 
 
 TEST_DSN = os.getenv("DSN_BASE", "postgresql://postgres@localhost") + "/oban_py_test"
@@ -93,3 +96,107 @@ class TestEnqueueBenchmark:
                 await pool.close()
 
         benchmark(lambda: asyncio.run(run()))
+
+
+class TestNotifierBenchmark:
+    SIGNAL = {"action": "pause", "queue": "default", "ident": "any"}
+
+    GOSSIP = {
+        "checks": [
+            {
+                "uuid": f"00000000-0000-0000-0000-{idx:012}",
+                "node": "worker.1",
+                "name": "Oban",
+                "queue": f"queue_{idx}",
+                "limit": 10,
+                "paused": False,
+                "running": list(range(idx, idx + 10)),
+                "started_at": "2026-01-01T00:00:00+00:00",
+            }
+            for idx in range(20)
+        ]
+    }
+
+    @pytest.mark.benchmark
+    def test_encode_decode_10k_signals(self, benchmark):
+        """Benchmark encoding and decoding 10,000 small signal payloads."""
+
+        def run():
+            for _ in range(10_000):
+                decode_payload(encode_payload(self.SIGNAL))
+
+        benchmark(run)
+
+    @pytest.mark.benchmark
+    def test_encode_decode_1k_gossip(self, benchmark):
+        """Benchmark encoding and decoding 1,000 gossip payloads for 20 queues."""
+
+        def run():
+            for _ in range(1_000):
+                decode_payload(encode_payload(self.GOSSIP))
+
+        benchmark(run)
+
+
+class TestMetricsBenchmark:
+    EVENTS_PER_THREAD = 5_000
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("threads", [1, 8, 32])
+    def test_recording_job_events(self, benchmark, threads):
+        """Benchmark recording job stop events for metrics from concurrent threads.
+
+        Each thread records into its own shard, so the per-event shard lock is uncontended and
+        this measures the cost of taking it rather than waiting on it. Only draining the shards
+        at the end of each round competes for those locks.
+        """
+        metrics = Metrics(
+            leader=None,
+            name="Bench",
+            node="bench",
+            notifier=None,
+            producers={},
+            query=None,
+        )
+
+        meta = {
+            "job": Job(worker="Bench", queue="default"),
+            "state": "completed",
+            "duration": 1_500_000,
+            "queue_time": 2_000_000,
+        }
+
+        def emit(barrier):
+            barrier.wait()
+
+            for _ in range(self.EVENTS_PER_THREAD):
+                telemetry.execute("oban.job.stop", meta)
+
+        def run():
+            barrier = threading.Barrier(threads)
+            emitters = [
+                threading.Thread(target=emit, args=(barrier,)) for _ in range(threads)
+            ]
+
+            for emitter in emitters:
+                emitter.start()
+
+            for emitter in emitters:
+                emitter.join()
+
+            metrics._drain_shards()
+
+        telemetry.attach("bench-metrics", ["oban.job.stop"], metrics._handle_job_event)
+
+        try:
+            benchmark(run)
+        finally:
+            telemetry.detach("bench-metrics")
+
+        # Stats are missing when benchmarks are disabled and the function only runs once
+        if benchmark.stats:
+            events = threads * self.EVENTS_PER_THREAD
+
+            benchmark.extra_info["ns_per_event"] = (
+                benchmark.stats.stats.mean * 1e9 / events
+            )
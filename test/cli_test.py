@@ -4,6 +4,7 @@ import psycopg
 import pytest
 from click.testing import CliRunner
 
+from oban._scheduler import clear_scheduled
 from oban.cli import _import_cron_paths, main
 
 
@@ -81,6 +82,43 @@ class TestImportCronPaths:
         assert _import_cron_paths([str(tmp_path)]) == []
 
 
+class TestCronListCommand:
+    @pytest.fixture(autouse=True)
+    def clear_scheduled(self):
+        clear_scheduled()
+        yield
+        clear_scheduled()
+
+    def test_listing_upcoming_runs(self, runner, tmp_path, monkeypatch):
+        worker_file = tmp_path / "hourly_worker.py"
+        worker_file.write_text(
+            dedent("""
+            from oban import worker
+
+            @worker(cron={"expr": "@hourly", "timezone": "America/Chicago"})
+            class HourlyWorker:
+                async def process(self, job):
+                    pass
+        """)
+        )
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        result = runner.invoke(
+            main, ["cron", "list", "--cron-modules", "hourly_worker", "--count", "2"]
+        )
+
+        assert result.exit_code == 0
+
+        (expr, name, tz, runs) = result.output.strip().split("\t")
+
+        assert expr == "@hourly"
+        assert name == "hourly_worker.HourlyWorker"
+        assert tz == "America/Chicago"
+        assert len(runs.split(", ")) == 2
+
+
 class TestInstallCommand:
     def test_install_creates_schema(self, runner, dsn):
         result = runner.invoke(main, ["install", "--dsn", dsn])
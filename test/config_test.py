@@ -9,6 +9,7 @@ class TestFromEnv:
         monkeypatch.setenv("OBAN_QUEUES", "default:10,mailers:5")
         monkeypatch.setenv("OBAN_PREFIX", "custom")
         monkeypatch.setenv("OBAN_NODE", "node1")
+        monkeypatch.setenv("OBAN_NOTIFIER", "polling")
         monkeypatch.setenv("OBAN_POOL_MIN_SIZE", "2")
         monkeypatch.setenv("OBAN_POOL_MAX_SIZE", "20")
 
@@ -18,6 +19,7 @@ class TestFromEnv:
         assert conf.queues == {"default": 10, "mailers": 5}
         assert conf.prefix == "custom"
         assert conf.node == "node1"
+        assert conf.notifier == "polling"
         assert conf.pool_min_size == 2
         assert conf.pool_max_size == 20
 
@@ -19,6 +19,10 @@ class TestLeaderValidation:
         with pytest.raises(ValueError, match="interval must be positive"):
             Leader._validate(interval=-1.0)
 
+    def test_mode_must_be_known(self):
+        with pytest.raises(ValueError, match="mode must be one of"):
+            Leader._validate(interval=30.0, mode="lottery")
+
 
 class TestLeadership:
     @pytest.mark.oban(leadership=True)
@@ -94,3 +98,63 @@ class TestLeadership:
         finally:
             await oban_1.stop()
             await oban_2.stop()
+
+
+class TestAdvisoryLeadership:
+    @pytest.mark.oban(leadership={"mode": "advisory"})
+    async def test_multiple_instances_elect_single_leader(self, oban_instance):
+        oban_1 = oban_instance()
+        oban_2 = oban_instance()
+
+        await oban_1.start()
+        await oban_2.start()
+
+        try:
+            assert oban_1.is_leader
+            assert not oban_2.is_leader
+
+            async with oban_1._query.connection() as conn:
+                result = await conn.execute("SELECT count(*) FROM oban_leaders")
+
+                assert (await result.fetchone())[0] == 0
+        finally:
+            await oban_1.stop()
+            await oban_2.stop()
+
+    @pytest.mark.oban(leadership={"mode": "advisory", "interval": 30.0})
+    async def test_waiting_instance_takes_over_when_leader_stops(self, oban_instance):
+        oban_1 = oban_instance()
+        oban_2 = oban_instance()
+
+        try:
+            await oban_1.start()
+            await oban_2.start()
+
+            await oban_1.stop()
+
+            def assert_peer_is_leader():
+                assert oban_2.is_leader
+
+            await with_backoff(assert_peer_is_leader, timeout=0.5)
+        finally:
+            await oban_2.stop()
+
+    @pytest.mark.oban(leadership={"mode": "advisory", "interval": 0.1})
+    async def test_losing_leadership_with_the_connection(self, oban_instance):
+        oban_1 = oban_instance()
+        oban_2 = oban_instance()
+
+        try:
+            await oban_1.start()
+            await oban_2.start()
+
+            await oban_1._leader._lock_conn.close()
+
+            def assert_leadership_moved():
+                assert not oban_1.is_leader
+                assert oban_2.is_leader
+
+            await with_backoff(assert_leadership_moved, timeout=1.0)
+        finally:
+            await oban_1.stop()
+            await oban_2.stop()
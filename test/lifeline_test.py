@@ -1,6 +1,11 @@
+from uuid import uuid4
+
 import pytest
 
+from oban import telemetry
+from oban._extensions import _extensions, put_ext
 from oban._lifeline import Lifeline
+from .helpers import with_backoff
 
 
 async def insert_executing_job(
@@ -10,20 +15,21 @@ async def insert_executing_job(
     attempt=1,
     max_attempts=20,
     old_attempt=False,
+    attempted_ago=0,
 ):
-    attempted_at = (
-        "timezone('UTC', now()) - interval '10 minutes'"
-        if old_attempt
-        else "timezone('UTC', now())"
-    )
+    if old_attempt:
+        attempted_ago = 600
 
     rows = await conn.execute(
-        f"""
+        """
         INSERT INTO oban_jobs (state, worker, attempted_by, attempt, max_attempts, attempted_at)
-        VALUES ('executing', 'Worker', %s, %s, %s, {attempted_at})
+        VALUES (
+          'executing', 'Worker', %s, %s, %s,
+          timezone('UTC', now()) - make_interval(secs => %s)
+        )
         RETURNING id
         """,
-        ([node, uuid], attempt, max_attempts),
+        ([node, uuid], attempt, max_attempts, attempted_ago),
     )
 
     (id,) = await rows.fetchone()
@@ -75,6 +81,22 @@ class TestLifelineValidation:
         with pytest.raises(ValueError, match="rescue_after must be positive"):
             Lifeline._validate(interval=60.0, rescue_after=-1.0)
 
+    def test_limit_must_be_positive_integer(self):
+        with pytest.raises(TypeError, match="limit must be an integer"):
+            Lifeline._validate(interval=60.0, rescue_after=300.0, limit=1.5)
+
+        with pytest.raises(ValueError, match="limit must be positive"):
+            Lifeline._validate(interval=60.0, rescue_after=300.0, limit=0)
+
+    def test_heartbeat_interval_must_be_positive(self):
+        with pytest.raises(TypeError, match="heartbeat_interval must be a number"):
+            Lifeline._validate(
+                interval=60.0, rescue_after=300.0, heartbeat_interval="1"
+            )
+
+        with pytest.raises(ValueError, match="heartbeat_interval must be positive"):
+            Lifeline._validate(interval=60.0, rescue_after=300.0, heartbeat_interval=0)
+
 
 class TestLifeline:
     @pytest.mark.oban(leadership=True, queues={"alpha": 1})
@@ -100,26 +122,235 @@ class TestLifeline:
         await oban.stop()
 
     @pytest.mark.oban(leadership=True, queues={"alpha": 1})
-    async def test_lifeline_skips_recent_executing_jobs(self, oban_instance):
+    async def test_lifeline_rescues_orphans_before_rescue_after(self, oban_instance):
         oban = oban_instance()
 
         await oban.start()
 
         async with oban._connection() as conn:
             async with conn.transaction():
-                job_id = await insert_executing_job(conn, old_attempt=False)
+                job_id = await insert_executing_job(conn, attempted_ago=120)
+
+        await oban._lifeline._rescue()
+
+        async with oban._connection() as conn:
+            job = await get_job(conn, job_id)
+
+        assert job[1] == "available"
+        assert job[2]["rescued"] == 1
+
+        await oban.stop()
+
+    @pytest.mark.oban(leadership=True, queues={"alpha": 1})
+    async def test_lifeline_skips_recent_jobs_of_unregistered_producers(
+        self, oban_instance
+    ):
+        oban = oban_instance()
+
+        await oban.start()
+
+        async with oban._connection() as conn:
+            async with conn.transaction():
+                job_id = await insert_executing_job(
+                    conn, node="elixir-node", uuid=str(uuid4()), attempted_ago=5
+                )
 
         await oban._lifeline._rescue()
 
         async with oban._connection() as conn:
             job = await get_job(conn, job_id)
 
-        assert job is not None
         assert job[1] == "executing"
         assert "rescued" not in job[2]
 
         await oban.stop()
 
+    @pytest.mark.oban(leadership=True, queues={"alpha": 1}, lifeline={"limit": 2})
+    async def test_lifeline_rescues_in_batches(self, oban_instance):
+        calls = []
+
+        def handler(_name, meta):
+            calls.append((meta["batch"], meta["rescued_count"]))
+
+        telemetry.attach("test-lifeline", ["oban.lifeline.rescue.stop"], handler)
+
+        try:
+            async with oban_instance() as oban:
+                async with oban._connection() as conn:
+                    async with conn.transaction():
+                        for _ in range(5):
+                            await insert_executing_job(conn, attempted_ago=120)
+
+                await oban._lifeline._rescue()
+
+                async with oban._connection() as conn:
+                    rows = await conn.execute(
+                        "SELECT count(*) FROM oban_jobs WHERE state = 'available'"
+                    )
+
+                    assert await rows.fetchone() == (5,)
+        finally:
+            telemetry.detach("test-lifeline")
+
+        assert calls == [(0, 2), (1, 2), (2, 1)]
+
+    @pytest.mark.oban(leadership=True, queues={"alpha": 1})
+    async def test_lifeline_supports_rescue_extensions(self, oban_instance):
+        calls = []
+
+        async def rescue(query, rescue_after):
+            calls.append(("rescue", rescue_after))
+
+            await query.rescue_jobs(rescue_after, 10)
+
+        async def rescue_batch(query, rescue_after, **opts):
+            calls.append(("batch", opts["batch"]))
+
+        try:
+            async with oban_instance() as oban:
+                put_ext("lifeline.rescue", rescue)
+
+                await oban._lifeline._rescue()
+
+                del _extensions["lifeline.rescue"]
+                put_ext("lifeline.rescue_batch", rescue_batch)
+
+                await oban._lifeline._rescue()
+        finally:
+            _extensions.pop("lifeline.rescue", None)
+            _extensions.pop("lifeline.rescue_batch", None)
+
+        assert calls == [("rescue", 300.0), ("batch", 0)]
+
+    @pytest.mark.oban(leadership=True, queues={"alpha": 1})
+    async def test_lifeline_skips_jobs_with_live_producers(self, oban_instance):
+        oban = oban_instance()
+        uuid = str(uuid4())
+
+        await oban.start()
+
+        async with oban._connection() as conn:
+            async with conn.transaction():
+                await insert_producer(conn, "live-node", "alpha", uuid)
+
+                job_id = await insert_executing_job(
+                    conn, node="live-node", uuid=uuid, old_attempt=True
+                )
+
+        await oban._lifeline._rescue()
+
+        async with oban._connection() as conn:
+            job = await get_job(conn, job_id)
+
+        assert job[1] == "executing"
+        assert "rescued" not in job[2]
+
+        await oban.stop()
+
+    @pytest.mark.oban(
+        leadership=True, queues={"alpha": 1}, lifeline={"heartbeat_interval": 10.0}
+    )
+    async def test_lifeline_rescues_jobs_with_missed_heartbeats(self, oban_instance):
+        oban = oban_instance()
+        uuid = str(uuid4())
+
+        await oban.start()
+
+        async with oban._connection() as conn:
+            async with conn.transaction():
+                await insert_producer(conn, "live-node", "alpha", uuid)
+
+                rows = await conn.execute(
+                    """
+                    INSERT INTO oban_jobs (state, worker, attempted_by, attempted_at, meta)
+                    SELECT
+                      'executing',
+                      'Worker',
+                      ARRAY['live-node', %(uuid)s],
+                      now() - make_interval(secs => attempted_ago),
+                      jsonb_build_object(
+                        'heartbeat_at', now() - make_interval(secs => heartbeat_ago)
+                      )
+                    FROM (VALUES (60, 5), (60, 31), (5, 120)) AS ago (attempted_ago, heartbeat_ago)
+                    RETURNING id
+                    """,
+                    {"uuid": uuid},
+                )
+
+                (fresh_id, missed_id, retried_id) = [
+                    id for (id,) in await rows.fetchall()
+                ]
+
+        await oban._lifeline._rescue()
+
+        async with oban._connection() as conn:
+            assert (await get_job(conn, fresh_id))[1] == "executing"
+            assert (await get_job(conn, missed_id))[1] == "available"
+            assert (await get_job(conn, retried_id))[1] == "executing"
+
+        await oban.stop()
+
+    @pytest.mark.oban(leadership=True, queues={"alpha": 1})
+    async def test_lifeline_falls_back_to_rescue_after(self, oban_instance):
+        oban = oban_instance()
+
+        await oban.start()
+
+        async with oban._connection() as conn:
+            async with conn.transaction():
+                rows = await conn.execute(
+                    """
+                    INSERT INTO oban_jobs (state, worker, attempted_by, attempted_at)
+                    VALUES
+                      ('executing', 'Worker', '{node}', timezone('UTC', now())),
+                      ('executing', 'Worker', '{node}', now() - interval '10 minutes')
+                    RETURNING id
+                    """
+                )
+
+                (recent_id, old_id) = [id for (id,) in await rows.fetchall()]
+
+        await oban._lifeline._rescue()
+
+        async with oban._connection() as conn:
+            assert (await get_job(conn, recent_id))[1] == "executing"
+            assert (await get_job(conn, old_id))[1] == "available"
+
+        await oban.stop()
+
+    @pytest.mark.oban(
+        leadership=True,
+        queues={"alpha": 1},
+        lifeline={"interval": 60.0},
+        refresher={"interval": 60.0, "max_age": 0.1},
+    )
+    async def test_cleaning_up_producers_wakes_lifeline(self, oban_instance):
+        oban = oban_instance()
+        uuid = str(uuid4())
+
+        async with oban._connection() as conn:
+            async with conn.transaction():
+                await insert_producer(conn, "dead-node", "alpha", uuid)
+
+                job_id = await insert_executing_job(conn, uuid=uuid, attempted_ago=1)
+
+        await oban.start()
+
+        async with oban._connection() as conn:
+            await conn.execute(
+                "UPDATE oban_producers SET updated_at = now() - interval '1 minute'"
+            )
+
+        await oban._refresher._cleanup()
+
+        async def rescued():
+            async with oban._connection() as conn:
+                assert (await get_job(conn, job_id))[1] == "available"
+
+        await with_backoff(rescued)
+
+        await oban.stop()
+
     @pytest.mark.oban(leadership=True, queues={"alpha": 1})
     async def test_lifeline_discards_jobs_without_remaining_attempts(
         self, oban_instance
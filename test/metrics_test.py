@@ -1,9 +1,10 @@
 import asyncio
+import threading
 
 import pytest
 
-from oban import worker
-from oban._metrics import Metrics, _build_gauge, _build_sketch, _compute_bin
+from oban import Job, worker
+from oban._metrics import Metrics, Sketch, _build_gauge, _build_sketch, _compute_bin
 from oban._scheduler import clear_scheduled, register_scheduled
 
 
@@ -151,6 +152,39 @@ class TestGaugeAndSketch:
 
         assert sketch["size"] == 2
 
+    def test_sketch_bins_values_as_they_are_added(self):
+        values = [1, 5, 100, 100, 2_500_000, -30]
+
+        sketch = Sketch()
+
+        for value in values:
+            sketch.add(value)
+
+        assert len(sketch) == 6
+        assert sketch.to_dict()["data"][_compute_bin(100)] == 2
+        assert sketch.to_dict() == _build_sketch(values)
+
+    def test_sketch_memory_is_bound_by_bins(self):
+        sketch = Sketch()
+        sketch.add_many([1_000_000] * 10_000)
+
+        assert sketch.to_dict() == {
+            "data": {_compute_bin(1_000_000): 10_000},
+            "size": 10_000,
+        }
+        assert len(sketch._bins) == _compute_bin(1_000_000) + 1
+
+    def test_merging_sketches(self):
+        sketch_1 = Sketch()
+        sketch_1.add_many([10, 1_000])
+
+        sketch_2 = Sketch()
+        sketch_2.add_many([1_000, 1_000_000])
+
+        sketch_1.merge(sketch_2)
+
+        assert sketch_1.to_dict() == _build_sketch([10, 1_000, 1_000, 1_000_000])
+
     def test_compute_bin_is_deterministic(self):
         bin1 = _compute_bin(1000)
         bin2 = _compute_bin(1000)
@@ -164,6 +198,41 @@ class TestGaugeAndSketch:
         assert bin_large > bin_small
 
 
+class TestMetricsShards:
+    def test_merging_events_recorded_by_threads(self):
+        metrics = build_metrics()
+        meta = {
+            "job": Job(worker="Worker", queue="default"),
+            "state": "completed",
+            "duration": 1_000,
+            "queue_time": 2_000,
+        }
+
+        def record():
+            for _ in range(100):
+                metrics._handle_job_event("oban.job.stop", meta)
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        record()
+
+        (stats,) = metrics._drain_shards().values()
+
+        assert stats.count == 500
+        assert len(stats.exec_time) == 500
+        assert len(stats.wait_time) == 500
+
+        # Shards of finished threads are dropped once drained
+        assert len(metrics._shards) == 1
+        assert metrics._drain_shards() == {}
+
+
 class TestJobMetricsBroadcast:
     @pytest.mark.oban(queues={"default": 1}, metrics={"interval": 60})
     async def test_broadcasts_job_metrics_after_execution(self, oban_instance):
@@ -1,23 +1,46 @@
 import asyncio
 import pytest
-
-from oban._notifier import decode_payload, encode_payload
+import secrets
+
+from oban import telemetry, worker
+from oban._notifier import (
+    CHUNK_SIZE,
+    COMPRESS_THRESHOLD,
+    NOTIFY_LIMIT,
+    HybridNotifier,
+    MemoryNotifier,
+    PollingNotifier,
+    PostgresNotifier,
+    _Dispatcher,
+    _Outbox,
+    _Reassembler,
+    chunk_payload,
+    decode_payload,
+    encode_payload,
+)
+from .helpers import with_backoff
 
 
 class TestEncodeDecode:
-    def test_encode_payload(self):
+    def test_encode_small_payload_as_json(self):
         payload = {"queue": "default", "id": 123}
         encoded = encode_payload(payload)
 
-        assert isinstance(encoded, str)
+        assert encoded == '{"queue":"default","id":123}'
+
+    def test_encode_large_payload_compressed(self):
+        payload = {"data": "x" * COMPRESS_THRESHOLD}
+        encoded = encode_payload(payload)
+
         assert not encoded.startswith("{")
+        assert len(encoded) < COMPRESS_THRESHOLD
 
     def test_decode_payload_roundtrip(self):
-        original = {"queue": "default", "id": 123, "data": "test"}
-        encoded = encode_payload(original)
-        decoded = decode_payload(encoded)
-
-        assert decoded == original
+        for original in [
+            {"queue": "default", "id": 123, "data": "test"},
+            {"queue": "default", "data": ["test"] * COMPRESS_THRESHOLD},
+        ]:
+            assert decode_payload(encode_payload(original)) == original
 
     def test_decode_payload_plain_json(self):
         payload = {"queue": "default", "id": 456}
@@ -26,6 +49,43 @@ class TestEncodeDecode:
         assert decoded == payload
 
 
+class TestChunking:
+    def test_small_payloads_are_not_chunked(self):
+        encoded = encode_payload({"queue": "default"})
+
+        assert chunk_payload(encoded) == [encoded]
+
+    def test_payloads_within_the_notify_limit_are_not_chunked(self):
+        payload = "x" * (NOTIFY_LIMIT - 1)
+
+        assert chunk_payload(payload) == [payload]
+        assert len(chunk_payload(payload + "x")) == 2
+
+    async def test_reassembling_chunks_in_any_order(self):
+        encoded = encode_payload({"data": secrets.token_urlsafe(CHUNK_SIZE * 2)})
+        chunks = chunk_payload(encoded)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) < 8000 for chunk in chunks)
+
+        reassembler = _Reassembler()
+
+        assert [reassembler.add(chunk) for chunk in reversed(chunks)][-1] == encoded
+
+    async def test_discarding_incomplete_chunks_after_timeout(self):
+        encoded = encode_payload({"data": secrets.token_urlsafe(CHUNK_SIZE * 2)})
+        (first, *rest) = chunk_payload(encoded)
+
+        reassembler = _Reassembler(timeout=0.01)
+
+        assert reassembler.add(first) is None
+
+        await asyncio.sleep(0.02)
+
+        assert [reassembler.add(chunk) for chunk in rest][-1] is None
+        assert len(reassembler._partials) == 1
+
+
 class TestNotifier:
     @pytest.mark.oban()
     async def test_listen_and_notify(self, oban_instance):
@@ -42,6 +102,22 @@ class TestNotifier:
 
             assert result == ("testing", {"message": "hello"})
 
+    @pytest.mark.oban()
+    async def test_notifying_payloads_over_the_size_limit(self, oban_instance):
+        received = asyncio.Queue()
+        payload = {"checks": [secrets.token_urlsafe(64) for _ in range(1000)]}
+
+        def callback(channel, payload):
+            received.put_nowait(payload)
+
+        async with oban_instance() as oban:
+            await oban._notifier.listen("gossip", callback)
+            await oban._notifier.notify("gossip", payload)
+
+            result = await asyncio.wait_for(received.get(), timeout=1.0)
+
+            assert result == payload
+
     @pytest.mark.oban()
     async def test_multiple_subscribers_same_channel(self, oban_instance):
         received_1 = asyncio.Queue()
@@ -102,3 +178,445 @@ class TestNotifier:
             await oban._notifier.notify("testing", {"test": "data"})
 
             await asyncio.wait_for(received.get(), timeout=1.0)
+
+
+class TestDispatcher:
+    async def test_coalescing_identical_payloads(self):
+        received = []
+        events = []
+
+        telemetry.attach(
+            "test-dispatch",
+            ["oban.notifier.dispatch"],
+            lambda _name, meta: events.append(meta),
+        )
+
+        async def callback(channel, payload):
+            received.append(payload)
+
+        dispatcher = _Dispatcher({"insert": {"token": callback}}, window=0.01)
+
+        for _ in range(100):
+            dispatcher.put("insert", encode_payload({"queue": "alpha"}))
+
+        dispatcher.put("insert", encode_payload({"queue": "gamma"}))
+
+        def assert_received():
+            assert len(received) == 2
+
+        await with_backoff(assert_received)
+
+        telemetry.detach("test-dispatch")
+
+        assert received == [{"queue": "alpha"}, {"queue": "gamma"}]
+        assert events == [
+            {"channel": "insert", "depth": 2, "coalesced": 99, "dropped": 0}
+        ]
+
+    async def test_dropping_payloads_beyond_the_bound(self):
+        received = []
+        events = []
+
+        telemetry.attach(
+            "test-dispatch",
+            ["oban.notifier.dispatch"],
+            lambda _name, meta: events.append(meta),
+        )
+
+        def callback(channel, payload):
+            received.append(payload)
+
+        dispatcher = _Dispatcher({"insert": {"token": callback}}, max_pending=2)
+
+        for index in range(5):
+            dispatcher.put("insert", encode_payload({"index": index}))
+
+        def assert_received():
+            assert len(received) == 2
+
+        await with_backoff(assert_received)
+
+        telemetry.detach("test-dispatch")
+
+        assert received == [{"index": 0}, {"index": 1}]
+        assert events[0]["dropped"] == 3
+
+    async def test_ignoring_channels_without_subscribers(self):
+        dispatcher = _Dispatcher({})
+
+        dispatcher.put("insert", encode_payload({"queue": "alpha"}))
+
+        assert not dispatcher._tasks
+
+
+class TestOutbox:
+    async def test_sending_buffered_notifications_together(self):
+        calls = []
+
+        async def send(channels, payloads):
+            calls.append((channels, payloads))
+
+        outbox = _Outbox(send, window=0.01)
+
+        outbox.put("gossip", ["a"])
+        outbox.put("metrics", ["b", "c"])
+
+        def assert_sent():
+            assert calls == [(["gossip", "metrics", "metrics"], ["a", "b", "c"])]
+
+        await with_backoff(assert_sent)
+
+    async def test_sending_notifications_put_during_a_send(self):
+        calls = []
+        sending = asyncio.Event()
+
+        async def send(channels, payloads):
+            calls.append(payloads)
+            sending.set()
+
+            await asyncio.sleep(0.05)
+
+        outbox = _Outbox(send, window=0.01)
+
+        outbox.put("signal", ["a"])
+
+        await sending.wait()
+
+        outbox.put("signal", ["b"])
+
+        def assert_sent():
+            assert calls == [["a"], ["b"]]
+
+        await with_backoff(assert_sent)
+
+    async def test_flushing_immediately(self):
+        calls = []
+
+        async def send(channels, payloads):
+            calls.append((channels, payloads))
+
+        outbox = _Outbox(send, window=60.0)
+
+        outbox.put("signal", ["a"])
+
+        await outbox.flush()
+
+        assert calls == [(["signal"], ["a"])]
+
+        await outbox.stop()
+
+
+class TestMemoryNotifier:
+    async def test_listen_and_notify(self):
+        received = asyncio.Queue()
+        notifier = MemoryNotifier()
+
+        def callback(channel, payload):
+            received.put_nowait((channel, payload))
+
+        await notifier.listen("testing", callback)
+        await notifier.notify("testing", {"message": "hello"})
+
+        result = await asyncio.wait_for(received.get(), timeout=1.0)
+
+        assert result == ("testing", {"message": "hello"})
+
+        await notifier.stop()
+
+    @pytest.mark.oban(
+        notifier="memory", queues={"default": 1}, stager={"interval": 5.0}
+    )
+    async def test_waking_local_queues_on_enqueue(self, oban_instance):
+        @worker()
+        class Worker:
+            async def process(self, job):
+                pass
+
+        async with oban_instance() as oban:
+            # Allow the initial staging pass to complete so only the enqueue can wake the queue
+            await asyncio.sleep(0.05)
+
+            job = await Worker.enqueue()
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=1.0)
+
+
+class TestSharedConnection:
+    @pytest.mark.oban()
+    async def test_sharing_one_connection_across_prefixes(self, oban_instance):
+        received = asyncio.Queue()
+
+        def callback(channel, payload):
+            received.put_nowait(payload)
+
+        async with oban_instance() as oban:
+            alpha = PostgresNotifier(query=oban._query, prefix="alpha")
+            omega = PostgresNotifier(query=oban._query, prefix="omega")
+
+            await alpha.start()
+            await omega.start()
+
+            try:
+                assert alpha._hub is omega._hub is oban._notifier._hub
+
+                await alpha.listen("testing", callback)
+                await omega.notify("testing", {"prefix": "omega"})
+                await alpha.notify("testing", {"prefix": "alpha"})
+
+                result = await asyncio.wait_for(received.get(), timeout=1.0)
+
+                assert result == {"prefix": "alpha"}
+                assert received.empty()
+            finally:
+                await alpha.stop()
+                await omega.stop()
+
+    @pytest.mark.oban()
+    async def test_closing_the_connection_with_the_last_notifier(self, oban_instance):
+        async with oban_instance() as oban:
+            private = PostgresNotifier(query=oban._query, shared=False)
+
+            await private.start()
+
+            hub = private._hub
+
+            assert hub is not oban._notifier._hub
+
+            await private.stop()
+
+            assert hub._conn.closed
+            assert not oban._notifier._hub._conn.closed
+
+
+class TestHybridNotifier:
+    @pytest.mark.oban(notifier="hybrid")
+    async def test_delivering_local_notifications_once(self, oban_instance):
+        received = asyncio.Queue()
+
+        def callback(channel, payload):
+            received.put_nowait((channel, payload))
+
+        async with oban_instance() as oban:
+            assert isinstance(oban._notifier, HybridNotifier)
+
+            await oban._notifier.listen("testing", callback)
+            await oban._notifier.notify("testing", {"message": "hello"})
+
+            result = await asyncio.wait_for(received.get(), timeout=1.0)
+
+            assert result == ("testing", {"message": "hello"})
+
+            # Give the echo time to arrive over LISTEN and be skipped
+            await asyncio.sleep(0.1)
+
+            assert received.empty()
+
+    @pytest.mark.oban(notifier="hybrid")
+    async def test_delivering_identical_notifications_from_other_nodes(
+        self, oban_instance
+    ):
+        received = asyncio.Queue()
+
+        def callback(channel, payload):
+            received.put_nowait(payload)
+
+        async with oban_instance() as oban:
+            notifier = oban._notifier
+
+            await notifier.listen("testing", callback)
+
+            # Hold back our own notifications, so their echoes are still outstanding
+            sent = []
+
+            async def holding_send(channels, payloads):
+                sent.extend(payloads)
+
+            notifier._outbox._send = holding_send
+
+            await notifier.notify("testing", {"action": "pause"})
+            await notifier.flush()
+
+            assert await asyncio.wait_for(received.get(), timeout=1.0) == {
+                "action": "pause"
+            }
+
+            # The same notification from another node
+            await oban._query.notify(
+                [notifier._to_full_channel("testing")],
+                [encode_payload({"action": "pause"})],
+            )
+
+            assert await asyncio.wait_for(received.get(), timeout=1.0) == {
+                "action": "pause"
+            }
+
+            # Our own echo is skipped once it does arrive
+            await oban._query.notify([notifier._to_full_channel("testing")], sent)
+
+            await asyncio.sleep(0.1)
+
+            assert received.empty()
+
+    @pytest.mark.oban(notifier="hybrid")
+    async def test_removing_the_sender_from_delivered_notifications(
+        self, oban_instance
+    ):
+        received = asyncio.Queue()
+
+        def callback(channel, payload):
+            received.put_nowait(payload)
+
+        async with oban_instance() as oban:
+            notifier = oban._notifier
+
+            await notifier.listen("testing", callback)
+
+            await oban._query.notify(
+                [notifier._to_full_channel("testing")],
+                [encode_payload({"action": "pause", "oban_sender": "other-node"})],
+            )
+
+            result = await asyncio.wait_for(received.get(), timeout=1.0)
+
+            assert result == {"action": "pause"}
+
+
+class TestPollingNotifierValidation:
+    def test_valid_config_passes(self):
+        PollingNotifier._validate(
+            batch_interval=0.005,
+            min_interval=0.05,
+            max_interval=1.0,
+            limit=1000,
+            retention=60.0,
+        )
+
+    def test_intervals_must_be_positive(self):
+        with pytest.raises(ValueError, match="min_interval must be positive"):
+            PollingNotifier._validate(
+                batch_interval=0.005,
+                min_interval=0,
+                max_interval=1.0,
+                limit=1000,
+                retention=60.0,
+            )
+
+    def test_max_interval_must_not_be_less_than_min_interval(self):
+        with pytest.raises(ValueError, match="max_interval must be at least"):
+            PollingNotifier._validate(
+                batch_interval=0.005,
+                min_interval=1.0,
+                max_interval=0.5,
+                limit=1000,
+                retention=60.0,
+            )
+
+
+class TestPollingNotifier:
+    @pytest.mark.oban(notifier="polling")
+    async def test_listen_and_notify(self, oban_instance):
+        received = asyncio.Queue()
+
+        def callback(channel, payload):
+            received.put_nowait((channel, payload))
+
+        async with oban_instance() as oban:
+            await oban._notifier.listen("testing", callback)
+            await oban._notifier.listen("ignored", callback)
+
+            await asyncio.gather(
+                oban._notifier.notify("testing", {"message": "hello"}),
+                oban._notifier.notify("testing", [{"message": "world"}]),
+            )
+
+            result_1 = await asyncio.wait_for(received.get(), timeout=2.0)
+            result_2 = await asyncio.wait_for(received.get(), timeout=2.0)
+
+            assert result_1 == ("testing", {"message": "hello"})
+            assert result_2 == ("testing", {"message": "world"})
+
+    @pytest.mark.oban(notifier="polling")
+    async def test_delivering_notifications_committed_out_of_order(self, oban_instance):
+        received = asyncio.Queue()
+
+        def callback(channel, payload):
+            received.put_nowait(payload)
+
+        async with oban_instance() as oban:
+            await oban._notifier.listen("testing", callback)
+
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        "INSERT INTO oban_notifications (channel, payload) VALUES (%s, %s)",
+                        ("testing", encode_payload({"n": 1})),
+                    )
+
+                    # Committed after the row above, but with a higher id
+                    await oban._notifier.notify("testing", {"n": 2})
+                    await oban._notifier.flush()
+
+                    result = await asyncio.wait_for(received.get(), timeout=2.0)
+
+                    assert result == {"n": 2}
+
+            result = await asyncio.wait_for(received.get(), timeout=2.0)
+
+            assert result == {"n": 1}
+
+    @pytest.mark.oban(notifier="polling")
+    async def test_skipping_notifications_sent_before_listening(self, oban_instance):
+        async with oban_instance() as oban:
+            notifier = oban._notifier
+
+            await notifier.notify("testing", {"n": 1})
+            await notifier.flush()
+            await notifier._poll()
+
+            await notifier.listen("testing", lambda _channel, _payload: None)
+
+            assert await notifier._poll() == 0
+
+    @pytest.mark.oban(notifier="polling")
+    async def test_pruning_delivered_notifications(self, oban_instance):
+        async with oban_instance() as oban:
+            notifier = oban._notifier
+
+            await notifier.notify("testing", [{"n": 1}, {"n": 2}])
+            await notifier.flush()
+
+            notifier._prune_at = 0.0
+            await notifier._prune()
+
+            await notifier.notify("testing", {"n": 3})
+            await notifier.flush()
+
+            notifier._prune_at = 0.0
+            await notifier._prune()
+
+            async with oban._connection() as conn:
+                result = await conn.execute("SELECT count(*) FROM oban_notifications")
+
+                assert (await result.fetchone())[0] == 1
+
+    @pytest.mark.oban(notifier="polling", queues={"default": 1})
+    async def test_executing_jobs_without_listen(self, oban_instance):
+        @worker()
+        class Worker:
+            async def process(self, job):
+                pass
+
+        async with oban_instance() as oban:
+            job = await Worker.enqueue()
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=2.0)
@@ -1,8 +1,10 @@
 import asyncio
+import math
 import pytest
 
 from oban import telemetry, worker
 from oban._producer import Producer
+from .helpers import with_backoff
 
 
 async def all_producers(conn):
@@ -92,7 +94,9 @@ class TestProducerTelemetry:
         calls = asyncio.Queue()
 
         def handler(_name, meta):
-            calls.put_nowait(meta)
+            # Skip the empty fetch that runs as soon as the producer starts
+            if meta["count"] > 0:
+                calls.put_nowait(meta)
 
         telemetry.attach("test-producer", ["oban.producer.get.stop"], handler)
 
@@ -130,3 +134,90 @@ class TestProducerAcks:
             fetched = await oban.get_job(job.id)
             assert fetched is not None
             assert fetched.state == "completed"
+
+
+class TestProducerBacklog:
+    @pytest.mark.oban(queues={"default": 2})
+    async def test_fetching_jobs_available_before_start(self, oban_instance):
+        oban = oban_instance()
+
+        # Insert directly so that no notification reaches the producer
+        async with oban._connection() as conn:
+            await conn.execute("""
+                INSERT INTO oban_jobs (queue, worker)
+                SELECT 'default', 'Missing'
+                FROM generate_series(1, 3)
+            """)
+
+        async with oban:
+
+            async def assert_drained():
+                async with oban._connection() as conn:
+                    result = await conn.execute(
+                        "SELECT count(*) FROM oban_jobs WHERE state = 'available'"
+                    )
+
+                    assert (await result.fetchone())[0] == 0
+
+            # The first fetch fills the whole demand, so the last job is only fetched
+            # because the producer keeps fetching until the queue drains
+            await with_backoff(assert_drained, timeout=3.0)
+
+    @pytest.mark.oban(queues={"default": 2})
+    async def test_safety_fetch_without_notifications(self, oban_instance):
+        async with oban_instance() as oban:
+            producer = oban._producers["default"]
+
+            async with oban._connection() as conn:
+                await conn.execute(
+                    "INSERT INTO oban_jobs (queue, worker) VALUES ('default', 'Missing')"
+                )
+
+            # Pretend the last fetch was long ago, as if an insert notification was lost
+            producer._last_fetch_time = -math.inf
+
+            async def assert_fetched():
+                async with oban._connection() as conn:
+                    result = await conn.execute(
+                        "SELECT count(*) FROM oban_jobs WHERE state = 'available'"
+                    )
+
+                    assert (await result.fetchone())[0] == 0
+
+            await with_backoff(assert_fetched, timeout=3.0)
+
+
+class TestProducerHeartbeats:
+    @pytest.mark.oban(queues={"default": 2}, lifeline={"heartbeat_interval": 0.05})
+    async def test_recording_heartbeats_for_running_jobs(self, oban_instance):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async with oban_instance() as oban:
+
+            @worker()
+            class SlowWorker:
+                async def process(self, job):
+                    started.set()
+
+                    await release.wait()
+
+            job = await oban.enqueue(SlowWorker.new())
+
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+
+            async def assert_heartbeat():
+                fetched = await oban.get_job(job.id)
+
+                assert "heartbeat_at" in fetched.meta
+
+            await with_backoff(assert_heartbeat)
+
+            release.set()
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed)
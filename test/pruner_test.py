@@ -1,18 +1,29 @@
+import asyncio
+import gzip
+import json
+
 import pytest
+import pytest_asyncio
 
+from oban import telemetry, worker
+from oban._config import Config
+from oban._extensions import _extensions, put_ext
 from oban._pruner import Pruner
+from oban._query import _retention_args
+from oban.schema import install
+from .helpers import with_backoff
 
 
-async def insert_job(conn, state, ago):
+async def insert_job(conn, state, ago, queue="default", worker="Worker"):
     ts_field = f"{state}_at"
 
     rows = await conn.execute(
         f"""
-            INSERT INTO oban_jobs (state, worker, {ts_field})
-            VALUES (%s, 'Worker', timezone('UTC', now()) - make_interval(secs => %s))
+            INSERT INTO oban_jobs (state, queue, worker, {ts_field})
+            VALUES (%s, %s, %s, timezone('UTC', now()) - make_interval(secs => %s))
             RETURNING id
             """,
-        (state, ago),
+        (state, queue, worker, ago),
     )
 
     (id,) = await rows.fetchone()
@@ -70,6 +81,81 @@ class TestPrunerValidation:
         with pytest.raises(ValueError, match="limit must be positive"):
             Pruner._validate(max_age=86_400, interval=60.0, limit=-1)
 
+    def test_budget_must_be_positive(self):
+        with pytest.raises(TypeError, match="budget must be a number"):
+            Pruner._validate(max_age=60, interval=60.0, limit=1, budget="10")
+
+        with pytest.raises(ValueError, match="budget must be positive"):
+            Pruner._validate(max_age=60, interval=60.0, limit=1, budget=0)
+
+    def test_pressure_thresholds_must_be_non_negative(self):
+        with pytest.raises(TypeError, match="max_lock_waits must be an integer"):
+            Pruner._validate(max_age=60, interval=60.0, limit=1, max_lock_waits=1.5)
+
+        with pytest.raises(ValueError, match="max_lock_waits must be non-negative"):
+            Pruner._validate(max_age=60, interval=60.0, limit=1, max_lock_waits=-1)
+
+        with pytest.raises(ValueError, match="max_lag must be non-negative"):
+            Pruner._validate(max_age=60, interval=60.0, limit=1, max_lag=-1.0)
+
+    def test_max_age_by_state(self):
+        Pruner._validate(
+            max_age={"completed": 60, "discarded": 3600}, interval=1.0, limit=1
+        )
+
+        with pytest.raises(ValueError, match="max_age states must be in"):
+            Pruner._validate(max_age={"executing": 60}, interval=1.0, limit=1)
+
+        with pytest.raises(TypeError, match="max_age must be an integer"):
+            Pruner._validate(max_age={"completed": 1.5}, interval=1.0, limit=1)
+
+        with pytest.raises(ValueError, match="max_age must be positive"):
+            Pruner._validate(max_age={"cancelled": 0}, interval=1.0, limit=1)
+
+    def test_archive_options(self):
+        Pruner._validate(max_age=60, interval=1.0, limit=1, archive="table")
+        Pruner._validate(
+            max_age=60, interval=1.0, limit=1, archive="jsonl", archive_path="archive"
+        )
+
+        with pytest.raises(ValueError, match="archive must be one of"):
+            Pruner._validate(max_age=60, interval=1.0, limit=1, archive="s3")
+
+        with pytest.raises(TypeError, match="archive_path must be a string"):
+            Pruner._validate(max_age=60, interval=1.0, limit=1, archive="jsonl")
+
+        with pytest.raises(ValueError, match="archive_max_age must be positive"):
+            Pruner._validate(max_age=60, interval=1.0, limit=1, archive_max_age=0)
+
+    def test_retention_rules(self):
+        rules = [{"queue": "mailers", "state": "completed", "max_age": 600}]
+
+        Pruner._validate(max_age=60, interval=1.0, limit=1, rules=rules)
+
+        with pytest.raises(TypeError, match="rules must be a list"):
+            Pruner._validate(max_age=60, interval=1.0, limit=1, rules={"max_age": 60})
+
+        with pytest.raises(ValueError, match="rule keys must be in"):
+            Pruner._validate(
+                max_age=60, interval=1.0, limit=1, rules=[{"tag": "a", "max_age": 60}]
+            )
+
+        with pytest.raises(ValueError, match="rules must have a max_age"):
+            Pruner._validate(max_age=60, interval=1.0, limit=1, rules=[{"queue": "a"}])
+
+        with pytest.raises(TypeError, match="rule worker must be a string"):
+            Pruner._validate(
+                max_age=60, interval=1.0, limit=1, rules=[{"worker": 1, "max_age": 60}]
+            )
+
+        with pytest.raises(ValueError, match="rule state must be in"):
+            Pruner._validate(
+                max_age=60,
+                interval=1.0,
+                limit=1,
+                rules=[{"state": "available", "max_age": 60}],
+            )
+
     def test_boundary_values_pass(self):
         # Minimum allowed values
         Pruner._validate(max_age=60, interval=1.0, limit=1)
@@ -78,6 +164,27 @@ class TestPrunerValidation:
         Pruner._validate(max_age=86_400, interval=60.0, limit=100_000)
 
 
+class TestRetentionArgs:
+    def test_floors_start_at_the_shortest_reachable_age(self):
+        args = _retention_args(
+            600,
+            [
+                {"queue": "noisy", "max_age": 60},
+                {"state": "discarded", "max_age": 2_592_000},
+                {"state": "discarded", "max_age": 30},
+            ],
+        )
+
+        assert args["completed_floor"] == 60
+        assert args["discarded_floor"] == 60
+
+        args = _retention_args(600, [{"state": "discarded", "max_age": 2_592_000}])
+
+        # Every discarded job matches the rule, so the default age never applies to them
+        assert args["completed_floor"] == 600
+        assert args["discarded_floor"] == 2_592_000
+
+
 class TestPruner:
     @pytest.mark.oban(leadership=True, pruner={"max_age": 60})
     async def test_pruner_deletes_expired_jobs(self, oban_instance):
@@ -101,3 +208,330 @@ class TestPruner:
                 job_ids = await get_ids(conn)
 
             assert [id_1, id_2, id_3] == job_ids
+
+    @pytest.mark.oban(
+        leadership=True,
+        pruner={"max_age": {"completed": 60, "discarded": 3600}},
+    )
+    async def test_pruning_with_max_age_by_state(self, oban_instance):
+        async with oban_instance() as oban:
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    await insert_job(conn, "completed", 61)
+                    await insert_job(conn, "discarded", 3601)
+
+                    id_1 = await insert_job(conn, "discarded", 61)
+                    id_2 = await insert_job(conn, "cancelled", 3601)
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                assert await get_ids(conn) == [id_1, id_2]
+
+    @pytest.mark.oban(
+        leadership=True,
+        pruner={
+            "max_age": 600,
+            "rules": [
+                {"state": "discarded", "max_age": 3600},
+                {"queue": "noisy", "max_age": 60},
+                {"worker": "Report", "state": "completed", "max_age": 7200},
+            ],
+        },
+    )
+    async def test_pruning_with_retention_rules(self, oban_instance):
+        async with oban_instance() as oban:
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    await insert_job(conn, "completed", 61, queue="noisy")
+                    await insert_job(conn, "completed", 601)
+                    await insert_job(conn, "discarded", 3601, queue="noisy")
+
+                    id_1 = await insert_job(conn, "completed", 59, queue="noisy")
+                    id_2 = await insert_job(conn, "completed", 599)
+                    id_3 = await insert_job(conn, "discarded", 601, queue="noisy")
+                    id_4 = await insert_job(conn, "completed", 601, worker="Report")
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                assert await get_ids(conn) == [id_1, id_2, id_3, id_4]
+
+    @pytest.mark.oban(leadership=True, pruner={"max_age": 60, "limit": 10})
+    async def test_pruning_with_extensions(self, oban_instance):
+        calls = []
+
+        async def prune(query, max_age, limit):
+            calls.append(("prune", max_age, limit))
+
+        async def prune_batch(query, max_age, limit, **opts):
+            calls.append(("batch", max_age, limit))
+
+        try:
+            async with oban_instance() as oban:
+                put_ext("pruner.prune", prune)
+
+                await oban._pruner._prune()
+
+                del _extensions["pruner.prune"]
+                put_ext("pruner.prune_batch", prune_batch)
+
+                await oban._pruner._prune()
+        finally:
+            _extensions.pop("pruner.prune", None)
+            _extensions.pop("pruner.prune_batch", None)
+
+        # Batches without a count end the pass
+        assert calls == [("prune", 60, 10), ("batch", 60, 10)]
+
+    @pytest.mark.oban(
+        leadership=True,
+        pruner={"max_age": 60, "archive": "table", "archive_max_age": 3600},
+    )
+    async def test_archiving_pruned_jobs_to_a_table(self, oban_instance):
+        async with oban_instance() as oban:
+            async with oban._connection() as conn:
+                await insert_job(conn, "completed", 61)
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        "UPDATE oban_jobs_archive SET archived_at = archived_at - interval '2 hours'"
+                    )
+
+                    id_1 = await insert_job(conn, "completed", 61)
+                    id_2 = await insert_job(conn, "scheduled", 61)
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                assert await get_ids(conn) == [id_2]
+
+                rows = await conn.execute("SELECT id FROM oban_jobs_archive")
+
+                assert await rows.fetchall() == [(id_1,)]
+
+            job = await oban.get_job(id_1)
+
+            assert job.id == id_1
+            assert job.state == "completed"
+
+    async def test_archiving_pruned_jobs_to_jsonl(self, oban_instance, tmp_path):
+        pruner = {"max_age": 60, "archive": "jsonl", "archive_path": str(tmp_path)}
+
+        async with oban_instance(leadership=True, pruner=pruner) as oban:
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    id_1 = await insert_job(conn, "completed", 61)
+                    id_2 = await insert_job(conn, "discarded", 61)
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                assert await get_ids(conn) == []
+
+        (path,) = tmp_path.glob("oban_jobs-*.jsonl.gz")
+
+        with gzip.open(path, "rt") as file:
+            rows = [json.loads(line) for line in file]
+
+        assert sorted(row["id"] for row in rows) == [id_1, id_2]
+        assert {row["worker"] for row in rows} == {"Worker"}
+
+    @pytest.mark.oban(leadership=True, pruner={"max_age": 60, "limit": 2})
+    async def test_pruning_in_batches_until_cleared(self, oban_instance):
+        calls = []
+
+        def handler(name, metadata):
+            calls.append(metadata)
+
+        telemetry.attach("test-pruner", ["oban.pruner.prune.stop"], handler)
+
+        try:
+            async with oban_instance() as oban:
+                async with oban._connection() as conn:
+                    async with conn.transaction():
+                        for _ in range(5):
+                            await insert_job(conn, "completed", 61)
+
+                await oban._pruner._prune()
+
+                async with oban._connection() as conn:
+                    assert await get_ids(conn) == []
+        finally:
+            telemetry.detach("test-pruner")
+
+        (meta,) = calls
+
+        assert meta["pruned_count"] == 5
+        assert meta["batch_count"] == 3
+        assert meta["backlog"] == 0
+        assert meta["rows_per_second"] > 0
+
+    @pytest.mark.oban(leadership=True, pruner={"max_age": 60, "limit": 8})
+    async def test_backing_off_under_pressure(self, oban_instance):
+        async with oban_instance() as oban:
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    await insert_job(conn, "completed", 61)
+
+            async def prune_pressure():
+                return (10, 0.0)
+
+            oban._query.prune_pressure = prune_pressure
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                assert len(await get_ids(conn)) == 1
+
+            assert oban._pruner._batch_size == 4
+
+
+@pytest_asyncio.fixture
+async def partitioned(test_dsn):
+    # Types are only created when missing from the current schema
+    dsn = f"{test_dsn}?options=-csearch_path%3Dpartitioned"
+    pool = await Config(dsn=dsn, pool_min_size=1, pool_max_size=2).create_pool()
+
+    async with pool.connection() as conn:
+        await conn.execute("DROP SCHEMA IF EXISTS partitioned CASCADE")
+        await conn.execute("CREATE SCHEMA partitioned")
+
+    await install(pool, prefix="partitioned", partitioned=True)
+
+    try:
+        yield pool
+    finally:
+        async with pool.connection() as conn:
+            await conn.execute("DROP SCHEMA partitioned CASCADE")
+
+        await pool.close()
+
+
+async def create_partition(conn, day, next_day):
+    await conn.execute(
+        f"""
+        CREATE TABLE partitioned.oban_jobs_terminal_{day.replace("-", "")}
+        PARTITION OF partitioned.oban_jobs_terminal
+        FOR VALUES FROM ('{day}') TO ('{next_day}')
+        """
+    )
+
+
+async def insert_finished_job(conn, inserted_at, ago):
+    rows = await conn.execute(
+        """
+        INSERT INTO partitioned.oban_jobs (state, worker, inserted_at, completed_at)
+        VALUES ('completed', 'Worker', %s, timezone('UTC', now()) - make_interval(secs => %s))
+        RETURNING id
+        """,
+        (inserted_at, ago),
+    )
+
+    (id,) = await rows.fetchone()
+
+    return id
+
+
+async def list_partitions(conn):
+    rows = await conn.execute(
+        """
+        SELECT relname FROM pg_inherits
+        JOIN pg_class ON pg_class.oid = inhrelid
+        WHERE inhparent = 'partitioned.oban_jobs_terminal'::regclass
+        ORDER BY relname
+        """
+    )
+
+    return [name for (name,) in await rows.fetchall()]
+
+
+class TestPartitionedPruner:
+    @pytest.mark.oban(leadership=True, prefix="partitioned", pruner={"max_age": 60})
+    async def test_dropping_expired_partitions(self, partitioned, oban_instance):
+        async with oban_instance() as oban:
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    await create_partition(conn, "2020-01-01", "2020-01-02")
+                    await create_partition(conn, "2020-01-02", "2020-01-03")
+
+                    await insert_finished_job(conn, "2020-01-01 12:00", 61)
+
+                    # Inserted long ago, but only just finished
+                    id_1 = await insert_finished_job(conn, "2020-01-02 12:00", 30)
+
+                    # Outside of any daily partition, pruned by deleting
+                    await insert_finished_job(conn, "2019-06-01 12:00", 61)
+                    id_2 = await insert_finished_job(conn, "2019-06-01 12:00", 30)
+
+            await oban._pruner._prune()
+
+            async with oban._connection() as conn:
+                partitions = await list_partitions(conn)
+                rows = await conn.execute("SELECT id FROM partitioned.oban_jobs")
+                job_ids = sorted(id for (id,) in await rows.fetchall())
+
+            assert "oban_jobs_terminal_20200101" not in partitions
+            assert "oban_jobs_terminal_20200102" in partitions
+            assert "oban_jobs_terminal_default" in partitions
+            assert len(partitions) == 5
+            assert [id_1, id_2] == job_ids
+
+    @pytest.mark.oban(prefix="partitioned", queues={"alpha": 1})
+    async def test_processing_jobs_through_partitions(self, partitioned, oban_instance):
+        @worker(queue="alpha")
+        class PartitionedWorker:
+            async def process(self, job):
+                pass
+
+        async with oban_instance() as oban:
+            job = await oban.enqueue(PartitionedWorker.new())
+
+            async def assert_finished():
+                async with oban._connection() as conn:
+                    rows = await conn.execute(
+                        "SELECT state, tableoid::regclass::text FROM partitioned.oban_jobs"
+                        " WHERE id = %s",
+                        (job.id,),
+                    )
+
+                    assert await rows.fetchone() == (
+                        "completed",
+                        "partitioned.oban_jobs_terminal_default",
+                    )
+
+            await with_backoff(assert_finished)
+
+    @pytest.mark.oban(prefix="partitioned")
+    async def test_cancelling_jobs_moved_by_a_concurrent_update(
+        self, partitioned, oban_instance
+    ):
+        async with oban_instance() as oban:
+            async with oban._connection() as conn:
+                async with conn.transaction():
+                    rows = await conn.execute(
+                        "INSERT INTO partitioned.oban_jobs (worker) VALUES ('Worker') RETURNING id"
+                    )
+
+                    (id,) = await rows.fetchone()
+
+                # Completing the job moves it out of the active partition while the cancel
+                # waits on its lock
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        UPDATE partitioned.oban_jobs
+                        SET state = 'completed', completed_at = timezone('UTC', now())
+                        WHERE id = %s
+                        """,
+                        (id,),
+                    )
+
+                    cancel = asyncio.create_task(oban._query.cancel_many_jobs([id]))
+
+                    await asyncio.sleep(0.2)
+
+            assert await cancel == (0, [])
@@ -105,3 +105,21 @@ class TestRefresher:
             assert alpha[3] == "alpha"
 
         await oban.stop()
+
+    @pytest.mark.oban(queues={"alpha": 1})
+    async def test_refresher_registers_missing_producers(self, oban_instance):
+        oban = oban_instance()
+
+        await oban.start()
+
+        async with oban._connection() as conn:
+            async with conn.transaction():
+                await conn.execute("DELETE FROM oban_producers")
+
+            await oban._refresher._refresh()
+
+            (alpha,) = await all_producers(conn)
+
+            assert str(alpha[0]) == oban._producers["alpha"]._uuid
+
+        await oban.stop()
@@ -1,7 +1,7 @@
 import pytest
 import random
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from oban import job, worker
@@ -11,6 +11,7 @@ from oban._scheduler import (
     clear_scheduled,
     scheduled_entries,
 )
+from oban._stager import insert_channel
 
 
 class TestExpressionParse:
@@ -20,6 +21,16 @@ class TestExpressionParse:
         with pytest.raises(ValueError, match="incorrect number of fields"):
             Expression.parse("* * *")
 
+    def test_parsing_six_field_expressions(self):
+        expr = Expression.parse("*/20 * * * * *")
+
+        assert expr.has_seconds
+        assert {0, 20, 40} == expr.seconds
+        assert not Expression.parse("* * * * *").has_seconds
+
+        with pytest.raises(ValueError, match="out of range"):
+            Expression.parse("60 * * * * *")
+
     def test_parsing_nicknames(self):
         assert {0} == Expression.parse("@hourly").minutes
         assert {0} == Expression.parse("@daily").hours
@@ -166,6 +177,102 @@ class TestExpressionIsNow:
 
         assert Expression.parse("* * * * SUN").is_now(sunday)
 
+    def test_matching_seconds(self):
+        time = datetime(2025, 1, 1, 12, 0, 30)
+
+        assert Expression.parse("30 * * * * *").is_now(time)
+        assert not Expression.parse("15 * * * * *").is_now(time)
+        assert Expression.parse("* * * * *").is_now(time)
+
+
+class TestExpressionNextAt:
+    def utc(self, *args):
+        return datetime(*args, tzinfo=timezone.utc)
+
+    def test_finding_the_next_minute(self):
+        expr = Expression.parse("* * * * *")
+
+        assert expr.next_at(self.utc(2025, 1, 1, 0, 0, 30)) == self.utc(
+            2025, 1, 1, 0, 1
+        )
+        assert expr.next_at(self.utc(2025, 1, 1, 0, 0)) == self.utc(2025, 1, 1, 0, 1)
+
+    def test_finding_the_next_second(self):
+        expr = Expression.parse("*/10 * * * * *")
+        runs = list(expr.iter_next(4, self.utc(2025, 1, 1, 0, 0, 35)))
+
+        assert runs == [
+            self.utc(2025, 1, 1, 0, 0, 40),
+            self.utc(2025, 1, 1, 0, 0, 50),
+            self.utc(2025, 1, 1, 0, 1, 0),
+            self.utc(2025, 1, 1, 0, 1, 10),
+        ]
+
+    def test_rolling_over_fields(self):
+        after = self.utc(2025, 12, 31, 23, 59)
+
+        assert Expression.parse("*/15 * * * *").next_at(after) == self.utc(2026, 1, 1)
+        assert Expression.parse("30 9 * * *").next_at(after) == self.utc(
+            2026, 1, 1, 9, 30
+        )
+        assert Expression.parse("0 0 1 MAR *").next_at(after) == self.utc(2026, 3, 1)
+
+    def test_matching_weekdays_and_leap_days(self):
+        # October 11th, 2025 was a Saturday
+        after = self.utc(2025, 10, 11)
+
+        assert Expression.parse("0 9 * * MON-FRI").next_at(after) == self.utc(
+            2025, 10, 13, 9
+        )
+        assert Expression.parse("0 0 29 2 *").next_at(after) == self.utc(2028, 2, 29)
+
+    def test_expressions_that_never_fire(self):
+        assert Expression.parse("0 0 30 2 *").next_at(self.utc(2025, 1, 1)) is None
+
+    def test_evaluating_in_a_timezone(self):
+        chicago = ZoneInfo("America/Chicago")
+        expr = Expression.parse("0 9 * * *")
+
+        assert expr.next_at(self.utc(2025, 6, 1), chicago) == datetime(
+            2025, 6, 1, 9, tzinfo=chicago
+        )
+
+    def test_skipping_times_missing_from_daylight_saving_gaps(self):
+        chicago = ZoneInfo("America/Chicago")
+        expr = Expression.parse("30 2 * * *")
+
+        # 2:30 didn't exist in Chicago on March 9th, 2025
+        assert expr.next_at(datetime(2025, 3, 8, 12, tzinfo=chicago)) == datetime(
+            2025, 3, 10, 2, 30, tzinfo=chicago
+        )
+
+    def test_iterating_upcoming_runs(self):
+        expr = Expression.parse("0 */6 * * *")
+        runs = list(expr.iter_next(5, self.utc(2025, 1, 1)))
+
+        assert [run.hour for run in runs] == [6, 12, 18, 0, 6]
+        assert list(Expression.parse("0 0 30 2 *").iter_next(3)) == []
+
+    @pytest.mark.parametrize("seed", range(1, 10))
+    def test_agreeing_with_is_now(self, seed):
+        random.seed(seed)
+
+        expr = Expression.parse(
+            f"{random.randint(0, 59)} */{random.randint(1, 6)} * * *"
+        )
+        time = self.utc(2025, random.randint(1, 12), random.randint(1, 28))
+
+        for _ in range(3):
+            fire_at = expr.next_at(time)
+
+            assert expr.is_now(fire_at)
+            assert not any(
+                expr.is_now(time + timedelta(minutes=offset))
+                for offset in range(1, int((fire_at - time).total_seconds() // 60))
+            )
+
+            time = fire_at
+
 
 class TestScheduledRegistration:
     @pytest.fixture(autouse=True)
@@ -245,8 +352,11 @@ class TestSchedulerEvaluate:
     @pytest.fixture
     def mock_notifier(self):
         class MockNotifier:
+            def __init__(self):
+                self.notified = []
+
             async def notify(self, channel, payload):
-                pass
+                self.notified.append((channel, payload))
 
         return MockNotifier()
 
@@ -295,6 +405,30 @@ class TestSchedulerEvaluate:
 
         assert len(mock_query.enqueued_jobs) == 2
 
+    async def test_notifying_sharded_insert_channels(self, mock_query, mock_notifier):
+        @worker(queue="alpha", cron="* * * * *")
+        class AlphaWorker:
+            async def process(self, job):
+                pass
+
+        @worker(queue="omega", cron="* * * * *")
+        class OmegaWorker:
+            async def process(self, job):
+                pass
+
+        scheduler = Scheduler(
+            leader=None, notifier=mock_notifier, query=mock_query, insert_shards=64
+        )
+
+        await scheduler._evaluate()
+
+        assert sorted(mock_notifier.notified) == sorted(
+            [
+                (insert_channel("alpha", 64), [{"queue": "alpha"}]),
+                (insert_channel("omega", 64), [{"queue": "omega"}]),
+            ]
+        )
+
     async def test_injects_cron_metadata(self, scheduler, mock_query):
         @worker(queue="meta", cron="* * * * *")
         class MetaWorker:
@@ -363,6 +497,258 @@ class TestSchedulerEvaluate:
 
         assert len(mock_query.enqueued_jobs) == 2
 
+    async def test_only_rescheduling_due_entries(self, scheduler, mock_query):
+        @worker(queue="minute", cron="* * * * *")
+        class MinuteWorker:
+            async def process(self, job):
+                pass
+
+        @worker(queue="yearly", cron="@yearly")
+        class YearlyWorker:
+            async def process(self, job):
+                pass
+
+        now = datetime(2025, 6, 1, 12, 30, tzinfo=timezone.utc)
+
+        await scheduler._evaluate(now)
+
+        yearly = next(
+            item for item in scheduler._heap if item[2].worker_cls is YearlyWorker
+        )
+
+        await scheduler._evaluate(now + timedelta(minutes=1))
+
+        assert [job.queue for job in mock_query.enqueued_jobs] == ["minute", "minute"]
+        assert yearly in scheduler._heap
+        assert scheduler._heap[0][0] == now + timedelta(minutes=2)
+
+    async def test_inserting_six_field_runs_ahead_of_time(self, scheduler, mock_query):
+        @worker(queue="seconds", cron="*/15 * * * * *")
+        class SecondsWorker:
+            async def process(self, job):
+                pass
+
+        now = datetime(2025, 6, 1, 12, 30, 14, tzinfo=timezone.utc)
+
+        await scheduler._evaluate(now)
+
+        (job,) = mock_query.enqueued_jobs
+
+        assert job.scheduled_at == now + timedelta(seconds=1)
+        assert job.meta["cron_at"] == job.scheduled_at.isoformat()
+
+        await scheduler._evaluate(now + timedelta(seconds=1))
+
+        assert len(mock_query.enqueued_jobs) == 1
+        assert scheduler._heap[0][3] == now + timedelta(seconds=16)
+
+    async def test_waking_for_the_next_due_second(self, mock_query, mock_notifier):
+        class MockLeader:
+            is_leader = True
+
+        scheduler = Scheduler(
+            leader=MockLeader(), notifier=mock_notifier, query=mock_query
+        )
+
+        @worker(queue="seconds", cron="*/15 * * * * *")
+        class SecondsWorker:
+            async def process(self, job):
+                pass
+
+        now = datetime(2025, 6, 1, 12, 30, 20, tzinfo=timezone.utc)
+
+        await scheduler._evaluate(now)
+
+        assert scheduler._time_to_next_run(now) == 9.0
+        assert scheduler._time_to_next_run(now + timedelta(seconds=30)) == 0.0
+
+
+class TestSchedulerValidation:
+    def test_catch_up_window_must_be_non_negative(self):
+        Scheduler._validate(catch_up_window=0, catch_up_limit=100)
+
+        with pytest.raises(TypeError, match="catch_up_window must be a number"):
+            Scheduler._validate(catch_up_window="1h", catch_up_limit=100)
+
+        with pytest.raises(ValueError, match="catch_up_window must be non-negative"):
+            Scheduler._validate(catch_up_window=-1, catch_up_limit=100)
+
+    def test_catch_up_limit_must_be_positive(self):
+        with pytest.raises(TypeError, match="catch_up_limit must be an integer"):
+            Scheduler._validate(catch_up_window=60, catch_up_limit=1.5)
+
+        with pytest.raises(ValueError, match="catch_up_limit must be positive"):
+            Scheduler._validate(catch_up_window=60, catch_up_limit=0)
+
+
+class TestSchedulerCatchUp:
+    @pytest.fixture(autouse=True)
+    def clear_scheduled(self):
+        clear_scheduled()
+        yield
+        clear_scheduled()
+
+    @pytest.fixture
+    def mock_query(self):
+        class MockQuery:
+            def __init__(self):
+                self.enqueued_jobs = []
+                self.recorded = {}
+
+            async def insert_jobs(self, jobs):
+                self.enqueued_jobs.extend(jobs)
+                return jobs
+
+            async def cron_last_runs(self, names):
+                return {
+                    name: self.recorded[name] for name in names if name in self.recorded
+                }
+
+            async def record_cron_runs(self, runs):
+                self.recorded.update(runs)
+
+        return MockQuery()
+
+    @pytest.fixture
+    def mock_notifier(self):
+        class MockNotifier:
+            async def notify(self, channel, payload):
+                pass
+
+        return MockNotifier()
+
+    def cron_times(self, mock_query):
+        return [job.meta["cron_at"] for job in mock_query.enqueued_jobs]
+
+    async def test_skipping_stalled_runs_without_a_window(
+        self, mock_query, mock_notifier
+    ):
+        @worker(cron="* * * * *")
+        class MinuteWorker:
+            async def process(self, job):
+                pass
+
+        scheduler = Scheduler(leader=None, notifier=mock_notifier, query=mock_query)
+        now = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+        await scheduler._evaluate(now)
+        await scheduler._evaluate(now + timedelta(minutes=3))
+
+        assert self.cron_times(mock_query) == [
+            "2025-06-01T12:00:00+00:00",
+            "2025-06-01T12:03:00+00:00",
+        ]
+
+    async def test_inserting_stalled_runs_within_the_window(
+        self, mock_query, mock_notifier
+    ):
+        @worker(cron="* * * * *")
+        class MinuteWorker:
+            async def process(self, job):
+                pass
+
+        scheduler = Scheduler(
+            leader=None,
+            notifier=mock_notifier,
+            query=mock_query,
+            catch_up_window=120,
+            catch_up_limit=1,
+        )
+        now = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+        await scheduler._evaluate(now)
+        await scheduler._evaluate(now + timedelta(minutes=4))
+
+        # Only 12:02 and 12:03 are in the window, and the limit keeps the latest
+        assert self.cron_times(mock_query) == [
+            "2025-06-01T12:00:00+00:00",
+            "2025-06-01T12:03:00+00:00",
+            "2025-06-01T12:04:00+00:00",
+        ]
+
+        assert list(mock_query.recorded.values()) == [now + timedelta(minutes=4)]
+
+    async def test_inserting_the_most_recent_recorded_missed_runs(
+        self, mock_query, mock_notifier
+    ):
+        @worker(cron="*/10 * * * * *")
+        class TenSecondWorker:
+            async def process(self, job):
+                pass
+
+        scheduler = Scheduler(
+            leader=None,
+            notifier=mock_notifier,
+            query=mock_query,
+            catch_up_window=3600,
+            catch_up_limit=5,
+        )
+        now = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+        name = scheduler._cron_name(scheduled_entries()[0])
+
+        mock_query.recorded[name] = now - timedelta(hours=3)
+
+        await scheduler._evaluate(now, catch_up=True)
+
+        # The limit keeps the latest runs in the window rather than the earliest
+        assert self.cron_times(mock_query) == [
+            "2025-06-01T11:59:20+00:00",
+            "2025-06-01T11:59:30+00:00",
+            "2025-06-01T11:59:40+00:00",
+            "2025-06-01T11:59:50+00:00",
+            "2025-06-01T12:00:00+00:00",
+        ]
+
+    @pytest.mark.oban(scheduler={"catch_up_window": 3600})
+    async def test_inserting_runs_missed_before_leadership(self, oban_instance):
+        @worker(queue="hourly", cron="0 * * * *")
+        class HourlyWorker:
+            async def process(self, job):
+                pass
+
+        oban = oban_instance()
+        scheduler = oban._scheduler
+        now = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
+        name = scheduler._cron_name(scheduled_entries()[0])
+
+        await oban._query.record_cron_runs({name: now - timedelta(hours=3)})
+        await scheduler._evaluate(now, catch_up=True)
+
+        (job,) = await oban._query.all_jobs(["available"])
+
+        assert job.meta["cron_at"] == now.replace(minute=0).isoformat()
+
+        last_runs = await oban._query.cron_last_runs([name])
+
+        assert last_runs == {name: now.replace(minute=0)}
+
+
+class TestSchedulerIdempotence:
+    @pytest.fixture(autouse=True)
+    def clear_scheduled(self):
+        clear_scheduled()
+        yield
+        clear_scheduled()
+
+    @pytest.mark.oban()
+    async def test_inserting_each_run_once_across_nodes(self, oban_instance):
+        @worker(queue="minute", cron="* * * * *")
+        class MinuteWorker:
+            async def process(self, job):
+                pass
+
+        oban_1 = oban_instance(node="node.1")
+        oban_2 = oban_instance(node="node.2")
+        now = datetime.now(timezone.utc)
+
+        await oban_1._scheduler._evaluate(now)
+        await oban_2._scheduler._evaluate(now)
+        await oban_2._scheduler._evaluate(now + timedelta(minutes=1))
+
+        jobs = await oban_1._query.all_jobs(["available"])
+
+        assert len(jobs) == 2
+
 
 class TestSchedulerTimeToNextMinute:
     @pytest.fixture
@@ -51,11 +51,21 @@ class TestInstallSql:
     def test_contains_expected_schema_elements(self):
         sql = install_sql()
 
+        assert "public.oban_crons" in sql
         assert "public.oban_job_state" in sql
         assert "public.oban_jobs" in sql
         assert "public.oban_leaders" in sql
+        assert "public.oban_notifications" in sql
         assert "public.oban_producers" in sql
 
+    def test_partitioning_the_jobs_table(self):
+        sql = install_sql(partitioned=True)
+
+        assert "PARTITION BY LIST (state)" in sql
+        assert "public.oban_jobs_active" in sql
+        assert "public.oban_jobs_terminal_default" in sql
+        assert "PARTITION BY" not in install_sql()
+
     def test_scoping_elements_to_the_prefix(self):
         sql = install_sql(prefix="isolated")
 
@@ -83,8 +93,10 @@ class TestInstall:
 
         tables = await list_tables(isolated_db)
 
+        assert "oban_crons" in tables
         assert "oban_jobs" in tables
         assert "oban_leaders" in tables
+        assert "oban_notifications" in tables
         assert "oban_producers" in tables
 
     async def test_creates_schema_in_database_using_prefix(self, isolated_db):
@@ -1,6 +1,20 @@
+import asyncio
 import pytest
+from datetime import datetime, timedelta, timezone
 
-from oban._stager import Stager
+from oban import worker
+from oban._stager import Stager, insert_channel
+from .helpers import with_backoff
+
+
+@worker()
+class Worker:
+    async def process(self, job):
+        pass
+
+
+def assert_receiving(oban):
+    assert oban._stager._is_receiving()
 
 
 class TestStagerValidation:
@@ -31,3 +45,211 @@ class TestStagerValidation:
 
         with pytest.raises(ValueError, match="limit must be positive"):
             Stager._validate(interval=1.0, limit=-1)
+
+    def test_mode_must_be_known(self):
+        Stager._validate(interval=1.0, limit=20_000, mode="global")
+
+        with pytest.raises(ValueError, match="mode must be one of"):
+            Stager._validate(interval=1.0, limit=20_000, mode="leader")
+
+    def test_shards_must_be_a_positive_integer(self):
+        Stager._validate(interval=1.0, limit=20_000, shards=8)
+
+        with pytest.raises(TypeError, match="shards must be an integer"):
+            Stager._validate(interval=1.0, limit=20_000, shards=2.5)
+
+        with pytest.raises(ValueError, match="shards must be positive"):
+            Stager._validate(interval=1.0, limit=20_000, shards=0)
+
+
+class TestStaging:
+    def test_waking_every_queue_without_sql_notifications(self):
+        class Producer:
+            def __init__(self):
+                self.notified = 0
+
+            def notify(self):
+                self.notified += 1
+
+        class Notifier:
+            delivers_sql_notifications = True
+
+        producers = {"alpha": Producer(), "beta": Producer()}
+
+        stager = Stager(
+            query=None, leader=None, notifier=Notifier(), producers=producers
+        )
+        stager._notify_producers(["alpha"])
+
+        assert [producer.notified for producer in producers.values()] == [1, 0]
+
+        # Custom notifiers that don't declare it are assumed not to deliver pg_notify
+        stager = Stager(query=None, leader=None, notifier=object(), producers=producers)
+        stager._notify_producers(["alpha"])
+
+        assert [producer.notified for producer in producers.values()] == [2, 1]
+
+    @pytest.mark.oban(queues={"default": 1}, stager={"interval": 5.0})
+    async def test_staging_jobs_when_due_rather_than_on_interval(self, oban_instance):
+        async with oban_instance() as oban:
+            # Allow the initial staging pass to complete before scheduling
+            await asyncio.sleep(0.05)
+
+            scheduled_at = datetime.now(timezone.utc) + timedelta(milliseconds=200)
+            job = await Worker.enqueue({}, scheduled_at=scheduled_at)
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=2.0)
+
+    @pytest.mark.oban(notifier="postgres", stager={"interval": 5.0})
+    async def test_notifying_only_for_jobs_due_within_the_interval(self, oban_instance):
+        received = asyncio.Queue()
+
+        def callback(_channel, payload):
+            received.put_nowait(payload)
+
+        async with oban_instance() as oban:
+            await oban._notifier.listen("insert", callback)
+
+            now = datetime.now(timezone.utc)
+
+            await Worker.enqueue({}, scheduled_at=now + timedelta(hours=1))
+            await Worker.enqueue({}, scheduled_at=now + timedelta(seconds=2))
+
+            payload = await asyncio.wait_for(received.get(), timeout=1.0)
+
+            assert payload == {"queue": "default", "scheduled": True}
+            assert received.empty()
+
+    @pytest.mark.oban(queues={"default": 1}, stager={"interval": 5.0})
+    async def test_tracking_the_next_due_job_after_staging(self, oban_instance):
+        async with oban_instance() as oban:
+            scheduled_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+            await Worker.enqueue({}, scheduled_at=scheduled_at)
+            await oban._stager._stage()
+
+            loop = asyncio.get_running_loop()
+            next_in = oban._stager._next_due - loop.time()
+
+            assert 28 < next_in <= 30
+
+    async def test_reporting_queues_with_staged_or_available_jobs(self, oban_instance):
+        async with oban_instance() as oban:
+            scheduled_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+            await oban.enqueue(Worker.new({}, queue="alpha"))
+            await oban.enqueue(Worker.new({}, queue="beta", scheduled_at=scheduled_at))
+
+            (staged, active, _next_in) = await oban._query.stage_jobs(
+                100, ["alpha", "beta", "gamma"]
+            )
+
+            assert staged == 1
+            assert sorted(active) == ["alpha", "beta"]
+
+    @pytest.mark.oban(queues={"default": 1}, stager={"interval": 0.1})
+    async def test_fetching_jobs_made_available_by_an_update(self, oban_instance):
+        async with oban_instance() as oban:
+            scheduled_at = datetime.now(timezone.utc) + timedelta(hours=1)
+            job = await Worker.enqueue({}, scheduled_at=scheduled_at)
+
+            # Updates don't notify, so only staging can wake the producer in time
+            await oban.update_job(job, {"scheduled_at": datetime.now(timezone.utc)})
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=2.0)
+
+    @pytest.mark.oban(leadership=True, stager={"interval": 0.01, "mode": "global"})
+    async def test_global_staging_is_broadcast_from_the_leader(self, oban_instance):
+        oban_1 = oban_instance(queues={"alpha": 1})
+        oban_2 = oban_instance(
+            queues={"beta": 1}, stager={"interval": 5.0, "mode": "global"}
+        )
+
+        await oban_1.start()
+        await oban_2.start()
+
+        try:
+            assert oban_1.is_leader and not oban_2.is_leader
+
+            await with_backoff(lambda: assert_receiving(oban_2))
+
+            scheduled_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            job = await oban_1.enqueue(
+                Worker.new({}, queue="beta", scheduled_at=scheduled_at)
+            )
+
+            async def assert_completed():
+                fetched = await oban_1.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=2.0)
+        finally:
+            await oban_2.stop()
+            await oban_1.stop()
+
+    @pytest.mark.oban(
+        queues={"default": 1}, stager={"interval": 0.01, "mode": "global"}
+    )
+    async def test_global_staging_falls_back_to_local_without_a_leader(
+        self, oban_instance
+    ):
+        async with oban_instance() as oban:
+            scheduled_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            job = await Worker.enqueue({}, scheduled_at=scheduled_at)
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=2.0)
+
+
+class TestShardedChannels:
+    def test_channel_is_stable_per_queue(self):
+        assert insert_channel("default", None) == "insert"
+        assert insert_channel("default", 8) == insert_channel("default", 8)
+        assert insert_channel("default", 1) == "insert_0"
+
+    @pytest.mark.oban(queues={"alpha": 1}, stager={"interval": 5.0, "shards": 8})
+    async def test_inserts_notify_on_the_queue_shard(self, oban_instance):
+        async with oban_instance() as oban:
+            job = await Worker.enqueue({}, queue="alpha")
+
+            async def assert_completed():
+                fetched = await oban.get_job(job.id)
+
+                assert fetched.state == "completed"
+
+            await with_backoff(assert_completed, timeout=2.0)
+
+    @pytest.mark.oban(queues={"alpha": 1}, stager={"interval": 5.0, "shards": 64})
+    async def test_listening_only_on_local_queue_shards(self, oban_instance):
+        async with oban_instance() as oban:
+
+            def channels():
+                return set(oban._stager._insert_tokens)
+
+            assert channels() == {insert_channel("alpha", 64)}
+
+            await oban.start_queue(queue="omega", limit=1)
+
+            assert channels() == {
+                insert_channel("alpha", 64),
+                insert_channel("omega", 64),
+            }
+
+            await oban.stop_queue(queue="alpha")
+
+            assert channels() == {insert_channel("omega", 64)}